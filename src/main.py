@@ -1,6 +1,7 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import logging
 import os
 import sys
 from pathlib import Path
@@ -24,26 +25,84 @@ from modules.diary_recommendations.infrastructure.routes.diary_recommendation_ro
 from modules.plan_reality_differences.infrastructure.routes.plan_reality_difference_routes import router as plan_reality_differences_router
 
 from shared.database.Connection import DatabaseConnection
+from shared.repositories.RepositoryFactory import RepositoryFactory
+from shared.repositories.LoaderFactory import LoaderFactory
 from shared.routes.UploadRoutes import router as upload_router
+from shared.events.event_bus import EventBus
+from shared.services.ServiceFactory import ServiceFactory
+from shared.services.Container import Container
 from shared.middleware.ErrorMiddleware import ErrorMiddleware
+from shared.utils.json_utils import FastJSONResponse
 
 # Load environment variables
 load_dotenv()
 
+# Log de peticiones (una línea JSON por petición desde ErrorMiddleware)
+request_logger = logging.getLogger("voyaj.requests")
+if not request_logger.handlers:
+    request_handler = logging.StreamHandler()
+    request_handler.setFormatter(logging.Formatter("%(message)s"))
+    request_logger.addHandler(request_handler)
+request_logger.setLevel(os.getenv("REQUEST_LOG_LEVEL", "INFO").upper())
+request_logger.propagate = False
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     print("[STARTUP] Iniciando Voyaj API...")
+    outbox_relay = None
     try:
         db = DatabaseConnection()
         await db.connect()
         print("[STARTUP] Conexión a MongoDB establecida")
+
+        RepositoryFactory.register_indexes()
+        index_report = await db.ensure_indexes()
+        for collection_name, result in index_report.items():
+            if result["created"]:
+                print(f"[STARTUP] Índices creados en {collection_name}: {', '.join(result['created'])}")
+            for drift in result["drift"]:
+                print(f"[WARNING] Drift de índice en {collection_name} -> {drift}")
+            if result["extra"]:
+                print(f"[WARNING] Índices no declarados en {collection_name}: {', '.join(result['extra'])}")
+        print("[STARTUP] Índices de MongoDB verificados")
+
+        # El outbox solo garantiza la entrega si se escribe en la misma
+        # transacción que el agregado: por defecto sigue a MONGODB_TRANSACTIONS
+        transactions_enabled = DatabaseConnection.transactions_enabled()
+        outbox_default = "true" if transactions_enabled else "false"
+        if os.getenv("EVENT_OUTBOX_ENABLED", outbox_default).lower() in ("1", "true", "yes"):
+            outbox_relay = ServiceFactory.get_outbox_relay()
+            outbox_relay.start()
+            print("[STARTUP] Relay del outbox de eventos iniciado")
+            if not transactions_enabled:
+                print(
+                    "[WARNING] Outbox de eventos activo sin MONGODB_TRANSACTIONS: el evento se "
+                    "guarda en una escritura aparte y puede perderse si el proceso cae entre ambas"
+                )
+
+        Container.warm_up()
+        print("[STARTUP] Controladores y casos de uso inicializados")
         yield
     except Exception as e:
         print(f"[ERROR] Error al inicializar: {e}")
         yield
     finally:
         # Shutdown
+        try:
+            if outbox_relay is not None:
+                await outbox_relay.stop()
+            await EventBus.get_instance().shutdown()
+            print("[SHUTDOWN] Cola de eventos drenada")
+        except Exception as e:
+            print(f"[ERROR] Error drenando eventos: {e}")
+
+        try:
+            ServiceFactory.shutdown()
+            print("[SHUTDOWN] Pools de subidas y hashing cerrados")
+        except Exception as e:
+            print(f"[ERROR] Error cerrando pools de servicios: {e}")
+
         try:
             db = DatabaseConnection()
             await db.disconnect()
@@ -58,6 +117,8 @@ app = FastAPI(
     contact={"name": "Voyaj Team", "email": "dev@voyaj.com"},
     license_info={"name": "MIT", "url": "https://opensource.org/licenses/MIT"},
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+    dependencies=[Depends(LoaderFactory.begin_request_scope)],
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json"
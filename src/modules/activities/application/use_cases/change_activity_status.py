@@ -7,6 +7,7 @@ from modules.trips.domain.interfaces.trip_member_repository import ITripMemberRe
 from modules.users.domain.interfaces.IUserRepository import IUserRepository
 from shared.events.event_bus import EventBus
 from shared.errors.custom_errors import NotFoundError, ForbiddenError
+from shared.database.Connection import DatabaseConnection
 
 
 class ChangeActivityStatusUseCase:
@@ -58,30 +59,32 @@ class ChangeActivityStatusUseCase:
             actual_cost=dto.actual_cost
         )
 
-        # Guardar cambios
-        updated_activity = await self._activity_repository.update(activity)
+        # Cambio del agregado y eventos (outbox) en una sola transacción
+        async with DatabaseConnection.transaction():
+            # Guardar cambios
+            updated_activity = await self._activity_repository.update(activity)
 
-        # Publicar eventos
-        status_event = ActivityStatusChangedEvent(
-            activity_id=activity_id,
-            day_id=activity.day_id,
-            trip_id=activity.trip_id,
-            changed_by=user_id,
-            old_status=old_status,
-            new_status=dto.status
-        )
-        await self._event_bus.publish(status_event)
-
-        # Evento específico para completado
-        if dto.status == "completed":
-            completed_event = ActivityCompletedEvent(
+            # Publicar eventos
+            status_event = ActivityStatusChangedEvent(
                 activity_id=activity_id,
                 day_id=activity.day_id,
                 trip_id=activity.trip_id,
-                completed_by=user_id,
-                actual_duration=activity.actual_duration,
-                actual_cost=activity.actual_cost
+                changed_by=user_id,
+                old_status=old_status,
+                new_status=dto.status
             )
-            await self._event_bus.publish(completed_event)
+            await self._event_bus.publish(status_event)
+
+            # Evento específico para completado
+            if dto.status == "completed":
+                completed_event = ActivityCompletedEvent(
+                    activity_id=activity_id,
+                    day_id=activity.day_id,
+                    trip_id=activity.trip_id,
+                    completed_by=user_id,
+                    actual_duration=activity.actual_duration,
+                    actual_cost=activity.actual_cost
+                )
+                await self._event_bus.publish(completed_event)
 
         return ActivityDTOMapper.to_activity_response(updated_activity.to_public_data())
\ No newline at end of file
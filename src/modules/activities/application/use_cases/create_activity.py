@@ -9,6 +9,7 @@ from modules.users.domain.interfaces.IUserRepository import IUserRepository
 from modules.days.domain.interfaces.day_repository import IDayRepository
 from shared.events.event_bus import EventBus
 from shared.errors.custom_errors import NotFoundError, ForbiddenError
+from shared.database.Connection import DatabaseConnection
 
 
 class CreateActivityUseCase:
@@ -82,18 +83,20 @@ class CreateActivityUseCase:
             order=next_order
         )
 
-        # Guardar en repositorio
-        created_activity = await self._activity_repository.create(activity)
+        # Cambio del agregado y eventos (outbox) en una sola transacción
+        async with DatabaseConnection.transaction():
+            # Guardar en repositorio
+            created_activity = await self._activity_repository.create(activity)
 
-        # Publicar evento
-        event = ActivityCreatedEvent(
-            activity_id=created_activity.id,
-            day_id=dto.day_id,
-            trip_id=day.trip_id,
-            created_by=user_id,
-            title=dto.title,
-            category=dto.category
-        )
-        await self._event_bus.publish(event)
+            # Publicar evento
+            event = ActivityCreatedEvent(
+                activity_id=created_activity.id,
+                day_id=dto.day_id,
+                trip_id=day.trip_id,
+                created_by=user_id,
+                title=dto.title,
+                category=dto.category
+            )
+            await self._event_bus.publish(event)
 
         return ActivityDTOMapper.to_activity_response(created_activity.to_public_data())
\ No newline at end of file
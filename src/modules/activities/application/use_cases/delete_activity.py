@@ -5,6 +5,7 @@ from ...domain.interfaces.activity_repository import IActivityRepository
 from modules.trips.domain.interfaces.trip_member_repository import ITripMemberRepository
 from shared.events.event_bus import EventBus
 from shared.errors.custom_errors import NotFoundError, ForbiddenError
+from shared.database.Connection import DatabaseConnection
 
 
 class DeleteActivityUseCase:
@@ -44,18 +45,20 @@ class DeleteActivityUseCase:
         # Validar eliminación
         await self._activity_service.validate_activity_deletion(activity, user_id)
 
-        # Eliminar actividad (soft delete)
-        success = await self._activity_repository.delete(activity_id)
-
-        if success:
-            # Publicar evento
-            event = ActivityDeletedEvent(
-                activity_id=activity_id,
-                day_id=activity.day_id,
-                trip_id=activity.trip_id,
-                deleted_by=user_id,
-                title=activity.title
-            )
-            await self._event_bus.publish(event)
+        # Cambio del agregado y eventos (outbox) en una sola transacción
+        async with DatabaseConnection.transaction():
+            # Eliminar actividad (soft delete)
+            success = await self._activity_repository.delete(activity_id)
+
+            if success:
+                # Publicar evento
+                event = ActivityDeletedEvent(
+                    activity_id=activity_id,
+                    day_id=activity.day_id,
+                    trip_id=activity.trip_id,
+                    deleted_by=user_id,
+                    title=activity.title
+                )
+                await self._event_bus.publish(event)
 
         return success
\ No newline at end of file
@@ -7,6 +7,7 @@ from modules.trips.domain.interfaces.trip_member_repository import ITripMemberRe
 from modules.days.domain.interfaces.day_repository import IDayRepository
 from shared.events.event_bus import EventBus
 from shared.errors.custom_errors import NotFoundError, ForbiddenError, ValidationError
+from shared.database.Connection import DatabaseConnection
 
 
 class ReorderActivitiesUseCase:
@@ -58,26 +59,28 @@ class ReorderActivitiesUseCase:
             if activity_id not in activity_map:
                 raise ValidationError(f"Actividad {activity_id} no encontrada en este día")
 
-        # Actualizar orden de cada actividad
-        updated_activities = []
-        for order_item in dto.activity_orders:
-            activity_id = order_item.get("activity_id")
-            new_order = order_item.get("order")
+        # Cambio del agregado y eventos (outbox) en una sola transacción
+        async with DatabaseConnection.transaction():
+            # Actualizar orden de cada actividad
+            updated_activities = []
+            for order_item in dto.activity_orders:
+                activity_id = order_item.get("activity_id")
+                new_order = order_item.get("order")
             
-            activity = activity_map[activity_id]
-            activity.update_order(new_order)
+                activity = activity_map[activity_id]
+                activity.update_order(new_order)
             
-            updated_activity = await self._activity_repository.update(activity)
-            updated_activities.append(updated_activity)
+                updated_activity = await self._activity_repository.update(activity)
+                updated_activities.append(updated_activity)
 
-        # Publicar evento
-        event = ActivitiesReorderedEvent(
-            day_id=day_id,
-            trip_id=day.trip_id,
-            reordered_by=user_id,
-            activity_orders=dto.activity_orders
-        )
-        await self._event_bus.publish(event)
+            # Publicar evento
+            event = ActivitiesReorderedEvent(
+                day_id=day_id,
+                trip_id=day.trip_id,
+                reordered_by=user_id,
+                activity_orders=dto.activity_orders
+            )
+            await self._event_bus.publish(event)
 
         # Obtener actividades actualizadas ordenadas
         reordered_activities = await self._activity_repository.find_by_day_id_ordered(day_id)
@@ -7,6 +7,7 @@ from modules.trips.domain.interfaces.trip_member_repository import ITripMemberRe
 from modules.users.domain.interfaces.IUserRepository import IUserRepository
 from shared.events.event_bus import EventBus
 from shared.errors.custom_errors import NotFoundError, ForbiddenError
+from shared.database.Connection import DatabaseConnection
 
 
 class UpdateActivityUseCase:
@@ -93,17 +94,19 @@ class UpdateActivityUseCase:
         # Actualizar actividad
         activity.update_details(**update_dict)
 
-        # Guardar cambios
-        updated_activity = await self._activity_repository.update(activity)
+        # Cambio del agregado y eventos (outbox) en una sola transacción
+        async with DatabaseConnection.transaction():
+            # Guardar cambios
+            updated_activity = await self._activity_repository.update(activity)
 
-        # Publicar evento
-        event = ActivityUpdatedEvent(
-            activity_id=activity_id,
-            day_id=activity.day_id,
-            trip_id=activity.trip_id,
-            updated_by=user_id,
-            updated_fields=list(update_dict.keys())
-        )
-        await self._event_bus.publish(event)
+            # Publicar evento
+            event = ActivityUpdatedEvent(
+                activity_id=activity_id,
+                day_id=activity.day_id,
+                trip_id=activity.trip_id,
+                updated_by=user_id,
+                updated_fields=list(update_dict.keys())
+            )
+            await self._event_bus.publish(event)
 
         return ActivityDTOMapper.to_activity_response(updated_activity.to_public_data())
\ No newline at end of file
@@ -2,15 +2,24 @@
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import IndexModel, ASCENDING
 from shared.database.Connection import DatabaseConnection
 from ...domain.activity import Activity
 from ...domain.interfaces.activity_repository import IActivityRepository
 
 
 class ActivityMongoRepository(IActivityRepository):
+    COLLECTION_NAME = "actividades"
+    INDEXES = [
+        IndexModel([("id", ASCENDING)], unique=True),
+        IndexModel([("day_id", ASCENDING), ("order", ASCENDING)]),
+        IndexModel([("trip_id", ASCENDING), ("day_id", ASCENDING), ("order", ASCENDING)]),
+        IndexModel([("created_by", ASCENDING)])
+    ]
+
     def __init__(self):
         self._db_connection = DatabaseConnection()
-        self._collection_name = "actividades"
+        self._collection_name = self.COLLECTION_NAME
 
     async def _get_collection(self) -> AsyncIOMotorCollection:
         """Obtener colección de actividades"""
@@ -22,7 +31,7 @@ class ActivityMongoRepository(IActivityRepository):
         """Crear nueva actividad"""
         collection = await self._get_collection()
         activity_data = activity.to_dict()
-        await collection.insert_one(activity_data)
+        await collection.insert_one(activity_data, session=DatabaseConnection.current_session())
         return activity
 
     async def find_by_id(self, activity_id: str) -> Optional[Activity]:
@@ -45,7 +54,8 @@ class ActivityMongoRepository(IActivityRepository):
         
         await collection.update_one(
             {"id": activity.id},
-            {"$set": activity_data}
+            {"$set": activity_data},
+            session=DatabaseConnection.current_session()
         )
         return activity
 
@@ -54,7 +64,8 @@ class ActivityMongoRepository(IActivityRepository):
         collection = await self._get_collection()
         result = await collection.update_one(
             {"id": activity_id},
-            {"$set": {"deleted_at": datetime.utcnow()}}
+            {"$set": {"deleted_at": datetime.utcnow()}},
+            session=DatabaseConnection.current_session()
         )
         return result.modified_count > 0
 
@@ -223,7 +234,8 @@ class ActivityMongoRepository(IActivityRepository):
         for order_item in activity_orders:
             await collection.update_one(
                 {"id": order_item["activity_id"], "day_id": day_id},
-                {"$set": {"order": order_item["order"], "updated_at": datetime.utcnow()}}
+                {"$set": {"order": order_item["order"], "updated_at": datetime.utcnow()}},
+                session=DatabaseConnection.current_session()
             )
         
         return True
\ No newline at end of file
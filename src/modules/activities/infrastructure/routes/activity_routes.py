@@ -17,10 +17,12 @@ from ...application.use_cases.update_activity import UpdateActivityUseCase
 from ...application.use_cases.change_activity_status import ChangeActivityStatusUseCase
 from ...application.use_cases.reorder_activities import ReorderActivitiesUseCase
 from ...application.use_cases.delete_activity import DeleteActivityUseCase
+from shared.services.Container import Container
+from shared.utils.json_utils import FastJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
-def get_activity_controller():
+def _build_activity_controller():
     """Factory para crear controlador de actividades con dependencias"""
     try:
         activity_repo = RepositoryFactory.get_activity_repository()
@@ -100,6 +102,8 @@ def get_activity_controller():
         print(f"[ERROR] Error creando activity controller: {str(e)}")
         raise Exception(f"Error inicializando controlador de actividades: {str(e)}")
 
+get_activity_controller = Container.provider("activity_controller", _build_activity_controller)
+
 # Rutas de actividades
 @router.post("/")
 async def create_activity(
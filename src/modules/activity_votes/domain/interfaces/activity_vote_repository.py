@@ -76,7 +76,9 @@ class IActivityVoteRepository(ABC):
         self, 
         filters: Dict[str, Any], 
         page: int = 1, 
-        limit: int = 20
-    ) -> tuple[List[ActivityVote], int]:
-        """Buscar votos con filtros y paginación"""
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        count_mode: str = "exact"
+    ) -> tuple[List[ActivityVote], Optional[int], bool]:
+        """Buscar votos con filtros y paginación (o cursor keyset)"""
         pass
\ No newline at end of file
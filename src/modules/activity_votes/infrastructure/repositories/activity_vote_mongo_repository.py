@@ -1,17 +1,36 @@
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from pymongo import ASCENDING, DESCENDING
+from pymongo import IndexModel, ASCENDING, DESCENDING
 
 from ...domain.activity_vote import ActivityVote
 from ...domain.interfaces.activity_vote_repository import IActivityVoteRepository
 from shared.database.Connection import DatabaseConnection
+from shared.utils.pagination_utils import PaginationUtils
 
 
 class ActivityVoteMongoRepository(IActivityVoteRepository):
+    COLLECTION_NAME = "activity_votes"
+    INDEXES = [
+        IndexModel([("id", ASCENDING)], unique=True),
+        IndexModel(
+            [("activity_id", ASCENDING), ("user_id", ASCENDING)],
+            unique=True,
+            partialFilterExpression={"is_deleted": False}
+        ),
+        IndexModel(
+            [("trip_id", ASCENDING), ("created_at", DESCENDING), ("id", DESCENDING)],
+            partialFilterExpression={"is_deleted": False}
+        ),
+        IndexModel(
+            [("user_id", ASCENDING), ("created_at", DESCENDING), ("id", DESCENDING)],
+            partialFilterExpression={"is_deleted": False}
+        )
+    ]
+
     def __init__(self, db: AsyncIOMotorDatabase = None):
         self._db = db or DatabaseConnection.get_database()
-        self._collection = self._db.activity_votes
+        self._collection = self._db[self.COLLECTION_NAME]
 
     async def create(self, vote: ActivityVote) -> ActivityVote:
         """Crear nuevo voto"""
@@ -218,18 +237,28 @@ class ActivityVoteMongoRepository(IActivityVoteRepository):
         self, 
         filters: Dict[str, Any], 
         page: int = 1, 
-        limit: int = 20
-    ) -> tuple[List[ActivityVote], int]:
-        """Buscar votos con filtros y paginación"""
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        count_mode: str = PaginationUtils.COUNT_EXACT
+    ) -> tuple[List[ActivityVote], Optional[int], bool]:
+        """Buscar votos con filtros y paginación (por página o por cursor keyset)"""
         query = {"is_deleted": False}
         query.update(filters)
         
-        skip = (page - 1) * limit
-        
-        cursor = self._collection.find(query).skip(skip).limit(limit).sort("created_at", DESCENDING)
+        sort = [("created_at", DESCENDING), ("id", DESCENDING)]
+        keyset = PaginationUtils.build_keyset_filter("created_at", -1, cursor, tiebreaker="id")
+
+        # Se pide limit+1 para saber si hay página siguiente sin contar
+        if keyset:
+            cursor = self._collection.find({"$and": [query, keyset]}).sort(sort).limit(limit + 1)
+        else:
+            skip = (page - 1) * limit
+            cursor = self._collection.find(query).sort(sort).skip(skip).limit(limit + 1)
+
         votes = []
         async for data in cursor:
             votes.append(ActivityVote.from_dict(data))
+        votes, has_next = PaginationUtils.split_page(votes, limit)
         
-        total = await self._collection.count_documents(query)
-        return votes, total
\ No newline at end of file
+        total = await PaginationUtils.count_documents(self._collection, query, count_mode)
+        return votes, total, has_next
\ No newline at end of file
@@ -13,10 +13,12 @@ from ...application.use_cases.delete_activity_vote import DeleteActivityVoteUseC
 from ...application.use_cases.get_trip_rankings import GetTripRankingsUseCase
 from ...application.use_cases.get_trip_polls import GetTripPollsUseCase
 from ...domain.activity_vote_service import ActivityVoteService
+from shared.services.Container import Container
+from shared.utils.json_utils import FastJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
-def get_activity_vote_controller():
+def _build_activity_vote_controller():
     activity_vote_repo = RepositoryFactory.get_activity_vote_repository()
     activity_repo = RepositoryFactory.get_activity_repository()
     trip_member_repo = RepositoryFactory.get_trip_member_repository()
@@ -63,6 +65,8 @@ def get_activity_vote_controller():
         get_trip_polls_use_case=get_trip_polls_use_case
     )
 
+get_activity_vote_controller = Container.provider("activity_vote_controller", _build_activity_vote_controller)
+
 @router.post("/{activity_id}/vote")
 async def vote_activity(
     activity_id: str = Path(...),
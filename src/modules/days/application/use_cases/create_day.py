@@ -6,6 +6,7 @@ from ...domain.day_events import DayCreatedEvent
 from ...domain.interfaces.day_repository import IDayRepository
 from modules.trips.domain.interfaces.trip_member_repository import ITripMemberRepository
 from shared.events.event_bus import EventBus
+from shared.database.Connection import DatabaseConnection
 
 
 class CreateDayUseCase:
@@ -35,16 +36,18 @@ class CreateDayUseCase:
             notes=dto.notes
         )
 
-        created_day = await self._day_repository.create(day)
-
-        # ✅ Crear evento con argumentos nombrados
-        event = DayCreatedEvent(
-            trip_id=dto.trip_id,
-            day_id=created_day.id,
-            date=dto.date,
-            created_by=user_id
-        )
-        await self._event_bus.publish(event)
+        # Cambio del agregado y eventos (outbox) en una sola transacción
+        async with DatabaseConnection.transaction():
+            created_day = await self._day_repository.create(day)
+
+            # ✅ Crear evento con argumentos nombrados
+            event = DayCreatedEvent(
+                trip_id=dto.trip_id,
+                day_id=created_day.id,
+                date=dto.date,
+                created_by=user_id
+            )
+            await self._event_bus.publish(event)
 
         member = await self._trip_member_repository.find_by_trip_and_user(dto.trip_id, user_id)
         can_edit = member.can_edit_trip() if member else False
@@ -4,6 +4,7 @@ from ...domain.day_events import DayDeletedEvent
 from ...domain.interfaces.day_repository import IDayRepository
 from shared.events.event_bus import EventBus
 from shared.errors.custom_errors import NotFoundError
+from shared.database.Connection import DatabaseConnection
 
 
 class DeleteDayUseCase:
@@ -26,14 +27,16 @@ class DeleteDayUseCase:
         await self._day_service.validate_day_deletion(day, user_id)
 
         day.soft_delete()
-        await self._day_repository.update(day)
+        # Cambio del agregado y eventos (outbox) en una sola transacción
+        async with DatabaseConnection.transaction():
+            await self._day_repository.update(day)
 
-        # ✅ Crear evento con argumentos nombrados
-        event = DayDeletedEvent(
-            trip_id=day.trip_id,
-            day_id=day_id,
-            deleted_by=user_id
-        )
-        await self._event_bus.publish(event)
+            # ✅ Crear evento con argumentos nombrados
+            event = DayDeletedEvent(
+                trip_id=day.trip_id,
+                day_id=day_id,
+                deleted_by=user_id
+            )
+            await self._event_bus.publish(event)
 
         return True
\ No newline at end of file
@@ -8,6 +8,7 @@ from ...domain.day_events import BulkDaysCreatedEvent
 from ...domain.interfaces.day_repository import IDayRepository
 from modules.trips.domain.interfaces.trip_member_repository import ITripMemberRepository
 from shared.events.event_bus import EventBus
+from shared.database.Connection import DatabaseConnection
 
 
 class GenerateTripDaysUseCase:
@@ -26,8 +27,21 @@ class GenerateTripDaysUseCase:
     async def execute(self, dto: GenerateTripDaysDTO, user_id: str) -> BulkCreateDaysResponseDTO:
         """Generar automáticamente todos los días de un viaje"""
         try:
-            # Generar días usando el service
-            created_days = await self._day_service.generate_days_for_trip(dto.trip_id, user_id)
+            # Cambio del agregado y eventos (outbox) en una sola transacción
+            async with DatabaseConnection.transaction():
+                # Generar días usando el service
+                created_days = await self._day_service.generate_days_for_trip(dto.trip_id, user_id)
+
+                # Emitir evento si se crearon días
+                if created_days:
+                    # ✅ Crear evento con argumentos nombrados
+                    event = BulkDaysCreatedEvent(
+                        trip_id=dto.trip_id,
+                        day_ids=[day.id for day in created_days],
+                        created_by=user_id,
+                        total_created=len(created_days)
+                    )
+                    await self._event_bus.publish(event)
             
             # Convertir a DTOs de respuesta
             day_responses = []
@@ -43,17 +57,6 @@ class GenerateTripDaysUseCase:
                 )
                 day_responses.append(day_response)
 
-            # Emitir evento si se crearon días
-            if created_days:
-                # ✅ Crear evento con argumentos nombrados
-                event = BulkDaysCreatedEvent(
-                    trip_id=dto.trip_id,
-                    day_ids=[day.id for day in created_days],
-                    created_by=user_id,
-                    total_created=len(created_days)
-                )
-                await self._event_bus.publish(event)
-
             return BulkCreateDaysResponseDTO(
                 created_days=day_responses,
                 total_created=len(created_days),
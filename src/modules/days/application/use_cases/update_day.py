@@ -6,6 +6,7 @@ from ...domain.interfaces.day_repository import IDayRepository
 from modules.trips.domain.interfaces.trip_member_repository import ITripMemberRepository
 from shared.events.event_bus import EventBus
 from shared.errors.custom_errors import NotFoundError
+from shared.database.Connection import DatabaseConnection
 
 
 class UpdateDayUseCase:
@@ -41,26 +42,28 @@ class UpdateDayUseCase:
             day.update_notes(dto.notes)
             updated_fields.append("notes")
 
-        updated_day = await self._day_repository.update(day)
+        # Cambio del agregado y eventos (outbox) en una sola transacción
+        async with DatabaseConnection.transaction():
+            updated_day = await self._day_repository.update(day)
 
-        if updated_fields:
-            # ✅ Crear evento con argumentos nombrados
-            event = DayUpdatedEvent(
-                trip_id=day.trip_id,
-                day_id=day_id,
-                updated_by=user_id,
-                updated_fields=updated_fields
-            )
-            await self._event_bus.publish(event)
-
-            if "notes" in updated_fields and old_notes != dto.notes:
+            if updated_fields:
                 # ✅ Crear evento con argumentos nombrados
-                notes_event = DayNotesUpdatedEvent(
+                event = DayUpdatedEvent(
                     trip_id=day.trip_id,
                     day_id=day_id,
-                    updated_by=user_id
+                    updated_by=user_id,
+                    updated_fields=updated_fields
                 )
-                await self._event_bus.publish(notes_event)
+                await self._event_bus.publish(event)
+
+                if "notes" in updated_fields and old_notes != dto.notes:
+                    # ✅ Crear evento con argumentos nombrados
+                    notes_event = DayNotesUpdatedEvent(
+                        trip_id=day.trip_id,
+                        day_id=day_id,
+                        updated_by=user_id
+                    )
+                    await self._event_bus.publish(notes_event)
 
         member = await self._trip_member_repository.find_by_trip_and_user(day.trip_id, user_id)
         can_edit = member.can_edit_trip() if member else False
@@ -82,6 +82,19 @@ class BulkDaysCreatedEvent(DomainEvent):
         if self.day_ids is None:
             self.day_ids = []
 
+    @classmethod
+    def merge_coalesced(cls, events: List['BulkDaysCreatedEvent']) -> 'BulkDaysCreatedEvent':
+        """Unir una ráfaga de creaciones en lote del mismo viaje"""
+        day_ids = list(dict.fromkeys(day_id for event in events for day_id in event.day_ids or []))
+        last = events[-1]
+        return cls(
+            user_id=last.user_id,
+            trip_id=last.trip_id,
+            created_by=last.created_by,
+            total_created=len(day_ids),
+            day_ids=day_ids
+        )
+
 
 @dataclass
 class TripDaysGeneratedEvent(DomainEvent):
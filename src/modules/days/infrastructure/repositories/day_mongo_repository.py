@@ -2,6 +2,7 @@
 from typing import List, Optional, Dict, Any
 from datetime import date, datetime
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import IndexModel, ASCENDING
 from bson import ObjectId
 
 from ...domain.Day import Day, DayData
@@ -10,9 +11,14 @@ from shared.database.Connection import DatabaseConnection
 
 
 class DayMongoRepository(IDayRepository):
+    COLLECTION_NAME = "days"
+    INDEXES = [
+        IndexModel([("trip_id", ASCENDING), ("date", ASCENDING)])
+    ]
+
     def __init__(self, db: AsyncIOMotorDatabase = None):
         self._db = db or DatabaseConnection.get_database()
-        self._collection = self._db.days
+        self._collection = self._db[self.COLLECTION_NAME]
 
     async def create(self, day: Day) -> Day:
         """Crear nuevo día"""
@@ -21,7 +27,7 @@ class DayMongoRepository(IDayRepository):
             document = self._day_to_document(day_data)
             
             # ✅ CORREGIDO: No generar ObjectId, usar el ID string del dominio
-            await self._collection.insert_one(document)
+            await self._collection.insert_one(document, session=DatabaseConnection.current_session())
             return day
             
         except Exception as e:
@@ -52,7 +58,8 @@ class DayMongoRepository(IDayRepository):
             # ✅ CORREGIDO: Usar string ID, no ObjectId
             await self._collection.update_one(
                 {"_id": day.id},
-                {"$set": day_data}
+                {"$set": day_data},
+                session=DatabaseConnection.current_session()
             )
             
             return day
@@ -66,7 +73,8 @@ class DayMongoRepository(IDayRepository):
         try:
             result = await self._collection.update_one(
                 {"_id": day_id},  # ✅ CORREGIDO: string ID
-                {"$set": {"is_deleted": True, "updated_at": datetime.utcnow()}}
+                {"$set": {"is_deleted": True, "updated_at": datetime.utcnow()}},
+                session=DatabaseConnection.current_session()
             )
             
             return result.modified_count > 0
@@ -236,7 +244,8 @@ class DayMongoRepository(IDayRepository):
         try:
             result = await self._collection.update_many(
                 {"trip_id": trip_id},
-                {"$set": {"is_deleted": True, "updated_at": datetime.utcnow()}}
+                {"$set": {"is_deleted": True, "updated_at": datetime.utcnow()}},
+                session=DatabaseConnection.current_session()
             )
             
             return result.modified_count > 0
@@ -256,7 +265,7 @@ class DayMongoRepository(IDayRepository):
                 # ✅ CORREGIDO: No generar ObjectId, usar el ID del dominio
                 documents.append(doc)
             
-            await self._collection.insert_many(documents)
+            await self._collection.insert_many(documents, session=DatabaseConnection.current_session())
             return days  # ✅ CORREGIDO: Retornar los días originales
             
         except Exception as e:
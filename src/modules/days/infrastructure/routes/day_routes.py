@@ -13,10 +13,12 @@ from ...application.use_cases.update_day import UpdateDayUseCase
 from ...application.use_cases.delete_day import DeleteDayUseCase
 from ...application.use_cases.generate_trip_days import GenerateTripDaysUseCase
 from ...domain.day_service import DayService
+from shared.services.Container import Container
+from shared.utils.json_utils import FastJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
-def get_day_controller():
+def _build_day_controller():
     """Factory para crear controlador de days con dependencias"""
     try:
         day_repo = RepositoryFactory.get_day_repository()
@@ -50,6 +52,8 @@ def get_day_controller():
         print(f"[ERROR] Error creando day controller: {str(e)}")
         raise Exception(f"Error inicializando controlador de días: {str(e)}")
 
+get_day_controller = Container.provider("day_controller", _build_day_controller)
+
 @router.post("/")
 async def create_day(
     dto: CreateDayDTO,
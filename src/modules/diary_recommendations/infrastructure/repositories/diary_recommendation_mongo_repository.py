@@ -1,6 +1,7 @@
 # src/modules/diary_recommendations/infrastructure/repositories/diary_recommendation_mongo_repository.py
 from typing import List, Optional, Dict, Any
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import IndexModel, ASCENDING
 from bson import ObjectId
 from ...domain.diary_recommendation import DiaryRecommendation, DiaryRecommendationData, RecommendationType
 from ...domain.interfaces.diary_recommendation_repository_interface import DiaryRecommendationRepositoryInterface
@@ -9,9 +10,14 @@ from shared.errors.custom_errors import DatabaseError
 
 
 class DiaryRecommendationMongoRepository(DiaryRecommendationRepositoryInterface):
+    COLLECTION_NAME = "diary_recommendations"
+    INDEXES = [
+        IndexModel([("diary_entry_id", ASCENDING), ("is_deleted", ASCENDING)])
+    ]
+
     def __init__(self):
         self._db_connection = DatabaseConnection()
-        self._collection_name = "diary_recommendations"
+        self._collection_name = self.COLLECTION_NAME
 
     async def _get_collection(self) -> AsyncIOMotorCollection:
         """Obtener colección de recomendaciones de diario"""
@@ -13,10 +13,12 @@ from ...application.use_cases.get_diary_entry_recommendations import GetDiaryEnt
 from ...application.use_cases.update_diary_recommendation import UpdateDiaryRecommendationUseCase
 from ...application.use_cases.delete_diary_recommendation import DeleteDiaryRecommendationUseCase
 from ...domain.diary_recommendation_service import DiaryRecommendationService
+from shared.services.Container import Container
+from shared.utils.json_utils import FastJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
-def get_recommendation_controller():
+def _build_recommendation_controller():
     recommendation_repo = RepositoryFactory.get_diary_recommendation_repository()
     diary_entry_repo = RepositoryFactory.get_diary_entry_repository()
     
@@ -53,6 +55,8 @@ def get_recommendation_controller():
         delete_recommendation_use_case=delete_recommendation_use_case
     )
 
+get_recommendation_controller = Container.provider("recommendation_controller", _build_recommendation_controller)
+
 @router.post("/", summary="Crear recomendación")
 async def create_recommendation(
     dto: CreateDiaryRecommendationDTO,
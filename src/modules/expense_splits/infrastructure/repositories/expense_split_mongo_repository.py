@@ -1,6 +1,7 @@
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import IndexModel, ASCENDING
 from bson import ObjectId
 from decimal import Decimal
 from ...domain.expense_split import ExpenseSplit, ExpenseSplitData, ExpenseSplitStatus
@@ -10,9 +11,21 @@ from shared.errors.custom_errors import DatabaseError
 
 
 class ExpenseSplitMongoRepository(ExpenseSplitRepositoryInterface):
+    COLLECTION_NAME = "expense_splits"
+    INDEXES = [
+        IndexModel(
+            [("expense_id", ASCENDING), ("user_id", ASCENDING)],
+            partialFilterExpression={"is_deleted": False}
+        ),
+        IndexModel(
+            [("user_id", ASCENDING), ("status", ASCENDING)],
+            partialFilterExpression={"is_deleted": False}
+        )
+    ]
+
     def __init__(self):
         self._db_connection = DatabaseConnection()
-        self._collection_name = "expense_splits"
+        self._collection_name = self.COLLECTION_NAME
 
     async def _get_collection(self) -> AsyncIOMotorCollection:
         """Obtener colección de divisiones de gastos"""
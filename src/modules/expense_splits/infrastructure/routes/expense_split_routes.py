@@ -10,10 +10,12 @@ from ...application.use_cases.update_expense_splits import UpdateExpenseSplitsUs
 from ...application.use_cases.mark_split_as_paid import MarkSplitAsPendingUseCase
 from ...application.use_cases.change_split_status import ChangeSplitStatusUseCase
 from ...application.use_cases.get_trip_balances import GetTripBalancesUseCase
+from shared.services.Container import Container
+from shared.utils.json_utils import FastJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
-def get_expense_split_controller():
+def _build_expense_split_controller():
     expense_split_repo = RepositoryFactory.get_expense_split_repository()
     expense_split_service = ServiceFactory.get_expense_split_service()
     
@@ -49,6 +51,8 @@ def get_expense_split_controller():
         get_trip_balances_use_case=get_trip_balances_use_case
     )
 
+get_expense_split_controller = Container.provider("expense_split_controller", _build_expense_split_controller)
+
 @router.get("/expenses/{expense_id}/splits")
 async def get_expense_splits(
     expense_id: str = Path(...),
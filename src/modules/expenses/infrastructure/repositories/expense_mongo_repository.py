@@ -1,6 +1,7 @@
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import IndexModel, ASCENDING, DESCENDING
 from bson import ObjectId
 from ...domain.expense import Expense, ExpenseData, ExpenseCategory, ExpenseStatus
 from ...domain.interfaces.expense_repository_interface import ExpenseRepositoryInterface
@@ -9,9 +10,17 @@ from shared.errors.custom_errors import DatabaseError
 
 
 class ExpenseMongoRepository(ExpenseRepositoryInterface):
+    COLLECTION_NAME = "expenses"
+    INDEXES = [
+        IndexModel([("trip_id", ASCENDING), ("expense_date", DESCENDING)]),
+        IndexModel([("trip_id", ASCENDING), ("user_id", ASCENDING)]),
+        IndexModel([("trip_id", ASCENDING), ("paid_by_user_id", ASCENDING)]),
+        IndexModel([("activity_id", ASCENDING)], sparse=True)
+    ]
+
     def __init__(self):
         self._db_connection = DatabaseConnection()
-        self._collection_name = "expenses"
+        self._collection_name = self.COLLECTION_NAME
 
     async def _get_collection(self) -> AsyncIOMotorCollection:
         """Obtener colección de gastos"""
@@ -13,10 +13,12 @@ from ...application.use_cases.change_expense_status import ChangeExpenseStatusUs
 from ...application.use_cases.delete_expense import DeleteExpenseUseCase
 from ...application.use_cases.get_expense_summary import GetExpenseSummaryUseCase
 from ...domain.expense_service import ExpenseService
+from shared.services.Container import Container
+from shared.utils.json_utils import FastJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
-def get_expense_controller():
+def _build_expense_controller():
     expense_repo = RepositoryFactory.get_expense_repository()
     trip_member_repo = RepositoryFactory.get_trip_member_repository()
     user_repo = RepositoryFactory.get_user_repository()
@@ -77,6 +79,8 @@ def get_expense_controller():
         get_expense_summary_use_case=get_expense_summary_use_case
     )
 
+get_expense_controller = Container.provider("expense_controller", _build_expense_controller)
+
 @router.post("/")
 async def create_expense(
     dto: CreateExpenseDTO,
@@ -39,6 +39,11 @@ class GetFriendRequestsUseCase:
                 total_pages=0
             )
 
+        # Amigos en común con todos los remitentes en una sola consulta
+        mutual_counts = await self._friendship_service.get_mutual_friends_counts(
+            user_id, [friendship.user_id for friendship in friendships]
+        )
+
         # Obtener información de los remitentes
         request_responses: List[FriendRequestResponseDTO] = []
         
@@ -48,11 +53,7 @@ class GetFriendRequestsUseCase:
             if not requester_user:
                 continue
 
-            # Obtener cantidad de amigos en común
-            mutual_friends_count = await self._friendship_service.get_mutual_friends_count(
-                user_id, 
-                friendship.user_id
-            )
+            mutual_friends_count = mutual_counts.get(friendship.user_id, 0)
 
             # Mapear a DTO de respuesta
             request_response = FriendshipDTOMapper.to_friend_request_response(
@@ -94,6 +95,11 @@ class GetFriendRequestsUseCase:
                 total_pages=0
             )
 
+        # Amigos en común con todos los destinatarios en una sola consulta
+        mutual_counts = await self._friendship_service.get_mutual_friends_counts(
+            user_id, [friendship.friend_id for friendship in friendships]
+        )
+
         # Obtener información de los destinatarios
         request_responses: List[FriendRequestResponseDTO] = []
         
@@ -103,11 +109,7 @@ class GetFriendRequestsUseCase:
             if not recipient_user:
                 continue
 
-            # Obtener cantidad de amigos en común
-            mutual_friends_count = await self._friendship_service.get_mutual_friends_count(
-                user_id, 
-                friendship.friend_id
-            )
+            mutual_friends_count = mutual_counts.get(friendship.friend_id, 0)
 
             # Mapear a DTO de respuesta usando requester_info para mantener consistencia
             request_response = FriendRequestResponseDTO(
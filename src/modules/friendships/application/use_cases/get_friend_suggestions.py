@@ -4,6 +4,7 @@ from ..dtos.friendship_dto import FriendSuggestionDTO, FriendshipDTOMapper
 from ...domain.friendship_service import FriendshipService
 from ...domain.interfaces.IFriendshipRepository import IFriendshipRepository
 from modules.users.domain.interfaces.IUserRepository import IUserRepository
+from shared.repositories.DataLoader import DataLoader
 
 
 class GetFriendSuggestionsUseCase:
@@ -11,44 +12,44 @@ class GetFriendSuggestionsUseCase:
         self,
         friendship_repository: IFriendshipRepository,
         user_repository: IUserRepository,
-        friendship_service: FriendshipService
+        friendship_service: FriendshipService,
+        user_loader: DataLoader
     ):
         self._friendship_repository = friendship_repository
         self._user_repository = user_repository
         self._friendship_service = friendship_service
+        self._user_loader = user_loader
 
     async def execute(self, user_id: str, limit: int = 10) -> List[FriendSuggestionDTO]:
-        """Obtener sugerencias de amigos simplificadas"""
-        # Obtener IDs de usuarios sugeridos
-        suggested_user_ids = await self._friendship_service.suggest_friends(user_id, limit)
+        """Obtener sugerencias de amigos ya puntuadas y ordenadas"""
+        ranked = await self._friendship_service.suggest_friends(user_id, limit)
         
-        if not suggested_user_ids:
+        if not ranked:
             return []
 
-        # Obtener información de usuarios sugeridos
+        # Obtener información de usuarios sugeridos en un solo lote
+        suggested_users = await self._user_loader.load_many([item["user_id"] for item in ranked])
+
         suggestions: List[FriendSuggestionDTO] = []
         
-        for suggested_id in suggested_user_ids:
-            # Obtener información del usuario sugerido
-            suggested_user = await self._user_repository.find_by_id(suggested_id)
+        for item, suggested_user in zip(ranked, suggested_users):
             if not suggested_user:
                 continue
 
-            # Calcular amigos en común (simplificado)
-            mutual_friends_count = await self._friendship_service.get_mutual_friends_count(
-                user_id, 
-                suggested_id
-            )
-
-            # Crear sugerencia
             suggestion = FriendshipDTOMapper.to_friend_suggestion(
                 suggested_user.to_public_dict(),
-                mutual_friends_count,
-                f"{mutual_friends_count} amigo(s) en común" if mutual_friends_count > 0 else "Usuario recomendado"
+                item["mutual_friends"],
+                self._connection_reason(item["mutual_friends"], item["shared_trips"])
             )
             suggestions.append(suggestion)
-
-        # Ordenar por cantidad de amigos en común (descendente)
-        suggestions.sort(key=lambda x: x.mutual_friends_count, reverse=True)
         
-        return suggestions[:limit]
\ No newline at end of file
+        return suggestions
+
+    @staticmethod
+    def _connection_reason(mutual_friends: int, shared_trips: int) -> str:
+        reasons = []
+        if mutual_friends > 0:
+            reasons.append(f"{mutual_friends} amigo(s) en común")
+        if shared_trips > 0:
+            reasons.append(f"{shared_trips} viaje(s) compartido(s)")
+        return " y ".join(reasons) if reasons else "Usuario recomendado"
@@ -1,10 +1,11 @@
 # src/modules/friendships/application/use_cases/get_friends.py
-from typing import List
+from typing import List, Optional
 from ..dtos.friendship_dto import FriendListResponseDTO, FriendshipDTOMapper
 from ...domain.friendship_service import FriendshipService
 from ...domain.interfaces.IFriendshipRepository import IFriendshipRepository
 from modules.users.domain.interfaces.IUserRepository import IUserRepository
-from shared.utils.pagination_utils import PaginatedResponse
+from shared.utils.pagination_utils import PaginatedResponse, PaginationUtils
+from shared.repositories.DataLoader import DataLoader
 
 
 class GetFriendsUseCase:
@@ -12,48 +13,60 @@ class GetFriendsUseCase:
         self,
         friendship_repository: IFriendshipRepository,
         user_repository: IUserRepository,
-        friendship_service: FriendshipService
+        friendship_service: FriendshipService,
+        user_loader: DataLoader
     ):
         self._friendship_repository = friendship_repository
         self._user_repository = user_repository
         self._friendship_service = friendship_service
+        self._user_loader = user_loader
 
     async def execute(
         self, 
         user_id: str, 
         page: int = 1, 
-        limit: int = 20
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        count_mode: str = PaginationUtils.COUNT_EXACT
     ) -> PaginatedResponse[FriendListResponseDTO]:
         """Obtener lista de amigos de un usuario"""
-        # Obtener amistades aceptadas con paginación
-        friendships, total = await self._friendship_repository.find_user_friends(user_id, page, limit)
+        count_mode = PaginationUtils.validate_count_mode(count_mode)
+
+        # Obtener amistades aceptadas con paginación (o desde el cursor)
+        friendships, total, has_next = await self._friendship_repository.find_user_friends(
+            user_id, page, limit, cursor, count_mode
+        )
 
         if not friendships:
             return PaginatedResponse(
                 data=[],
-                total=0,
+                total=total,
                 page=page,
                 limit=limit,
-                total_pages=0
+                total_pages=0,
+                has_next=False,
+                cursor=cursor
             )
 
-        # Obtener información de los amigos
+        # Determinar qué usuario es el amigo en cada amistad
+        friend_ids = [
+            friendship.friend_id if friendship.user_id == user_id else friendship.user_id
+            for friendship in friendships
+        ]
+
+        # Obtener información de todos los amigos en un solo lote
+        friend_users = await self._user_loader.load_many(friend_ids)
+
+        # Amigos en común para toda la página en una sola consulta
+        mutual_counts = await self._friendship_service.get_mutual_friends_counts(user_id, friend_ids)
+
         friend_responses: List[FriendListResponseDTO] = []
         
-        for friendship in friendships:
-            # Determinar qué usuario es el amigo
-            friend_id = friendship.friend_id if friendship.user_id == user_id else friendship.user_id
-            
-            # Obtener información del amigo
-            friend_user = await self._user_repository.find_by_id(friend_id)
+        for friendship, friend_id, friend_user in zip(friendships, friend_ids, friend_users):
             if not friend_user:
                 continue
 
-            # Obtener cantidad de amigos en común
-            mutual_friends_count = await self._friendship_service.get_mutual_friends_count(
-                user_id, 
-                friend_id
-            )
+            mutual_friends_count = mutual_counts.get(friend_id, 0)
 
             # Mapear a DTO de respuesta
             friend_response = FriendshipDTOMapper.to_friend_list_response(
@@ -64,12 +77,13 @@ class GetFriendsUseCase:
             
             friend_responses.append(friend_response)
 
-        total_pages = (total + limit - 1) // limit
-
         return PaginatedResponse(
             data=friend_responses,
             total=total,
             page=page,
             limit=limit,
-            total_pages=total_pages
+            total_pages=0,
+            has_next=has_next,
+            cursor=cursor,
+            next_cursor=PaginationUtils.build_next_cursor(friendships, "accepted_at", has_next)
         )
\ No newline at end of file
@@ -1,9 +1,11 @@
 # src/modules/friendships/application/use_cases/reject_friend_request.py
 from ..dtos.friendship_dto import FriendshipResponseDTO, FriendshipDTOMapper
 from ...domain.friendship_service import FriendshipService
+from ...domain.friendship_events import FriendRequestRejectedEvent
 from ...domain.interfaces.IFriendshipRepository import IFriendshipRepository
 from modules.users.domain.interfaces.IUserRepository import IUserRepository
 from shared.errors.custom_errors import NotFoundError
+from shared.events.event_bus import EventBus
 
 
 class RejectFriendRequestUseCase:
@@ -11,11 +13,13 @@ class RejectFriendRequestUseCase:
         self,
         friendship_repository: IFriendshipRepository,
         user_repository: IUserRepository,
-        friendship_service: FriendshipService
+        friendship_service: FriendshipService,
+        event_bus: EventBus
     ):
         self._friendship_repository = friendship_repository
         self._user_repository = user_repository
         self._friendship_service = friendship_service
+        self._event_bus = event_bus
 
     async def execute(self, friendship_id: str, user_id: str) -> FriendshipResponseDTO:
         """Rechazar solicitud de amistad"""
@@ -33,6 +37,12 @@ class RejectFriendRequestUseCase:
         # Guardar cambios
         updated_friendship = await self._friendship_repository.update(friendship)
 
+        await self._event_bus.publish(FriendRequestRejectedEvent(
+            friendship_id=friendship.id,
+            user_id=friendship.user_id,
+            friend_id=friendship.friend_id
+        ))
+
         # Obtener información de ambos usuarios para la respuesta
         requester_user = await self._user_repository.find_by_id(friendship.user_id)
         recipient_user = await self._user_repository.find_by_id(friendship.friend_id)
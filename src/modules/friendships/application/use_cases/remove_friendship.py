@@ -1,17 +1,21 @@
 # src/modules/friendships/application/use_cases/remove_friendship.py
 from ...domain.friendship_service import FriendshipService
+from ...domain.friendship_events import FriendshipRemovedEvent
 from ...domain.interfaces.IFriendshipRepository import IFriendshipRepository
 from shared.errors.custom_errors import NotFoundError
+from shared.events.event_bus import EventBus
 
 
 class RemoveFriendshipUseCase:
     def __init__(
         self,
         friendship_repository: IFriendshipRepository,
-        friendship_service: FriendshipService
+        friendship_service: FriendshipService,
+        event_bus: EventBus
     ):
         self._friendship_repository = friendship_repository
         self._friendship_service = friendship_service
+        self._event_bus = event_bus
 
     async def execute(self, friendship_id: str, user_id: str) -> bool:
         """Eliminar amistad existente"""
@@ -31,4 +35,11 @@ class RemoveFriendshipUseCase:
         friendship.remove()
         await self._friendship_repository.update(friendship)
 
+        await self._event_bus.publish(FriendshipRemovedEvent(
+            friendship_id=friendship.id,
+            user_id=friendship.user_id,
+            friend_id=friendship.friend_id,
+            removed_by=user_id
+        ))
+
         return True
\ No newline at end of file
@@ -2,9 +2,11 @@
 from ..dtos.friendship_dto import SendFriendRequestDTO, FriendshipResponseDTO, FriendshipDTOMapper
 from ...domain.Friendship import Friendship
 from ...domain.friendship_service import FriendshipService
+from ...domain.friendship_events import FriendRequestSentEvent
 from ...domain.interfaces.IFriendshipRepository import IFriendshipRepository
 from modules.users.domain.interfaces.IUserRepository import IUserRepository
 from shared.errors.custom_errors import NotFoundError
+from shared.events.event_bus import EventBus
 
 
 class SendFriendRequestUseCase:
@@ -12,11 +14,13 @@ class SendFriendRequestUseCase:
         self,
         friendship_repository: IFriendshipRepository,
         user_repository: IUserRepository,
-        friendship_service: FriendshipService
+        friendship_service: FriendshipService,
+        event_bus: EventBus
     ):
         self._friendship_repository = friendship_repository
         self._user_repository = user_repository
         self._friendship_service = friendship_service
+        self._event_bus = event_bus
 
     async def execute(self, dto: SendFriendRequestDTO, requester_id: str) -> FriendshipResponseDTO:
         """Enviar solicitud de amistad"""
@@ -34,6 +38,12 @@ class SendFriendRequestUseCase:
         # Guardar en repositorio
         created_friendship = await self._friendship_repository.create(friendship)
 
+        await self._event_bus.publish(FriendRequestSentEvent(
+            friendship_id=created_friendship.id,
+            user_id=created_friendship.user_id,
+            friend_id=created_friendship.friend_id
+        ))
+
         # Obtener información de usuarios para la respuesta
         requester_user = await self._user_repository.find_by_id(requester_id)
         
@@ -0,0 +1,125 @@
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+from .friendship_events import FRIENDSHIP_EVENT_TYPES
+
+
+class FriendGraphCache:
+    """Índice en memoria de amistades aceptadas por usuario.
+
+    Cada usuario guarda un frozenset con los IDs de sus amigos, de modo que
+    amigos en común y grado 2 son operaciones de conjuntos. La caché está
+    acotada por usuarios (LRU) y cada entrada expira tras ttl_seconds para
+    limitar la divergencia entre procesos; no hay tablas auxiliares que
+    crezcan fuera de ese límite.
+    """
+
+    def __init__(self, max_users: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        self._max_users = max_users or int(os.getenv("FRIEND_GRAPH_CACHE_MAX_USERS", "50000"))
+        self._ttl_seconds = ttl_seconds or float(os.getenv("FRIEND_GRAPH_CACHE_TTL_SECONDS", "300"))
+
+        # usuario -> (expira_en, amigos)
+        self._adjacency: "OrderedDict[str, Tuple[float, FrozenSet[str]]]" = OrderedDict()
+        # Se incrementa con cada cambio incremental; ver snapshot()/put_many()
+        self._epoch = 0
+
+    def snapshot(self) -> int:
+        """Marca a pasar a put_many() para descartar cargas que compitieron con un cambio"""
+        return self._epoch
+
+    def get(self, user_id: str) -> Optional[FrozenSet[str]]:
+        """Amigos de un usuario, o None si no está en caché"""
+        entry = self._adjacency.get(user_id)
+        if entry is None:
+            return None
+
+        if entry[0] < time.monotonic():
+            del self._adjacency[user_id]
+            return None
+
+        self._adjacency.move_to_end(user_id)
+        return entry[1]
+
+    def get_many(self, user_ids: Iterable[str]) -> Tuple[Dict[str, FrozenSet[str]], List[str]]:
+        """Separar usuarios en caché de los que hay que cargar"""
+        found: Dict[str, FrozenSet[str]] = {}
+        missing: List[str] = []
+
+        for user_id in dict.fromkeys(user_ids):
+            friends = self.get(user_id)
+            if friends is None:
+                missing.append(user_id)
+            else:
+                found[user_id] = friends
+
+        return found, missing
+
+    def put_many(self, adjacency: Dict[str, Iterable[str]], snapshot: int) -> Dict[str, FrozenSet[str]]:
+        """Guardar listas de amigos cargadas de la base de datos.
+
+        Si hubo un cambio incremental desde snapshot la carga puede estar
+        desactualizada: se devuelve para esta petición pero no se cachea.
+        """
+        now = time.monotonic()
+        cacheable = snapshot == self._epoch
+        result: Dict[str, FrozenSet[str]] = {}
+
+        for user_id, friend_ids in adjacency.items():
+            friends = frozenset(friend_ids)
+            result[user_id] = friends
+
+            if cacheable:
+                self._store(user_id, friends, now)
+
+        return result
+
+    def add_edge(self, user_id: str, friend_id: str) -> None:
+        """Registrar una amistad aceptada en las entradas cacheadas"""
+        self._epoch += 1
+        self._update(user_id, lambda friends: friends | {friend_id})
+        self._update(friend_id, lambda friends: friends | {user_id})
+
+    def remove_edge(self, user_id: str, friend_id: str) -> None:
+        """Quitar una amistad de las entradas cacheadas"""
+        self._epoch += 1
+        self._update(user_id, lambda friends: friends - {friend_id})
+        self._update(friend_id, lambda friends: friends - {user_id})
+
+    def invalidate(self, user_id: str) -> None:
+        """Descartar la entrada de un usuario"""
+        self._epoch += 1
+        self._adjacency.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._epoch += 1
+        self._adjacency.clear()
+
+    async def on_friendship_accepted(self, event) -> None:
+        self.add_edge(event.user_id, event.friend_id)
+
+    async def on_friendship_removed(self, event) -> None:
+        self.remove_edge(event.user_id, event.friend_id)
+
+    def register_handlers(self, event_bus) -> None:
+        """Mantener el índice al día con los eventos de amistad"""
+        event_bus.subscribe(FRIENDSHIP_EVENT_TYPES["FRIENDSHIP_ACCEPTED"], self.on_friendship_accepted, critical=True)
+        event_bus.subscribe(FRIENDSHIP_EVENT_TYPES["FRIENDSHIP_REMOVED"], self.on_friendship_removed, critical=True)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "cached_users": len(self._adjacency),
+            "max_users": self._max_users
+        }
+
+    def _update(self, user_id: str, change) -> None:
+        entry = self._adjacency.get(user_id)
+        if entry is not None:
+            self._adjacency[user_id] = (entry[0], frozenset(change(entry[1])))
+
+    def _store(self, user_id: str, friends: FrozenSet[str], now: float) -> None:
+        self._adjacency[user_id] = (now + self._ttl_seconds, friends)
+        self._adjacency.move_to_end(user_id)
+
+        while len(self._adjacency) > self._max_users:
+            self._adjacency.popitem(last=False)
@@ -0,0 +1,64 @@
+from dataclasses import dataclass
+from datetime import datetime
+from shared.events.base_event import DomainEvent
+
+
+FRIENDSHIP_EVENT_TYPES = {
+    "FRIEND_REQUEST_SENT": "friend_request_sent",
+    "FRIEND_REQUEST_REJECTED": "friend_request_rejected",
+    "FRIENDSHIP_ACCEPTED": "friendship_accepted",
+    "FRIENDSHIP_REMOVED": "friendship_removed"
+}
+
+
+@dataclass
+class FriendRequestSentEvent(DomainEvent):
+    friendship_id: str = ""
+    user_id: str = ""
+    friend_id: str = ""
+
+    def __post_init__(self):
+        self.event_type = FRIENDSHIP_EVENT_TYPES["FRIEND_REQUEST_SENT"]
+        self.aggregate_id = self.friendship_id
+        self.aggregate_type = "Friendship"
+        self.occurred_at = datetime.utcnow()
+
+
+@dataclass
+class FriendRequestRejectedEvent(DomainEvent):
+    friendship_id: str = ""
+    user_id: str = ""
+    friend_id: str = ""
+
+    def __post_init__(self):
+        self.event_type = FRIENDSHIP_EVENT_TYPES["FRIEND_REQUEST_REJECTED"]
+        self.aggregate_id = self.friendship_id
+        self.aggregate_type = "Friendship"
+        self.occurred_at = datetime.utcnow()
+
+
+@dataclass
+class FriendshipAcceptedEvent(DomainEvent):
+    friendship_id: str = ""
+    user_id: str = ""
+    friend_id: str = ""
+
+    def __post_init__(self):
+        self.event_type = FRIENDSHIP_EVENT_TYPES["FRIENDSHIP_ACCEPTED"]
+        self.aggregate_id = self.friendship_id
+        self.aggregate_type = "Friendship"
+        self.occurred_at = datetime.utcnow()
+
+
+@dataclass
+class FriendshipRemovedEvent(DomainEvent):
+    friendship_id: str = ""
+    user_id: str = ""
+    friend_id: str = ""
+    removed_by: str = ""
+
+    def __post_init__(self):
+        self.event_type = FRIENDSHIP_EVENT_TYPES["FRIENDSHIP_REMOVED"]
+        self.aggregate_id = self.friendship_id
+        self.aggregate_type = "Friendship"
+        self.occurred_at = datetime.utcnow()
@@ -1,13 +1,31 @@
 # src/modules/friendships/domain/friendship_service.py
-from typing import List
+import os
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set
 from .Friendship import Friendship
+from .friend_graph_cache import FriendGraphCache
+from .friendship_events import FRIENDSHIP_EVENT_TYPES
 from .interfaces.IFriendshipRepository import IFriendshipRepository
+from modules.trips.domain.trip_events import TRIP_EVENT_TYPES
 from shared.errors.custom_errors import ValidationError, ConflictError
+from shared.utils.cache_utils import TTLCache
 
 
 class FriendshipService:
-    def __init__(self, friendship_repository: IFriendshipRepository):
+    # Se calcula una sola lista por usuario y cada petición toma su prefijo
+    SUGGESTION_POOL_SIZE = 50
+
+    def __init__(
+        self,
+        friendship_repository: IFriendshipRepository,
+        friend_graph_cache: Optional[FriendGraphCache] = None,
+        suggestion_cache: Optional[TTLCache] = None
+    ):
         self._friendship_repository = friendship_repository
+        self._friend_graph = friend_graph_cache or FriendGraphCache()
+        self._suggestions = suggestion_cache or TTLCache(
+            max_entries=int(os.getenv("FRIEND_SUGGESTIONS_CACHE_MAX_USERS", "10000")),
+            ttl_seconds=float(os.getenv("FRIEND_SUGGESTIONS_CACHE_TTL_SECONDS", "600"))
+        )
 
     async def validate_friendship_creation(self, user_id: str, friend_id: str) -> None:
         """Validar que se puede crear una nueva amistad"""
@@ -52,30 +70,74 @@ class FriendshipService:
 
     async def get_mutual_friends_count(self, user_id: str, other_user_id: str) -> int:
         """Obtener cantidad de amigos en común entre dos usuarios"""
-        user_friends = await self._friendship_repository.find_accepted_friends_ids(user_id)
-        other_friends = await self._friendship_repository.find_accepted_friends_ids(other_user_id)
-        
-        mutual_friends = set(user_friends) & set(other_friends)
-        return len(mutual_friends)
+        counts = await self.get_mutual_friends_counts(user_id, [other_user_id])
+        return counts.get(other_user_id, 0)
 
-    async def suggest_friends(self, user_id: str, limit: int = 10) -> List[str]:
-        """Sugerir amigos basado en usuarios que no son amigos"""
-        # Obtener amigos actuales
-        user_friends = await self._friendship_repository.find_accepted_friends_ids(user_id)
-        
-        # Obtener todos los usuarios excepto el actual y sus amigos
-        suggested_users = await self._friendship_repository.get_all_users_except(user_id, limit * 3)
-        
-        # Filtrar usuarios que ya son amigos
-        potential_friends = []
-        for suggested_id in suggested_users:
-            if suggested_id not in user_friends:
-                # Verificar que no existe solicitud pendiente
-                existing_friendship = await self._friendship_repository.find_between_users(user_id, suggested_id)
-                if not existing_friendship:
-                    potential_friends.append(suggested_id)
-                    
-                    if len(potential_friends) >= limit:
-                        break
-        
-        return potential_friends
\ No newline at end of file
+    async def get_mutual_friends_counts(self, user_id: str, candidate_ids: List[str]) -> Dict[str, int]:
+        """Obtener amigos en común con varios usuarios (una sola consulta para toda la página)"""
+        if not candidate_ids:
+            return {}
+
+        adjacency = await self._get_adjacency([user_id, *candidate_ids])
+        user_friends = adjacency[user_id]
+
+        return {
+            candidate_id: len(user_friends & adjacency[candidate_id])
+            for candidate_id in candidate_ids
+        }
+
+    async def get_friend_ids(self, user_id: str) -> Set[str]:
+        """Obtener IDs de amigos aceptados (desde el índice en memoria)"""
+        adjacency = await self._get_adjacency([user_id])
+        return set(adjacency[user_id])
+
+    async def _get_adjacency(self, user_ids: List[str]) -> Dict[str, FrozenSet[str]]:
+        """Amigos de cada usuario; solo los ausentes se cargan de Mongo"""
+        adjacency, missing = self._friend_graph.get_many(user_ids)
+
+        if missing:
+            snapshot = self._friend_graph.snapshot()
+            loaded = await self._friendship_repository.find_accepted_friends_ids_for_users(missing)
+            adjacency.update(self._friend_graph.put_many(loaded, snapshot))
+
+        return adjacency
+
+    async def suggest_friends(self, user_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Sugerir amigos de grado 2 ordenados por amigos en común y viajes compartidos"""
+        suggestions = self._suggestions.get(user_id)
+
+        if suggestions is None:
+            suggestions = await self._friendship_repository.find_friend_suggestions(
+                user_id, max(limit, self.SUGGESTION_POOL_SIZE)
+            )
+            self._suggestions.set(user_id, suggestions)
+
+        return suggestions[:limit]
+
+    def invalidate_suggestions(self, user_ids: Iterable[str]) -> None:
+        """Descartar las sugerencias cacheadas de los usuarios afectados por un cambio"""
+        for user_id in user_ids:
+            if user_id:
+                self._suggestions.pop(user_id)
+
+    async def on_friendship_changed(self, event) -> None:
+        self.invalidate_suggestions([event.user_id, event.friend_id])
+
+    async def on_trip_membership_changed(self, event) -> None:
+        # Solo se invalida al miembro afectado; el resto de compañeros del
+        # viaje ven el cambio al expirar su entrada
+        self.invalidate_suggestions([getattr(event, "user_id", None) or getattr(event, "removed_user_id", None)])
+
+    def register_handlers(self, event_bus) -> None:
+        """Invalidar sugerencias cuando cambian amistades o membresías de viajes.
+
+        Los eventos de miembros se suscriben como no críticos, igual que en
+        TripMemberCache: con el outbox activo el relay los entrega después del
+        commit y una lectura concurrente no puede volver a cachear las
+        sugerencias anteriores al cambio.
+        """
+        for event_type in FRIENDSHIP_EVENT_TYPES.values():
+            event_bus.subscribe(event_type, self.on_friendship_changed, critical=True)
+
+        for event_type in ("MEMBER_JOINED", "MEMBER_LEFT", "MEMBER_REMOVED"):
+            event_bus.subscribe(TRIP_EVENT_TYPES[event_type], self.on_trip_membership_changed)
@@ -1,6 +1,6 @@
 # src/modules/friendships/domain/interfaces/IFriendshipRepository.py
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from ..Friendship import Friendship
 
 
@@ -36,9 +36,11 @@ class IFriendshipRepository(ABC):
         self, 
         user_id: str, 
         page: int = 1, 
-        limit: int = 20
-    ) -> Tuple[List[Friendship], int]:
-        """Buscar amigos aceptados de un usuario con paginación"""
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        count_mode: str = "exact"
+    ) -> Tuple[List[Friendship], Optional[int], bool]:
+        """Buscar amigos aceptados de un usuario con paginación (o cursor keyset)"""
         pass
 
     @abstractmethod
@@ -82,6 +84,17 @@ class IFriendshipRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_all_users_except(self, user_id: str, limit: int = 10) -> List[str]:
-        """Obtener usuarios que no son amigos para sugerencias"""
+    async def find_accepted_friends_ids_for_users(self, user_ids: List[str]) -> Dict[str, List[str]]:
+        """Obtener IDs de amigos aceptados de varios usuarios en una sola consulta"""
+        pass
+
+    @abstractmethod
+    async def find_friend_suggestions(
+        self,
+        user_id: str,
+        limit: int = 10,
+        mutual_friend_weight: float = 1.0,
+        shared_trip_weight: float = 2.0
+    ) -> List[Dict[str, Any]]:
+        """Sugerencias de grado 2 puntuadas por amigos en común y viajes compartidos"""
         pass
\ No newline at end of file
@@ -1,6 +1,6 @@
 # src/modules/friendships/infrastructure/controllers/friendship_controller.py
 from fastapi import HTTPException
-from typing import Dict
+from typing import Dict, Optional
 
 from ...application.dtos.friendship_dto import SendFriendRequestDTO
 from ...application.use_cases.send_friend_request import SendFriendRequestUseCase
@@ -12,6 +12,7 @@ from ...application.use_cases.get_friend_requests import GetFriendRequestsUseCas
 from ...application.use_cases.get_friend_suggestions import GetFriendSuggestionsUseCase
 from ...application.use_cases.get_friendship_stats import GetFriendshipStatsUseCase
 from shared.utils.response_utils import SuccessResponse
+from shared.errors.custom_errors import ValidationError
 
 
 class FriendshipController:
@@ -129,13 +130,22 @@ class FriendshipController:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
 
-    async def get_friends(self, current_user: Dict, page: int = 1, limit: int = 20):
+    async def get_friends(
+        self,
+        current_user: Dict,
+        page: int = 1,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        count_mode: str = "exact"
+    ):
         """Obtener lista de amigos"""
         try:
             user_id = current_user.get("sub") or current_user.get("id")
-            result = await self._get_friends_use_case.execute(user_id, page, limit)
+            result = await self._get_friends_use_case.execute(user_id, page, limit, cursor, count_mode)
             return result
             
+        except ValidationError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
 
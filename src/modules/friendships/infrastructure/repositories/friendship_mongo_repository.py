@@ -1,18 +1,44 @@
 # src/modules/friendships/infrastructure/repositories/friendship_mongo_repository.py
-from typing import List, Optional, Tuple
-from pymongo import DESCENDING
+from typing import Any, Dict, List, Optional, Tuple
+from pymongo import IndexModel, ASCENDING, DESCENDING
 
 from ...domain.Friendship import Friendship, FriendshipData
 from ...domain.interfaces.IFriendshipRepository import IFriendshipRepository
 from shared.database.Connection import DatabaseConnection
 from shared.errors.custom_errors import DatabaseError
 from shared.constants import FRIENDSHIP_STATUS
+from shared.utils.pagination_utils import PaginationUtils
 
 
 class FriendshipMongoRepository(IFriendshipRepository):
+    COLLECTION_NAME = "friendships"
+    INDEXES = [
+        IndexModel(
+            [("user_id", ASCENDING), ("status", ASCENDING), ("created_at", DESCENDING)],
+            partialFilterExpression={"is_deleted": False}
+        ),
+        IndexModel(
+            [("friend_id", ASCENDING), ("status", ASCENDING), ("created_at", DESCENDING)],
+            partialFilterExpression={"is_deleted": False}
+        ),
+        IndexModel(
+            [("user_id", ASCENDING), ("friend_id", ASCENDING)],
+            partialFilterExpression={"is_deleted": False}
+        ),
+        # Listado de amigos (keyset por accepted_at + _id en cada rama del $or)
+        IndexModel(
+            [("user_id", ASCENDING), ("status", ASCENDING), ("accepted_at", DESCENDING), ("_id", DESCENDING)],
+            partialFilterExpression={"is_deleted": False}
+        ),
+        IndexModel(
+            [("friend_id", ASCENDING), ("status", ASCENDING), ("accepted_at", DESCENDING), ("_id", DESCENDING)],
+            partialFilterExpression={"is_deleted": False}
+        )
+    ]
+
     def __init__(self):
         self._db = DatabaseConnection.get_database()
-        self._collection = self._db.friendships
+        self._collection = self._db[self.COLLECTION_NAME]
 
     def _document_to_friendship_data(self, doc) -> FriendshipData:
         """Convertir documento MongoDB a FriendshipData"""
@@ -112,12 +138,14 @@ class FriendshipMongoRepository(IFriendshipRepository):
         self, 
         user_id: str, 
         page: int = 1, 
-        limit: int = 20
-    ) -> Tuple[List[Friendship], int]:
-        """Buscar amigos aceptados de un usuario con paginación"""
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        count_mode: str = PaginationUtils.COUNT_EXACT
+    ) -> Tuple[List[Friendship], Optional[int], bool]:
+        """Buscar amigos aceptados de un usuario con paginación (por página o por cursor keyset)"""
+        keyset = PaginationUtils.build_keyset_filter("accepted_at", -1, cursor)
+
         try:
-            skip = (page - 1) * limit
-            
             query = {
                 "$or": [
                     {"user_id": user_id},
@@ -127,16 +155,24 @@ class FriendshipMongoRepository(IFriendshipRepository):
                 "is_deleted": False
             }
             
-            # Obtener total de documentos
-            total = await self._collection.count_documents(query)
+            # Obtener total de documentos (cacheado / estimado / omitido)
+            total = await PaginationUtils.count_documents(self._collection, query, count_mode)
             
-            # Obtener documentos paginados
-            cursor = self._collection.find(query).skip(skip).limit(limit).sort("accepted_at", DESCENDING)
-            docs = await cursor.to_list(length=limit)
+            # Obtener documentos paginados (limit+1 para derivar has_next)
+            sort = [("accepted_at", DESCENDING), ("_id", DESCENDING)]
+
+            if keyset:
+                cursor = self._collection.find({"$and": [query, keyset]}).sort(sort).limit(limit + 1)
+            else:
+                skip = (page - 1) * limit
+                cursor = self._collection.find(query).sort(sort).skip(skip).limit(limit + 1)
+
+            docs = await cursor.to_list(length=limit + 1)
+            docs, has_next = PaginationUtils.split_page(docs, limit)
             
             friendships = [Friendship.from_data(self._document_to_friendship_data(doc)) for doc in docs]
             
-            return friendships, total
+            return friendships, total, has_next
             
         except Exception as error:
             raise DatabaseError(f"Error obteniendo amigos del usuario: {str(error)}")
@@ -262,50 +298,195 @@ class FriendshipMongoRepository(IFriendshipRepository):
         except Exception as error:
             raise DatabaseError(f"Error obteniendo IDs de amigos: {str(error)}")
 
-    async def get_all_users_except(self, user_id: str, limit: int = 10) -> List[str]:
-        """Obtener usuarios que no son amigos para sugerencias"""
+    async def find_accepted_friends_ids_for_users(self, user_ids: List[str]) -> Dict[str, List[str]]:
+        """Obtener IDs de amigos aceptados de varios usuarios en una sola agregación"""
         try:
-            # Obtener amigos actuales
-            current_friends = await self.find_accepted_friends_ids(user_id)
-            
-            # Obtener usuarios que tienen solicitudes pendientes
-            pending_users = set()
-            
-            # Solicitudes enviadas
-            sent_cursor = self._collection.find({
-                "user_id": user_id,
-                "status": FRIENDSHIP_STATUS["PENDING"],
-                "is_deleted": False
-            }, {"friend_id": 1})
-            sent_docs = await sent_cursor.to_list(length=None)
-            for doc in sent_docs:
-                pending_users.add(doc["friend_id"])
-            
-            # Solicitudes recibidas
-            received_cursor = self._collection.find({
-                "friend_id": user_id,
-                "status": FRIENDSHIP_STATUS["PENDING"],
-                "is_deleted": False
-            }, {"user_id": 1})
-            received_docs = await received_cursor.to_list(length=None)
-            for doc in received_docs:
-                pending_users.add(doc["user_id"])
-            
-            # Usuarios a excluir
-            excluded_users = set(current_friends) | pending_users | {user_id}
-            
-            # Buscar usuarios en la colección de usuarios
-            # La colección users usa _id como campo principal
-            users_collection = self._db.users
-            cursor = users_collection.find({
-                "_id": {"$nin": list(excluded_users)},
-                "esta_activo": True,
-                "email_verificado": True,
-                "eliminado": False
-            }, {"_id": 1}).limit(limit)
-            
-            user_docs = await cursor.to_list(length=limit)
-            return [doc["_id"] for doc in user_docs]
-            
+            user_ids = list(set(user_ids))
+            if not user_ids:
+                return {}
+
+            pipeline = [
+                {
+                    "$match": {
+                        "$or": [
+                            {"user_id": {"$in": user_ids}},
+                            {"friend_id": {"$in": user_ids}}
+                        ],
+                        "status": FRIENDSHIP_STATUS["ACCEPTED"],
+                        "is_deleted": False
+                    }
+                },
+                # Cada amistad aporta la arista en ambos sentidos
+                {
+                    "$project": {
+                        "_id": 0,
+                        "edges": [
+                            {"owner": "$user_id", "friend": "$friend_id"},
+                            {"owner": "$friend_id", "friend": "$user_id"}
+                        ]
+                    }
+                },
+                {"$unwind": "$edges"},
+                {"$match": {"edges.owner": {"$in": user_ids}}},
+                {"$group": {"_id": "$edges.owner", "friends": {"$addToSet": "$edges.friend"}}}
+            ]
+
+            docs = await self._collection.aggregate(pipeline).to_list(length=None)
+
+            adjacency = {user_id: [] for user_id in user_ids}
+            for doc in docs:
+                adjacency[doc["_id"]] = doc["friends"]
+
+            return adjacency
+
+        except Exception as error:
+            raise DatabaseError(f"Error obteniendo IDs de amigos por lote: {str(error)}")
+
+    async def find_friend_suggestions(
+        self,
+        user_id: str,
+        limit: int = 10,
+        mutual_friend_weight: float = 1.0,
+        shared_trip_weight: float = 2.0
+    ) -> List[Dict[str, Any]]:
+        """Sugerencias de grado 2: amigos de amigos y compañeros de viaje.
+
+        Cada rama parte del usuario, reúne sus relaciones (aceptadas y
+        pendientes, que se excluyen) y sus viajes, y recorre un solo salto:
+        amigos de amigos en cada sentido de la relación o miembros de sus
+        viajes. Cada $lookup de salto va seguido de su $unwind para que el
+        servidor los fusione y no acumule a todos los candidatos en un único
+        documento (límite de 16 MB). Las ramas se unen con $unionWith, se
+        puntúa por amigos en común y viajes compartidos y se devuelve el top-k
+        de usuarios activos y verificados.
+        """
+        try:
+            accepted = FRIENDSHIP_STATUS["ACCEPTED"]
+            open_statuses = [FRIENDSHIP_STATUS["PENDING"], accepted]
+            active_member = {"status": "accepted", "is_deleted": {"$ne": True}}
+
+            origin = [
+                {"$match": {"_id": user_id}},
+                # Relaciones directas del usuario (enviadas y recibidas)
+                {"$lookup": {
+                    "from": self.COLLECTION_NAME,
+                    "localField": "_id",
+                    "foreignField": "user_id",
+                    "pipeline": [
+                        {"$match": {"status": {"$in": open_statuses}, "is_deleted": False}},
+                        {"$project": {"_id": 0, "other": "$friend_id", "status": 1}}
+                    ],
+                    "as": "sent"
+                }},
+                {"$lookup": {
+                    "from": self.COLLECTION_NAME,
+                    "localField": "_id",
+                    "foreignField": "friend_id",
+                    "pipeline": [
+                        {"$match": {"status": {"$in": open_statuses}, "is_deleted": False}},
+                        {"$project": {"_id": 0, "other": "$user_id", "status": 1}}
+                    ],
+                    "as": "received"
+                }},
+                # Viajes donde el usuario es miembro aceptado
+                {"$lookup": {
+                    "from": "trip_members",
+                    "localField": "_id",
+                    "foreignField": "user_id",
+                    "pipeline": [
+                        {"$match": active_member},
+                        {"$project": {"_id": 0, "trip_id": 1}}
+                    ],
+                    "as": "memberships"
+                }},
+                {"$project": {
+                    "trip_ids": "$memberships.trip_id",
+                    "excluded": {"$concatArrays": ["$sent.other", "$received.other"]},
+                    "friends": {"$map": {
+                        "input": {"$filter": {
+                            "input": {"$concatArrays": ["$sent", "$received"]},
+                            "cond": {"$eq": ["$$this.status", accepted]}
+                        }},
+                        "in": "$$this.other"
+                    }}
+                }}
+            ]
+
+            def hop(collection: str, local_field: str, foreign_field: str, match: Dict[str, Any],
+                    candidate_field: str, mutual: int, trip: int) -> List[Dict[str, Any]]:
+                return origin + [
+                    {"$lookup": {
+                        "from": collection,
+                        "localField": local_field,
+                        "foreignField": foreign_field,
+                        "pipeline": [
+                            {"$match": match},
+                            {"$project": {
+                                "_id": 0,
+                                "id": f"${candidate_field}",
+                                "mutual": {"$literal": mutual},
+                                "trip": {"$literal": trip}
+                            }}
+                        ],
+                        "as": "candidate"
+                    }},
+                    {"$unwind": "$candidate"},
+                    {"$project": {"_id": 0, "excluded": 1, "candidate": 1}}
+                ]
+
+            friend_match = {"status": accepted, "is_deleted": False}
+
+            pipeline = [
+                # Amigos de los amigos (en ambos sentidos de la relación)
+                *hop(self.COLLECTION_NAME, "friends", "user_id", friend_match, "friend_id", 1, 0),
+                {"$unionWith": {
+                    "coll": "users",
+                    "pipeline": hop(self.COLLECTION_NAME, "friends", "friend_id", friend_match, "user_id", 1, 0)
+                }},
+                # Compañeros en los viajes del usuario
+                {"$unionWith": {
+                    "coll": "users",
+                    "pipeline": hop("trip_members", "trip_ids", "trip_id", active_member, "user_id", 0, 1)
+                }},
+                # Excluir al propio usuario y a quien ya tiene relación con él
+                {"$match": {"$expr": {"$and": [
+                    {"$ne": ["$candidate.id", user_id]},
+                    {"$not": [{"$in": ["$candidate.id", "$excluded"]}]}
+                ]}}},
+                {"$group": {
+                    "_id": "$candidate.id",
+                    "mutual_friends": {"$sum": "$candidate.mutual"},
+                    "shared_trips": {"$sum": "$candidate.trip"}
+                }},
+                {"$addFields": {"score": {"$add": [
+                    {"$multiply": ["$mutual_friends", mutual_friend_weight]},
+                    {"$multiply": ["$shared_trips", shared_trip_weight]}
+                ]}}},
+                {"$sort": {"score": -1, "mutual_friends": -1, "_id": 1}},
+                # Margen para los candidatos inactivos que se descartan abajo
+                {"$limit": limit * 2},
+                {"$lookup": {
+                    "from": "users",
+                    "localField": "_id",
+                    "foreignField": "_id",
+                    "pipeline": [
+                        {"$match": {"esta_activo": True, "email_verificado": True, "eliminado": False}},
+                        {"$project": {"_id": 1}}
+                    ],
+                    "as": "user"
+                }},
+                {"$match": {"user": {"$ne": []}}},
+                {"$limit": limit},
+                {"$project": {
+                    "_id": 0,
+                    "user_id": "$_id",
+                    "mutual_friends": 1,
+                    "shared_trips": 1,
+                    "score": 1
+                }}
+            ]
+
+            return await self._db.users.aggregate(pipeline).to_list(length=limit)
+
         except Exception as error:
-            raise DatabaseError(f"Error obteniendo usuarios sugeridos: {str(error)}")
\ No newline at end of file
+            raise DatabaseError(f"Error obteniendo usuarios sugeridos: {str(error)}")
@@ -1,12 +1,14 @@
 # src/modules/friendships/infrastructure/routes/friendship_routes.py
 from fastapi import APIRouter, Depends, Query
-from typing import Annotated
+from typing import Annotated, Optional
 
 from ..controllers.friendship_controller import FriendshipController
 from ...application.dtos.friendship_dto import SendFriendRequestDTO
 from shared.middleware.AuthMiddleware import get_current_user
 from shared.repositories.RepositoryFactory import RepositoryFactory
 from shared.services.ServiceFactory import ServiceFactory
+from shared.repositories.LoaderFactory import LoaderFactory
+from shared.events.event_bus import EventBus
 
 # Import use cases
 from ...application.use_cases.send_friend_request import SendFriendRequestUseCase
@@ -17,43 +19,52 @@ from ...application.use_cases.get_friends import GetFriendsUseCase
 from ...application.use_cases.get_friend_requests import GetFriendRequestsUseCase
 from ...application.use_cases.get_friend_suggestions import GetFriendSuggestionsUseCase
 from ...application.use_cases.get_friendship_stats import GetFriendshipStatsUseCase
+from shared.services.Container import Container
+from shared.utils.json_utils import FastJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
-def get_friendship_controller():
+def _build_friendship_controller():
     """Factory para crear controlador de amistades"""
     friendship_repo = RepositoryFactory.get_friendship_repository()
     user_repo = RepositoryFactory.get_user_repository()
     friendship_service = ServiceFactory.get_friendship_service()
+    user_loader = LoaderFactory.get_user_loader()
+    event_bus = EventBus.get_instance()
     
     # Crear todos los use cases
     send_friend_request_use_case = SendFriendRequestUseCase(
         friendship_repository=friendship_repo,
         user_repository=user_repo,
-        friendship_service=friendship_service
+        friendship_service=friendship_service,
+        event_bus=event_bus
     )
     
     accept_friend_request_use_case = AcceptFriendRequestUseCase(
         friendship_repository=friendship_repo,
         user_repository=user_repo,
-        friendship_service=friendship_service
+        friendship_service=friendship_service,
+        event_bus=event_bus
     )
     
     reject_friend_request_use_case = RejectFriendRequestUseCase(
         friendship_repository=friendship_repo,
         user_repository=user_repo,
-        friendship_service=friendship_service
+        friendship_service=friendship_service,
+        event_bus=event_bus
     )
     
     remove_friendship_use_case = RemoveFriendshipUseCase(
         friendship_repository=friendship_repo,
-        friendship_service=friendship_service
+        friendship_service=friendship_service,
+        event_bus=event_bus
     )
     
     get_friends_use_case = GetFriendsUseCase(
         friendship_repository=friendship_repo,
         user_repository=user_repo,
-        friendship_service=friendship_service
+        friendship_service=friendship_service,
+        user_loader=user_loader
     )
     
     get_friend_requests_use_case = GetFriendRequestsUseCase(
@@ -65,7 +76,8 @@ def get_friendship_controller():
     get_friend_suggestions_use_case = GetFriendSuggestionsUseCase(
         friendship_repository=friendship_repo,
         user_repository=user_repo,
-        friendship_service=friendship_service
+        friendship_service=friendship_service,
+        user_loader=user_loader
     )
     
     get_friendship_stats_use_case = GetFriendshipStatsUseCase(
@@ -83,6 +95,7 @@ def get_friendship_controller():
         get_friendship_stats_use_case=get_friendship_stats_use_case
     )
 
+get_friendship_controller = Container.provider("friendship_controller", _build_friendship_controller)
 
 # Rutas de amistades
 @router.post("/request")
@@ -130,10 +143,12 @@ async def get_friends(
     current_user: Annotated[dict, Depends(get_current_user)],
     page: int = Query(1, ge=1, description="Número de página"),
     limit: int = Query(20, ge=1, le=100, description="Elementos por página"),
+    cursor: Optional[str] = Query(None, description="Cursor de la página siguiente (ignora page)"),
+    count: str = Query("exact", description="Total: exact | estimate | none"),
     controller: FriendshipController = Depends(get_friendship_controller)
 ):
     """Obtener lista de amigos"""
-    return await controller.get_friends(current_user, page, limit)
+    return await controller.get_friends(current_user, page, limit, cursor, count)
 
 
 @router.get("/requests/received")
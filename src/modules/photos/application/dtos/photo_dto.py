@@ -35,6 +35,7 @@ class PhotoResponseDTO(BaseModel):
     tags: List[str]
     url: str
     thumbnail_url: Optional[str]
+    variants: Dict[str, Dict[str, Any]] = {}
     public_id: str
     file_size: Optional[int]
     width: Optional[int]
@@ -52,12 +52,12 @@ class BulkUploadPhotosUseCase:
         if len(files) > 10:
             raise ValidationException("Máximo 10 fotos por subida masiva")
 
-        successful_uploads = []
-        failed_uploads = []
-
-        for i, file in enumerate(files):
+        async def upload(indexed_file) -> Dict[str, Any]:
+            i, file = indexed_file
+            upload_result = None
+            variant_public_ids: List[str] = []
             try:
-                # Subir archivo a Cloudinary usando el método existente
+                # Subir archivo al almacenamiento usando el método existente
                 upload_result = await self.upload_service.upload_trip_photo(
                     file, dto.trip_id, user_id
                 )
@@ -73,20 +73,44 @@ class BulkUploadPhotosUseCase:
                     public_id=upload_result["public_id"]
                 )
 
+                # Miniatura y tamaños responsive (WebP/JPEG) generados en el pool de procesos
+                derivatives = await self.upload_service.upload_photo_derivatives(
+                    file, dto.trip_id, upload_result["content_hash"]
+                )
+                if derivatives:
+                    variant_public_ids = derivatives["public_ids"]
+                    photo.set_derivatives(
+                        variants=derivatives["variants"],
+                        variant_public_ids=variant_public_ids,
+                        thumbnail_url=derivatives["thumbnail_url"],
+                        width=derivatives["width"],
+                        height=derivatives["height"]
+                    )
+
                 # Guardar en base de datos
                 created_photo = await self.photo_repository.create(photo)
-                
-                successful_uploads.append({
+
+                return {
                     "file_name": file.filename,
                     "photo_id": created_photo.id,
-                    "url": created_photo.url
-                })
+                    "url": created_photo.url,
+                    "thumbnail_url": created_photo.thumbnail_url
+                }
 
             except Exception as e:
-                failed_uploads.append({
+                if upload_result is not None:
+                    # La foto no se guardó: liberar la referencia y borrar archivos huérfanos
+                    await self._discard_upload(dto.trip_id, upload_result["public_id"], variant_public_ids)
+                return {
                     "file_name": file.filename,
                     "error": str(e)
-                })
+                }
+
+        # Las subidas van en paralelo (con el límite por petición del servicio):
+        # el lote tarda lo que el archivo más lento
+        results = await self.upload_service.map_concurrently(list(enumerate(files)), upload)
+        successful_uploads = [result for result in results if "error" not in result]
+        failed_uploads = [result for result in results if "error" in result]
 
         return {
             "success": True,
@@ -98,4 +122,11 @@ class BulkUploadPhotosUseCase:
                 "total_successful": len(successful_uploads),
                 "total_failed": len(failed_uploads)
             }
-        }
\ No newline at end of file
+        }
+
+    async def _discard_upload(self, trip_id: str, public_id: str, variant_public_ids: List[str]) -> None:
+        try:
+            await self.upload_service.delete_photo_files(trip_id, public_id, variant_public_ids)
+        except Exception:
+            # Si falla la limpieza, se conserva el error original
+            pass
@@ -1,5 +1,5 @@
 # src/modules/photos/application/use_cases/create_photo.py
-from typing import Dict, Any
+from typing import Dict, Any, List
 from fastapi import UploadFile
 from ...domain.interfaces.IPhotoRepository import IPhotoRepository
 from modules.trips.domain.interfaces.trip_member_repository import ITripMemberRepository
@@ -58,8 +58,10 @@ class CreatePhotoUseCase:
         if not all(validations.values()):
             raise ValidationException("Asociaciones de foto inválidas")
 
+        upload_result = None
+        variant_public_ids = []
         try:
-            # Subir archivo a Cloudinary
+            # Subir archivo al almacenamiento
             upload_result = await self.upload_service.upload_trip_photo(
                 file, dto.trip_id, user_id
             )
@@ -78,6 +80,20 @@ class CreatePhotoUseCase:
                 public_id=upload_result["public_id"]
             )
 
+            # Miniatura y tamaños responsive (WebP/JPEG) generados en el pool de procesos
+            derivatives = await self.upload_service.upload_photo_derivatives(
+                file, dto.trip_id, upload_result["content_hash"]
+            )
+            if derivatives:
+                variant_public_ids = derivatives["public_ids"]
+                photo.set_derivatives(
+                    variants=derivatives["variants"],
+                    variant_public_ids=variant_public_ids,
+                    thumbnail_url=derivatives["thumbnail_url"],
+                    width=derivatives["width"],
+                    height=derivatives["height"]
+                )
+
             # Guardar en base de datos
             created_photo = await self.photo_repository.create(photo)
 
@@ -87,6 +103,8 @@ class CreatePhotoUseCase:
                 "data": {
                     "id": created_photo.id,
                     "url": created_photo.url,
+                    "thumbnail_url": created_photo.thumbnail_url,
+                    "variants": created_photo.variants,
                     "trip_id": created_photo.trip_id,
                     "title": created_photo.title,
                     "uploaded_at": created_photo.uploaded_at
@@ -94,4 +112,14 @@ class CreatePhotoUseCase:
             }
 
         except Exception as e:
-            raise ValidationException(f"Error al subir foto: {str(e)}")
\ No newline at end of file
+            if upload_result is not None:
+                # La foto no se guardó: liberar la referencia y borrar archivos huérfanos
+                await self._discard_upload(dto.trip_id, upload_result["public_id"], variant_public_ids)
+            raise ValidationException(f"Error al subir foto: {str(e)}")
+
+    async def _discard_upload(self, trip_id: str, public_id: str, variant_public_ids: List[str]) -> None:
+        try:
+            await self.upload_service.delete_photo_files(trip_id, public_id, variant_public_ids)
+        except Exception:
+            # Si falla la limpieza, se conserva el error original
+            pass
\ No newline at end of file
@@ -34,8 +34,8 @@ class DeletePhotoUseCase:
             raise UnauthorizedException("No tienes permisos para eliminar esta foto")
 
         try:
-            # Eliminar archivo de Cloudinary
-            await self.upload_service.delete_file(photo.public_id, "image")
+            # Eliminar archivo y derivados del almacenamiento (si otra foto no los reutiliza)
+            await self.upload_service.delete_photo_files(photo.trip_id, photo.public_id, photo.variant_public_ids)
             
             # Eliminar registro de base de datos
             deleted = await self.photo_repository.delete(photo_id)
@@ -53,6 +53,7 @@ class GetPhotoUseCase:
                 "tags": photo.tags,
                 "url": photo.url,
                 "thumbnail_url": photo.thumbnail_url,
+                "variants": photo.variants,
                 "public_id": photo.public_id,
                 "file_size": photo.file_size,
                 "width": photo.width,
@@ -1,5 +1,5 @@
 # src/modules/photos/application/use_cases/get_photo_gallery.py
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from ...domain.interfaces.IPhotoRepository import IPhotoRepository
 from modules.trips.domain.interfaces.trip_member_repository import ITripMemberRepository
 from ...domain.photo_service import PhotoService
@@ -7,6 +7,7 @@ from shared.exceptions.common_exceptions import (
     NotFoundException, 
     UnauthorizedException
 )
+from shared.utils.pagination_utils import PaginationUtils
 
 class GetPhotoGalleryUseCase:
     """Caso de uso para obtener galería organizada de fotos"""
@@ -26,7 +27,8 @@ class GetPhotoGalleryUseCase:
         trip_id: str, 
         user_id: str,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None
     ) -> Dict[str, Any]:
         """Ejecutar obtención de galería"""
         
@@ -35,7 +37,9 @@ class GetPhotoGalleryUseCase:
             raise UnauthorizedException("No tienes permisos para ver la galería de este viaje")
 
         # Obtener fotos del viaje
-        photos = await self.photo_repository.get_by_trip_id(trip_id, limit, offset)
+        photos = await self.photo_repository.get_by_trip_id(trip_id, limit + 1, offset, cursor=cursor)
+        photos, has_more = PaginationUtils.split_page(photos, limit)
+        next_cursor = PaginationUtils.build_next_cursor(photos, "uploaded_at", has_more)
         
         # Obtener estadísticas del viaje
         trip_summary = await self.photo_service.get_trip_photo_summary(trip_id)
@@ -50,7 +54,8 @@ class GetPhotoGalleryUseCase:
                 "id": photo.id,
                 "title": photo.title,
                 "url": photo.url,
-                "thumbnail_url": photo.thumbnail_url,
+                "thumbnail_url": photo.get_grid_url(),
+                "variants": photo.variants,
                 "day_id": photo.day_id,
                 "likes_count": photo.get_likes_count(),
                 "is_liked": photo.has_like_from(user_id),
@@ -65,7 +70,8 @@ class GetPhotoGalleryUseCase:
                 "id": photo.id,
                 "title": photo.title,
                 "url": photo.url,
-                "thumbnail_url": photo.thumbnail_url,
+                "thumbnail_url": photo.get_grid_url(),
+                "variants": photo.variants,
                 "likes_count": photo.get_likes_count(),
                 "is_liked": photo.has_like_from(user_id)
             })
@@ -77,7 +83,8 @@ class GetPhotoGalleryUseCase:
                     "photos": gallery_photos,
                     "total": trip_summary["total_photos"],
                     "page": offset // limit + 1,
-                    "has_more": offset + limit < trip_summary["total_photos"]
+                    "has_more": has_more,
+                    "next_cursor": next_cursor
                 },
                 "stats": {
                     "total_photos": trip_summary["total_photos"],
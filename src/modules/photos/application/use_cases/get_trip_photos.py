@@ -8,6 +8,7 @@ from shared.exceptions.common_exceptions import (
     NotFoundException, 
     UnauthorizedException
 )
+from shared.utils.pagination_utils import PaginationUtils
 
 class GetTripPhotosUseCase:
     """Caso de uso para obtener fotos de un viaje"""
@@ -30,19 +31,25 @@ class GetTripPhotosUseCase:
         user_id: str,
         limit: int = 20,
         offset: int = 0,
-        day_id: Optional[str] = None
+        day_id: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count_mode: str = PaginationUtils.COUNT_EXACT
     ) -> Dict[str, Any]:
         """Ejecutar obtención de fotos del viaje"""
+        count_mode = PaginationUtils.validate_count_mode(count_mode)
         
         # Validar que usuario puede acceder al viaje
         if not await self.photo_service.validate_user_can_access_trip_photos(trip_id, user_id):
             raise UnauthorizedException("No tienes permisos para ver las fotos de este viaje")
 
         # Obtener fotos
-        photos = await self.photo_repository.get_by_trip_id(trip_id, limit, offset, day_id)
+        # Se pide limit+1 para saber si hay más fotos sin depender del total
+        photos = await self.photo_repository.get_by_trip_id(trip_id, limit + 1, offset, day_id, cursor)
+        photos, has_more = PaginationUtils.split_page(photos, limit)
+        next_cursor = PaginationUtils.build_next_cursor(photos, "uploaded_at", has_more)
         
         # Obtener total para paginación
-        total = await self.photo_repository.count_by_trip_id(trip_id)
+        total = await self.photo_repository.count_by_trip_id(trip_id, day_id, count_mode)
 
         # Agregar contexto de usuario para cada foto
         photos_with_context = []
@@ -58,7 +65,8 @@ class GetTripPhotosUseCase:
                 "location": photo.location,
                 "tags": photo.tags,
                 "url": photo.url,
-                "thumbnail_url": photo.thumbnail_url,
+                "thumbnail_url": photo.get_grid_url(),
+                "variants": photo.variants,
                 "likes_count": photo.get_likes_count(),
                 "is_liked": photo.has_like_from(user_id),
                 "uploaded_at": photo.uploaded_at
@@ -72,7 +80,8 @@ class GetTripPhotosUseCase:
                     "total": total,
                     "limit": limit,
                     "offset": offset,
-                    "has_more": offset + limit < total
+                    "has_more": has_more,
+                    "next_cursor": next_cursor
                 }
             }
         }
\ No newline at end of file
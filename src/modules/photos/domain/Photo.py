@@ -19,6 +19,8 @@ class Photo:
         day_id: Optional[str] = None,
         diary_entry_id: Optional[str] = None,
         thumbnail_url: Optional[str] = None,
+        variants: Optional[Dict[str, Dict[str, Any]]] = None,
+        variant_public_ids: Optional[List[str]] = None,
         file_size: Optional[int] = None,
         width: Optional[int] = None,
         height: Optional[int] = None,
@@ -39,6 +41,9 @@ class Photo:
         self.tags = tags or []
         self.url = url
         self.thumbnail_url = thumbnail_url
+        # Tamaños derivados: {"thumb": {"width", "height", "webp", "jpeg"}, ...}
+        self.variants = variants or {}
+        self.variant_public_ids = variant_public_ids or []
         self.public_id = public_id
         self.file_size = file_size
         self.width = width
@@ -48,6 +53,26 @@ class Photo:
         self.uploaded_at = uploaded_at or datetime.utcnow()
         self.updated_at = updated_at or datetime.utcnow()
 
+    def set_derivatives(
+        self,
+        variants: Dict[str, Dict[str, Any]],
+        variant_public_ids: List[str],
+        thumbnail_url: Optional[str] = None,
+        width: Optional[int] = None,
+        height: Optional[int] = None
+    ):
+        """Registrar los tamaños derivados generados al subir la foto"""
+        self.variants = variants
+        self.variant_public_ids = variant_public_ids
+        self.thumbnail_url = thumbnail_url or self.thumbnail_url
+        self.width = width or self.width
+        self.height = height or self.height
+        self.updated_at = datetime.utcnow()
+
+    def get_grid_url(self) -> str:
+        """URL para vistas en cuadrícula: la miniatura si existe, si no el original"""
+        return self.thumbnail_url or self.url
+
     def add_like(self, user_id: str) -> bool:
         """Agregar like de usuario"""
         if user_id not in self.likes:
@@ -111,6 +136,8 @@ class Photo:
             "tags": self.tags,
             "url": self.url,
             "thumbnail_url": self.thumbnail_url,
+            "variants": self.variants,
+            "variant_public_ids": self.variant_public_ids,
             "public_id": self.public_id,
             "file_size": self.file_size,
             "width": self.width,
@@ -136,6 +163,8 @@ class Photo:
             tags=data.get("tags", []),
             url=data.get("url"),
             thumbnail_url=data.get("thumbnail_url"),
+            variants=data.get("variants", {}),
+            variant_public_ids=data.get("variant_public_ids", []),
             public_id=data.get("public_id"),
             file_size=data.get("file_size"),
             width=data.get("width"),
@@ -22,9 +22,10 @@ class IPhotoRepository(ABC):
         trip_id: str, 
         limit: int = 20, 
         offset: int = 0,
-        day_id: Optional[str] = None
+        day_id: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> List[Photo]:
-        """Obtener fotos de un viaje"""
+        """Obtener fotos de un viaje (por offset o por cursor keyset)"""
         pass
 
     @abstractmethod
@@ -48,7 +49,12 @@ class IPhotoRepository(ABC):
         pass
 
     @abstractmethod
-    async def count_by_trip_id(self, trip_id: str) -> int:
+    async def count_by_trip_id(
+        self,
+        trip_id: str,
+        day_id: Optional[str] = None,
+        count_mode: str = "exact"
+    ) -> Optional[int]:
         """Contar fotos de un viaje"""
         pass
 
@@ -14,6 +14,7 @@ from shared.exceptions.common_exceptions import (
     UnauthorizedException, 
     ValidationException
 )
+from shared.errors.custom_errors import ValidationError
 
 class PhotoController:
     """Controlador para gestión de fotos"""
@@ -67,17 +68,21 @@ class PhotoController:
         current_user: Dict[str, Any],
         limit: int = 20,
         offset: int = 0,
-        day_id: Optional[str] = None
+        day_id: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count_mode: str = "exact"
     ) -> Dict[str, Any]:
         """Obtener fotos de un viaje"""
         try:
             return await self.get_trip_photos_use_case.execute(
-                trip_id, current_user["sub"], limit, offset, day_id
+                trip_id, current_user["sub"], limit, offset, day_id, cursor, count_mode
             )
         except NotFoundException as e:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
         except UnauthorizedException as e:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+        except ValidationError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     async def update_photo(
         self, 
@@ -118,14 +123,17 @@ class PhotoController:
         trip_id: str, 
         current_user: Dict[str, Any],
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None
     ) -> Dict[str, Any]:
         """Obtener galería de fotos del viaje"""
         try:
             return await self.get_photo_gallery_use_case.execute(
-                trip_id, current_user["sub"], limit, offset
+                trip_id, current_user["sub"], limit, offset, cursor
             )
         except NotFoundException as e:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
         except UnauthorizedException as e:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
\ No newline at end of file
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+        except ValidationError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
\ No newline at end of file
@@ -1,7 +1,9 @@
 # src/modules/photos/infrastructure/repositories/photo_mongo_repository.py
 from typing import List, Optional, Dict, Any
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import IndexModel, ASCENDING, DESCENDING
 from shared.database.Connection import DatabaseConnection
+from shared.utils.pagination_utils import PaginationUtils
 from ...domain.interfaces.IPhotoRepository import IPhotoRepository
 from ...domain.Photo import Photo
 from datetime import datetime
@@ -9,6 +11,17 @@ from datetime import datetime
 class PhotoMongoRepository(IPhotoRepository):
     """Implementación MongoDB del repositorio de fotos"""
 
+    COLLECTION_NAME = "photos"
+    INDEXES = [
+        IndexModel([("trip_id", ASCENDING), ("uploaded_at", DESCENDING), ("_id", DESCENDING)]),
+        IndexModel([
+            ("trip_id", ASCENDING), ("day_id", ASCENDING),
+            ("uploaded_at", DESCENDING), ("_id", DESCENDING)
+        ]),
+        IndexModel([("day_id", ASCENDING), ("uploaded_at", DESCENDING)]),
+        IndexModel([("diary_entry_id", ASCENDING), ("uploaded_at", DESCENDING)])
+    ]
+
     def __init__(self):
         self.db = DatabaseConnection()
         self.collection: AsyncIOMotorCollection = None
@@ -16,7 +29,7 @@ class PhotoMongoRepository(IPhotoRepository):
     async def _get_collection(self) -> AsyncIOMotorCollection:
         if not self.collection:
             database = await self.db.get_database()
-            self.collection = database.photos
+            self.collection = database[self.COLLECTION_NAME]
         return self.collection
 
     async def create(self, photo: Photo) -> Photo:
@@ -44,17 +57,23 @@ class PhotoMongoRepository(IPhotoRepository):
         trip_id: str, 
         limit: int = 20, 
         offset: int = 0,
-        day_id: Optional[str] = None
+        day_id: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> List[Photo]:
-        """Obtener fotos de un viaje"""
+        """Obtener fotos de un viaje (por offset o por cursor keyset)"""
         collection = await self._get_collection()
         
         query = {"trip_id": trip_id}
         if day_id:
             query["day_id"] = day_id
+
+        keyset = PaginationUtils.build_keyset_filter("uploaded_at", -1, cursor)
+        if keyset:
+            query = {"$and": [query, keyset]}
+            offset = 0
             
         cursor = collection.find(query)\
-            .sort("uploaded_at", -1)\
+            .sort([("uploaded_at", -1), ("_id", -1)])\
             .skip(offset)\
             .limit(limit)
         
@@ -112,10 +131,20 @@ class PhotoMongoRepository(IPhotoRepository):
         result = await collection.delete_one({"_id": photo_id})
         return result.deleted_count > 0
 
-    async def count_by_trip_id(self, trip_id: str) -> int:
-        """Contar fotos de un viaje"""
+    async def count_by_trip_id(
+        self,
+        trip_id: str,
+        day_id: Optional[str] = None,
+        count_mode: str = PaginationUtils.COUNT_EXACT
+    ) -> Optional[int]:
+        """Contar fotos de un viaje (cacheado / estimado / omitido según count_mode)"""
         collection = await self._get_collection()
-        return await collection.count_documents({"trip_id": trip_id})
+
+        query = {"trip_id": trip_id}
+        if day_id:
+            query["day_id"] = day_id
+
+        return await PaginationUtils.count_documents(collection, query, count_mode)
 
     async def get_trip_photos_stats(self, trip_id: str) -> Dict[str, Any]:
         """Obtener estadísticas de fotos del viaje"""
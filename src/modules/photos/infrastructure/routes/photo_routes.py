@@ -14,10 +14,12 @@ from ...application.use_cases.delete_photo import DeletePhotoUseCase
 from ...application.use_cases.like_photo import LikePhotoUseCase
 from ...application.use_cases.get_photo_gallery import GetPhotoGalleryUseCase
 from ...domain.photo_service import PhotoService
+from shared.services.Container import Container
+from shared.utils.json_utils import FastJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
-def get_photo_controller():
+def _build_photo_controller():
     photo_repo = RepositoryFactory.get_photo_repository()
     trip_member_repo = RepositoryFactory.get_trip_member_repository()
     user_repo = RepositoryFactory.get_user_repository()
@@ -85,6 +87,8 @@ def get_photo_controller():
         get_photo_gallery_use_case=get_photo_gallery_use_case
     )
 
+get_photo_controller = Container.provider("photo_controller", _build_photo_controller)
+
 @router.post("/trips/{trip_id}/photos")
 async def create_photo(
     trip_id: str = Path(...),
@@ -129,11 +133,13 @@ async def get_trip_photos(
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
     day_id: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    count: str = Query("exact", description="Total: exact | estimate | none"),
     current_user: dict = Depends(get_current_user),
     controller: PhotoController = Depends(get_photo_controller)
 ):
     """Obtener fotos de un viaje"""
-    return await controller.get_trip_photos(trip_id, current_user, limit, offset, day_id)
+    return await controller.get_trip_photos(trip_id, current_user, limit, offset, day_id, cursor, count)
 
 @router.put("/photos/{photo_id}")
 async def update_photo(
@@ -168,8 +174,9 @@ async def get_photo_gallery(
     trip_id: str = Path(...),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
     current_user: dict = Depends(get_current_user),
     controller: PhotoController = Depends(get_photo_controller)
 ):
     """Obtener galería organizada de fotos"""
-    return await controller.get_photo_gallery(trip_id, current_user, limit, offset)
\ No newline at end of file
+    return await controller.get_photo_gallery(trip_id, current_user, limit, offset, cursor)
\ No newline at end of file
@@ -1,6 +1,7 @@
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import IndexModel, ASCENDING, DESCENDING
 
 from ...domain.PlanRealityDifference import PlanRealityDifferenceData
 from ...domain.interfaces.IPlanRealityDifferenceRepository import IPlanRealityDifferenceRepository
@@ -10,10 +11,18 @@ from shared.errors.custom_errors import DatabaseError
 
 class PlanRealityDifferenceMongoRepository(IPlanRealityDifferenceRepository):
     """Implementación MongoDB del repositorio de diferencias plan vs realidad"""
+
+    COLLECTION_NAME = "plan_reality_differences"
+    INDEXES = [
+        IndexModel([("trip_id", ASCENDING), ("created_at", DESCENDING)]),
+        IndexModel([("trip_id", ASCENDING), ("metric", ASCENDING)]),
+        IndexModel([("day_id", ASCENDING)], sparse=True),
+        IndexModel([("activity_id", ASCENDING)], sparse=True)
+    ]
     
     def __init__(self):
         self._db_connection = DatabaseConnection()
-        self._collection_name = "plan_reality_differences"
+        self._collection_name = self.COLLECTION_NAME
 
     async def _get_collection(self) -> AsyncIOMotorCollection:
         """Obtener colección de diferencias plan vs realidad"""
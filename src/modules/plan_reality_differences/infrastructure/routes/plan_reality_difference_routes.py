@@ -14,10 +14,12 @@ from ...infrastructure.controllers.plan_reality_difference_controller import Pla
 from shared.middleware.AuthMiddleware import get_current_user
 from shared.repositories.RepositoryFactory import RepositoryFactory
 from shared.services.ServiceFactory import ServiceFactory
+from shared.services.Container import Container
+from shared.utils.json_utils import FastJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
-def get_plan_reality_difference_controller() -> PlanRealityDifferenceController:
+def _build_plan_reality_difference_controller() -> PlanRealityDifferenceController:
     """Factory para crear controlador de diferencias plan vs realidad"""
     
     # Repositorios y servicios desde factory
@@ -51,6 +53,8 @@ def get_plan_reality_difference_controller() -> PlanRealityDifferenceController:
         get_trip_analysis_use_case=get_trip_analysis_use_case
     )
 
+get_plan_reality_difference_controller = Container.provider("plan_reality_difference_controller", _build_plan_reality_difference_controller)
+
 # Rutas principales de diferencias
 @router.post("/")
 async def create_difference(
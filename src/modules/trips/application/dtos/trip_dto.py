@@ -50,6 +50,8 @@ class TripFiltersDTO:
     is_active: Optional[bool] = True
     limit: int = 20
     offset: int = 0
+    cursor: Optional[str] = None
+    count_mode: str = "exact"
 
 
 @dataclass
@@ -35,6 +35,8 @@ class TripMemberFiltersDTO:
     is_active: Optional[bool] = None
     limit: int = 50
     offset: int = 0
+    cursor: Optional[str] = None
+    count_mode: str = "exact"
 
 
 @dataclass
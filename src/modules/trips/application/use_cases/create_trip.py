@@ -8,6 +8,7 @@ from ...domain.interfaces.trip_repository import ITripRepository
 from ...domain.interfaces.trip_member_repository import ITripMemberRepository
 from modules.users.domain.interfaces.IUserRepository import IUserRepository
 from shared.events.event_bus import EventBus
+from shared.database.Connection import DatabaseConnection
 
 
 class CreateTripUseCase:
@@ -49,25 +50,27 @@ class CreateTripUseCase:
             notes=dto.notes
         )
 
-        created_trip = await self._trip_repository.create(trip)
+        # Cambio del agregado y eventos (outbox) en una sola transacción
+        async with DatabaseConnection.transaction():
+            created_trip = await self._trip_repository.create(trip)
 
-        owner_member = TripMember.create_owner(created_trip.id, owner_id)
-        await self._trip_member_repository.create(owner_member)
+            owner_member = TripMember.create_owner(created_trip.id, owner_id)
+            await self._trip_member_repository.create(owner_member)
 
-        trip_created_event = TripCreatedEvent(
-            trip_id=created_trip.id,
-            owner_id=owner_id,
-            title=dto.title,
-            destination=dto.destination
-        )
-        await self._event_bus.publish(trip_created_event)
+            trip_created_event = TripCreatedEvent(
+                trip_id=created_trip.id,
+                owner_id=owner_id,
+                title=dto.title,
+                destination=dto.destination
+            )
+            await self._event_bus.publish(trip_created_event)
 
-        member_joined_event = MemberJoinedEvent(
-            trip_id=created_trip.id,
-            user_id=owner_id,
-            role=owner_member.role
-        )
-        await self._event_bus.publish(member_joined_event)
+            member_joined_event = MemberJoinedEvent(
+                trip_id=created_trip.id,
+                user_id=owner_id,
+                role=owner_member.role
+            )
+            await self._event_bus.publish(member_joined_event)
 
         owner_user = await self._user_repository.find_by_id(owner_id)
         
@@ -4,6 +4,7 @@ from ...domain.interfaces.trip_repository import ITripRepository
 from ...domain.interfaces.trip_member_repository import ITripMemberRepository
 from shared.events.event_bus import EventBus
 from shared.errors.custom_errors import NotFoundError
+from shared.database.Connection import DatabaseConnection
 
 
 class DeleteTripUseCase:
@@ -27,14 +28,16 @@ class DeleteTripUseCase:
         await self._trip_service.validate_trip_deletion(trip, user_id)
 
         trip.soft_delete()
-        await self._trip_repository.update(trip)
+        # Cambio del agregado y eventos (outbox) en una sola transacción
+        async with DatabaseConnection.transaction():
+            await self._trip_repository.update(trip)
 
-        await self._trip_member_repository.delete_by_trip_id(trip_id)
+            await self._trip_member_repository.delete_by_trip_id(trip_id)
 
-        event = TripDeletedEvent(
-            trip_id=trip_id,
-            owner_id=trip.owner_id
-        )
-        await self._event_bus.publish(event)
+            event = TripDeletedEvent(
+                trip_id=trip_id,
+                owner_id=trip.owner_id
+            )
+            await self._event_bus.publish(event)
 
         return True
\ No newline at end of file
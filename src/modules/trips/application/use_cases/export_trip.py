@@ -4,6 +4,7 @@ from ...domain.interfaces.trip_member_repository import ITripMemberRepository
 from modules.users.domain.interfaces.IUserRepository import IUserRepository
 from ...infrastructure.services.trip_export_service import TripExportService
 from shared.errors.custom_errors import NotFoundError, ForbiddenError
+from shared.repositories.DataLoader import DataLoader
 
 
 class ExportTripUseCase:
@@ -12,12 +13,14 @@ class ExportTripUseCase:
         trip_repository: ITripRepository,
         trip_member_repository: ITripMemberRepository,
         user_repository: IUserRepository,
-        export_service: TripExportService
+        export_service: TripExportService,
+        user_loader: DataLoader
     ):
         self._trip_repository = trip_repository
         self._trip_member_repository = trip_member_repository
         self._user_repository = user_repository
         self._export_service = export_service
+        self._user_loader = user_loader
 
     async def execute(
         self, 
@@ -39,8 +42,9 @@ class ExportTripUseCase:
         if dto.include_members:
             members = await self._trip_member_repository.find_active_members_by_trip_id(trip_id)
             
-            for member in members:
-                user_info = await self._user_repository.find_by_id(member.user_id)
+            users = await self._user_loader.load_many([member.user_id for member in members])
+            
+            for member, user_info in zip(members, users):
                 if user_info:
                     user_data[member.user_id] = user_info.to_public_data()
 
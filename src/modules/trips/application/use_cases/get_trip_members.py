@@ -4,8 +4,9 @@ from ...domain.trip_service import TripService
 from ...domain.interfaces.trip_repository import ITripRepository
 from ...domain.interfaces.trip_member_repository import ITripMemberRepository
 from modules.users.domain.interfaces.IUserRepository import IUserRepository
-from shared.utils.pagination_utils import PaginatedResponse
+from shared.utils.pagination_utils import PaginatedResponse, PaginationUtils
 from shared.errors.custom_errors import NotFoundError, ForbiddenError
+from shared.repositories.DataLoader import DataLoader
 
 
 class GetTripMembersUseCase:
@@ -13,11 +14,13 @@ class GetTripMembersUseCase:
         self,
         trip_member_repository: ITripMemberRepository,
         user_repository: IUserRepository,
-        trip_service: TripService
+        trip_service: TripService,
+        user_loader: DataLoader
     ):
         self._trip_member_repository = trip_member_repository
         self._user_repository = user_repository
         self._trip_service = trip_service
+        self._user_loader = user_loader
 
     async def execute(
         self,
@@ -26,27 +29,31 @@ class GetTripMembersUseCase:
         filters: TripMemberFiltersDTO
     ) -> PaginatedResponse[TripMemberListResponseDTO]:
         page = (filters.offset // filters.limit) + 1
+        count_mode = PaginationUtils.validate_count_mode(filters.count_mode)
 
-        members, total = await self._trip_member_repository.find_by_trip_id(
-            trip_id, page, filters.limit
+        members, total, has_next = await self._trip_member_repository.find_by_trip_id(
+            trip_id, page, filters.limit, filters.cursor, count_mode
         )
 
         if not members:
             return PaginatedResponse(
                 data=[],
-                total=0,
+                total=total,
                 page=page,
                 limit=filters.limit,
-                total_pages=0
+                total_pages=0,
+                has_next=False,
+                cursor=filters.cursor
             )
 
         user_member = await self._trip_member_repository.find_by_trip_and_user(trip_id, user_id)
         can_edit_members = user_member.can_edit_trip() if user_member else False
 
+        users = await self._user_loader.load_many([member.user_id for member in members])
+
         member_responses: List[TripMemberListResponseDTO] = []
         
-        for member in members:
-            user_info = await self._user_repository.find_by_id(member.user_id)
+        for member, user_info in zip(members, users):
             if not user_info:
                 continue
 
@@ -61,12 +68,13 @@ class GetTripMembersUseCase:
             
             member_responses.append(member_response)
 
-        total_pages = (total + filters.limit - 1) // filters.limit
-
         return PaginatedResponse(
             data=member_responses,
             total=total,
             page=page,
             limit=filters.limit,
-            total_pages=total_pages
+            total_pages=0,
+            has_next=has_next,
+            cursor=filters.cursor,
+            next_cursor=PaginationUtils.build_next_cursor(members, "invited_at", has_next)
         )
\ No newline at end of file
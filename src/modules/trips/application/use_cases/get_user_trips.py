@@ -3,7 +3,7 @@ from ..dtos.trip_dto import TripFiltersDTO, TripListResponseDTO, TripDTOMapper
 from ...domain.interfaces.trip_repository import ITripRepository
 from ...domain.interfaces.trip_member_repository import ITripMemberRepository
 from ...domain.trip_service import TripService
-from shared.utils.pagination_utils import PaginatedResponse
+from shared.utils.pagination_utils import PaginatedResponse, PaginationUtils
 
 
 class GetUserTripsUseCase:
@@ -23,6 +23,7 @@ class GetUserTripsUseCase:
         filters: TripFiltersDTO
     ) -> PaginatedResponse[TripListResponseDTO]:
         page = (filters.offset // filters.limit) + 1
+        count_mode = PaginationUtils.validate_count_mode(filters.count_mode)
 
         filter_dict = {
             "owner_id": user_id,
@@ -37,38 +38,45 @@ class GetUserTripsUseCase:
 
         filter_dict = {k: v for k, v in filter_dict.items() if v is not None}
 
-        trips, total = await self._trip_repository.find_with_filters(
+        trips, total, has_next = await self._trip_repository.find_with_filters(
             filter_dict, 
             page, 
-            filters.limit
+            filters.limit,
+            filters.cursor,
+            count_mode
         )
 
         if not trips:
             return PaginatedResponse(
                 data=[],
-                total=0,
+                total=total,
                 page=page,
                 limit=filters.limit,
-                total_pages=0
+                total_pages=0,
+                has_next=False,
+                cursor=filters.cursor
             )
 
+        roles = await self._trip_service.get_user_roles_in_trips(
+            [trip.id for trip in trips], user_id
+        )
+
         trip_responses: List[TripListResponseDTO] = []
         
         for trip in trips:
-            user_role = await self._trip_service.get_user_role_in_trip(trip.id, user_id)
-            
             trip_response = TripDTOMapper.to_trip_list_response(
                 trip.to_public_data(),
-                user_role
+                roles.get(trip.id)
             )
             trip_responses.append(trip_response)
 
-        total_pages = (total + filters.limit - 1) // filters.limit
-
         return PaginatedResponse(
             data=trip_responses,
             total=total,
             page=page,
             limit=filters.limit,
-            total_pages=total_pages
+            total_pages=0,
+            has_next=has_next,
+            cursor=filters.cursor,
+            next_cursor=PaginationUtils.build_next_cursor(trips, "created_at", has_next)
         )
\ No newline at end of file
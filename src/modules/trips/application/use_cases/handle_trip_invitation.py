@@ -7,6 +7,7 @@ from ...domain.interfaces.trip_member_repository import ITripMemberRepository
 from modules.users.domain.interfaces.IUserRepository import IUserRepository
 from shared.events.event_bus import EventBus
 from shared.errors.custom_errors import NotFoundError, ValidationError
+from shared.database.Connection import DatabaseConnection
 
 
 class HandleTripInvitationUseCase:
@@ -55,38 +56,40 @@ class HandleTripInvitationUseCase:
             trip, user_id, member, f"{dto.action}_invitation"
         )
 
-        # Procesar según la acción
-        if dto.action == "accept":
-            member.accept_invitation()
+        # Cambio del agregado y eventos (outbox) en una sola transacción
+        async with DatabaseConnection.transaction():
+            # Procesar según la acción
+            if dto.action == "accept":
+                member.accept_invitation()
             
-            # Publicar eventos - USANDO PROPIEDADES
-            accepted_event = InvitationAcceptedEvent(
-                trip_id=trip_id,
-                user_id=user_id,
-                invitation_id=member.id
-            )
-            await self._event_bus.publish(accepted_event)
+                # Publicar eventos - USANDO PROPIEDADES
+                accepted_event = InvitationAcceptedEvent(
+                    trip_id=trip_id,
+                    user_id=user_id,
+                    invitation_id=member.id
+                )
+                await self._event_bus.publish(accepted_event)
 
-            joined_event = MemberJoinedEvent(
-                trip_id=trip_id,
-                user_id=user_id,
-                role=member.role
-            )
-            await self._event_bus.publish(joined_event)
+                joined_event = MemberJoinedEvent(
+                    trip_id=trip_id,
+                    user_id=user_id,
+                    role=member.role
+                )
+                await self._event_bus.publish(joined_event)
 
-        elif dto.action == "reject":
-            member.reject_invitation()
+            elif dto.action == "reject":
+                member.reject_invitation()
             
-            # Publicar evento - USANDO PROPIEDADES
-            rejected_event = InvitationRejectedEvent(
-                trip_id=trip_id,
-                user_id=user_id,
-                invitation_id=member.id
-            )
-            await self._event_bus.publish(rejected_event)
+                # Publicar evento - USANDO PROPIEDADES
+                rejected_event = InvitationRejectedEvent(
+                    trip_id=trip_id,
+                    user_id=user_id,
+                    invitation_id=member.id
+                )
+                await self._event_bus.publish(rejected_event)
 
-        # Actualizar en base de datos
-        updated_member = await self._trip_member_repository.update(member)
+            # Actualizar en base de datos
+            updated_member = await self._trip_member_repository.update(member)
 
         # Obtener información de usuarios para respuesta - USANDO PROPIEDADES
         user_info = await self._user_repository.find_by_id(member.user_id)
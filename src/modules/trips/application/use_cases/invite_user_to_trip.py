@@ -7,6 +7,7 @@ from ...domain.interfaces.trip_member_repository import ITripMemberRepository
 from modules.users.domain.interfaces.IUserRepository import IUserRepository
 from shared.events.event_bus import EventBus
 from shared.errors.custom_errors import NotFoundError
+from shared.database.Connection import DatabaseConnection
 
 
 class InviteUserToTripUseCase:
@@ -49,22 +50,24 @@ class InviteUserToTripUseCase:
             notes=dto.notes
         )
 
-        created_member = await self._trip_member_repository.create(trip_member)
+        # Cambio del agregado y eventos (outbox) en una sola transacción
+        async with DatabaseConnection.transaction():
+            created_member = await self._trip_member_repository.create(trip_member)
 
-        member_invited_event = MemberInvitedEvent(
-            trip_id=trip_id,
-            invited_user_id=dto.user_id,
-            invited_by=inviter_id,
-            role=dto.role.value
-        )
-        await self._event_bus.publish(member_invited_event)
+            member_invited_event = MemberInvitedEvent(
+                trip_id=trip_id,
+                invited_user_id=dto.user_id,
+                invited_by=inviter_id,
+                role=dto.role.value
+            )
+            await self._event_bus.publish(member_invited_event)
 
-        invitation_sent_event = InvitationSentEvent(
-            trip_id=trip_id,
-            invited_user_id=dto.user_id,
-            invited_by=inviter_id
-        )
-        await self._event_bus.publish(invitation_sent_event)
+            invitation_sent_event = InvitationSentEvent(
+                trip_id=trip_id,
+                invited_user_id=dto.user_id,
+                invited_by=inviter_id
+            )
+            await self._event_bus.publish(invitation_sent_event)
 
         invited_user = await self._user_repository.find_by_id(dto.user_id)
         inviter_user = await self._user_repository.find_by_id(inviter_id)
@@ -5,6 +5,7 @@ from ...domain.interfaces.trip_member_repository import ITripMemberRepository
 from modules.users.domain.interfaces.IUserRepository import IUserRepository
 from shared.events.event_bus import EventBus
 from shared.errors.custom_errors import NotFoundError
+from shared.database.Connection import DatabaseConnection
 
 
 class LeaveTripUseCase:
@@ -34,12 +35,14 @@ class LeaveTripUseCase:
         await self._trip_service.validate_member_action(trip, user_id, member, "leave_trip")
 
         member.leave_trip()
-        await self._trip_member_repository.update(member)
-
-        event = MemberLeftEvent(
-            trip_id=trip_id,
-            user_id=user_id
-        )
-        await self._event_bus.publish(event)
+        # Cambio del agregado y eventos (outbox) en una sola transacción
+        async with DatabaseConnection.transaction():
+            await self._trip_member_repository.update(member)
+
+            event = MemberLeftEvent(
+                trip_id=trip_id,
+                user_id=user_id
+            )
+            await self._event_bus.publish(event)
 
         return True
\ No newline at end of file
@@ -5,6 +5,7 @@ from ...domain.interfaces.trip_member_repository import ITripMemberRepository
 from modules.users.domain.interfaces.IUserRepository import IUserRepository
 from shared.events.event_bus import EventBus
 from shared.errors.custom_errors import NotFoundError
+from shared.database.Connection import DatabaseConnection
 
 
 class RemoveTripMemberUseCase:
@@ -34,13 +35,15 @@ class RemoveTripMemberUseCase:
         await self._trip_service.validate_member_action(trip, admin_user_id, member, "remove_member")
 
         member.remove_from_trip()
-        await self._trip_member_repository.update(member)
-
-        event = MemberRemovedEvent(
-            trip_id=trip_id,
-            removed_user_id=member.user_id,
-            removed_by=admin_user_id
-        )
-        await self._event_bus.publish(event)
+        # Cambio del agregado y eventos (outbox) en una sola transacción
+        async with DatabaseConnection.transaction():
+            await self._trip_member_repository.update(member)
+
+            event = MemberRemovedEvent(
+                trip_id=trip_id,
+                removed_user_id=member.user_id,
+                removed_by=admin_user_id
+            )
+            await self._event_bus.publish(event)
 
         return True
@@ -6,6 +6,7 @@ from ...domain.interfaces.trip_member_repository import ITripMemberRepository
 from modules.users.domain.interfaces.IUserRepository import IUserRepository
 from shared.events.event_bus import EventBus
 from shared.errors.custom_errors import NotFoundError
+from shared.database.Connection import DatabaseConnection
 
 
 class UpdateMemberRoleUseCase:
@@ -43,16 +44,18 @@ class UpdateMemberRoleUseCase:
         old_role = member.role
         member.change_role(dto.role)
 
-        updated_member = await self._trip_member_repository.update(member)
+        # Cambio del agregado y eventos (outbox) en una sola transacción
+        async with DatabaseConnection.transaction():
+            updated_member = await self._trip_member_repository.update(member)
 
-        event = MemberRoleChangedEvent(
-            trip_id=trip_id,
-            user_id=member.user_id,
-            old_role=old_role,
-            new_role=dto.role.value,
-            changed_by=admin_user_id
-        )
-        await self._event_bus.publish(event)
+            event = MemberRoleChangedEvent(
+                trip_id=trip_id,
+                user_id=member.user_id,
+                old_role=old_role,
+                new_role=dto.role.value,
+                changed_by=admin_user_id
+            )
+            await self._event_bus.publish(event)
 
         user_info = await self._user_repository.find_by_id(member.user_id)
         admin_info = await self._user_repository.find_by_id(admin_user_id)
@@ -7,6 +7,7 @@ from ...domain.interfaces.trip_member_repository import ITripMemberRepository
 from modules.users.domain.interfaces.IUserRepository import IUserRepository
 from shared.events.event_bus import EventBus
 from shared.errors.custom_errors import NotFoundError
+from shared.database.Connection import DatabaseConnection
 
 
 class UpdateTripUseCase:
@@ -71,15 +72,17 @@ class UpdateTripUseCase:
             notes=dto.notes
         )
 
-        updated_trip = await self._trip_repository.update(trip)
+        # Cambio del agregado y eventos (outbox) en una sola transacción
+        async with DatabaseConnection.transaction():
+            updated_trip = await self._trip_repository.update(trip)
 
-        event = TripUpdatedEvent(
-            trip_id=trip_id,
-            owner_id=trip.owner_id,
-            updated_by=user_id,
-            updated_fields=list(update_dict.keys())
-        )
-        await self._event_bus.publish(event)
+            event = TripUpdatedEvent(
+                trip_id=trip_id,
+                owner_id=trip.owner_id,
+                updated_by=user_id,
+                updated_fields=list(update_dict.keys())
+            )
+            await self._event_bus.publish(event)
 
         user_role = await self._trip_service.get_user_role_in_trip(trip_id, user_id)
         member = await self._trip_member_repository.find_by_trip_and_user(trip_id, user_id)
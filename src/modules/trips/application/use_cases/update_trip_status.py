@@ -7,6 +7,7 @@ from ...domain.interfaces.trip_member_repository import ITripMemberRepository
 from modules.users.domain.interfaces.IUserRepository import IUserRepository
 from shared.events.event_bus import EventBus
 from shared.errors.custom_errors import NotFoundError
+from shared.database.Connection import DatabaseConnection
 
 
 class UpdateTripStatusUseCase:
@@ -39,28 +40,30 @@ class UpdateTripStatusUseCase:
         old_status = trip.status
         trip.change_status(dto.status)
 
-        updated_trip = await self._trip_repository.update(trip)
+        # Cambio del agregado y eventos (outbox) en una sola transacción
+        async with DatabaseConnection.transaction():
+            updated_trip = await self._trip_repository.update(trip)
 
-        status_changed_event = TripStatusChangedEvent(
-            trip_id=trip_id,
-            owner_id=trip.owner_id,
-            old_status=old_status,
-            new_status=dto.status.value
-        )
-        await self._event_bus.publish(status_changed_event)
-
-        if dto.status.value == "completed":
-            completed_event = TripCompletedEvent(
-                trip_id=trip_id,
-                owner_id=trip.owner_id
-            )
-            await self._event_bus.publish(completed_event)
-        elif dto.status.value == "cancelled":
-            cancelled_event = TripCancelledEvent(
+            status_changed_event = TripStatusChangedEvent(
                 trip_id=trip_id,
-                owner_id=trip.owner_id
+                owner_id=trip.owner_id,
+                old_status=old_status,
+                new_status=dto.status.value
             )
-            await self._event_bus.publish(cancelled_event)
+            await self._event_bus.publish(status_changed_event)
+
+            if dto.status.value == "completed":
+                completed_event = TripCompletedEvent(
+                    trip_id=trip_id,
+                    owner_id=trip.owner_id
+                )
+                await self._event_bus.publish(completed_event)
+            elif dto.status.value == "cancelled":
+                cancelled_event = TripCancelledEvent(
+                    trip_id=trip_id,
+                    owner_id=trip.owner_id
+                )
+                await self._event_bus.publish(cancelled_event)
 
         user_role = await self._trip_service.get_user_role_in_trip(trip_id, user_id)
         member = await self._trip_member_repository.find_by_trip_and_user(trip_id, user_id)
@@ -13,6 +13,10 @@ class ITripMemberRepository(ABC):
     async def find_by_id(self, member_id: str) -> Optional[TripMember]:
         pass
 
+    @abstractmethod
+    async def find_by_ids(self, member_ids: List[str]) -> List[TripMember]:
+        pass
+
     @abstractmethod
     async def update(self, trip_member: TripMember) -> TripMember:
         pass
@@ -26,8 +30,10 @@ class ITripMemberRepository(ABC):
         self, 
         trip_id: str, 
         page: int = 1, 
-        limit: int = 50
-    ) -> tuple[List[TripMember], int]:
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        count_mode: str = "exact"
+    ) -> tuple[List[TripMember], Optional[int], bool]:
         pass
 
     @abstractmethod
@@ -75,6 +81,10 @@ class ITripMemberRepository(ABC):
     ) -> Optional[TripMember]:
         pass
 
+    @abstractmethod
+    async def find_roles_for_user(self, user_id: str, trip_ids: List[str]) -> Dict[str, str]:
+        pass
+
     @abstractmethod
     async def find_by_trip_and_role(self, trip_id: str, role: str) -> List[TripMember]:
         pass
@@ -14,6 +14,10 @@ class ITripRepository(ABC):
     async def find_by_id(self, trip_id: str) -> Optional[Trip]:
         pass
 
+    @abstractmethod
+    async def find_by_ids(self, trip_ids: List[str]) -> List[Trip]:
+        pass
+
     @abstractmethod
     async def update(self, trip: Trip) -> Trip:
         pass
@@ -28,8 +32,10 @@ class ITripRepository(ABC):
         owner_id: str, 
         page: int = 1, 
         limit: int = 20,
-        filters: Optional[Dict[str, Any]] = None
-    ) -> tuple[List[Trip], int]:
+        filters: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        count_mode: str = "exact"
+    ) -> tuple[List[Trip], Optional[int], bool]:
         pass
 
     @abstractmethod
@@ -78,8 +84,10 @@ class ITripRepository(ABC):
         self, 
         filters: Dict[str, Any], 
         page: int = 1, 
-        limit: int = 20
-    ) -> tuple[List[Trip], int]:
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        count_mode: str = "exact"
+    ) -> tuple[List[Trip], Optional[int], bool]:
         pass
 
     @abstractmethod
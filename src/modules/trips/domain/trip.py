@@ -285,4 +285,8 @@ class Trip:
 
     @property
     def end_date(self) -> datetime:
-        return self._end_date
\ No newline at end of file
+        return self._end_date
+
+    @property
+    def created_at(self) -> datetime:
+        return self._created_at
@@ -0,0 +1,136 @@
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+from .trip_events import TRIP_EVENT_TYPES
+
+
+class TripMemberCache:
+    """Caché en memoria de la membresía de un usuario en un viaje.
+
+    Guarda el documento de membresía por (trip_id, user_id) para que las
+    comprobaciones de acceso y rol de cada petición no vayan a la base de
+    datos. Cada entrada expira tras ttl_seconds; el repositorio la invalida al
+    escribir y los eventos de miembros la invalidan de nuevo tras el commit.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        self._max_entries = max_entries or int(os.getenv("TRIP_MEMBER_CACHE_MAX_ENTRIES", "50000"))
+        self._ttl_seconds = ttl_seconds or float(os.getenv("TRIP_MEMBER_CACHE_TTL_SECONDS", "60"))
+
+        # (trip_id, user_id) -> (expira_en, documento)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._users_by_trip: Dict[str, Set[str]] = {}
+        # Se incrementa con cada invalidación; ver snapshot()/put()
+        self._epoch = 0
+        self._hits = 0
+        self._misses = 0
+
+    def snapshot(self) -> int:
+        """Marca a pasar a put() para descartar cargas que compitieron con un cambio"""
+        return self._epoch
+
+    def get(self, trip_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+        """Copia del documento de membresía, o None si no está en caché"""
+        key = (trip_id, user_id)
+        entry = self._entries.get(key)
+
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                self._remove(key)
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return dict(entry[1])
+
+    def put(self, document: Dict[str, Any], snapshot: int) -> None:
+        """Guardar un documento leído de la base de datos si nadie lo invalidó desde snapshot"""
+        if snapshot != self._epoch:
+            return
+
+        key = (document["trip_id"], document["user_id"])
+        self._entries[key] = (time.monotonic() + self._ttl_seconds, dict(document))
+        self._entries.move_to_end(key)
+        self._users_by_trip.setdefault(key[0], set()).add(key[1])
+
+        while len(self._entries) > self._max_entries:
+            oldest, _ = self._entries.popitem(last=False)
+            self._forget(oldest)
+
+    def invalidate(self, trip_id: str, user_id: str) -> None:
+        self._epoch += 1
+        self._remove((trip_id, user_id))
+
+    def invalidate_trip(self, trip_id: str) -> None:
+        """Descartar todas las membresías cacheadas de un viaje"""
+        self._epoch += 1
+        for user_id in self._users_by_trip.pop(trip_id, set()):
+            self._entries.pop((trip_id, user_id), None)
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Descartar todas las membresías cacheadas de un usuario"""
+        self._epoch += 1
+        for key in [key for key in self._entries if key[1] == user_id]:
+            self._remove(key)
+
+    def clear(self) -> None:
+        self._epoch += 1
+        self._entries.clear()
+        self._users_by_trip.clear()
+
+    async def on_member_changed(self, event) -> None:
+        user_id = (
+            getattr(event, "removed_user_id", None)
+            or getattr(event, "invited_user_id", None)
+            or getattr(event, "cancelled_user_id", None)
+            or event.user_id
+        )
+        if user_id:
+            self.invalidate(event.trip_id, user_id)
+        else:
+            self.invalidate_trip(event.trip_id)
+
+    async def on_trip_deleted(self, event) -> None:
+        self.invalidate_trip(event.trip_id)
+
+    def register_handlers(self, event_bus) -> None:
+        """Invalidar con los eventos de miembros.
+
+        Se suscriben como no críticos: con el outbox activo el relay los
+        entrega después del commit, cerrando la ventana en la que otra petición
+        pudo recargar la membresía anterior antes de confirmarse el cambio.
+        """
+        for event_key in (
+            "MEMBER_INVITED",
+            "MEMBER_JOINED",
+            "MEMBER_LEFT",
+            "MEMBER_REMOVED",
+            "MEMBER_ROLE_CHANGED",
+            "INVITATION_ACCEPTED",
+            "INVITATION_REJECTED",
+            "INVITATION_CANCELLED"
+        ):
+            event_bus.subscribe(TRIP_EVENT_TYPES[event_key], self.on_member_changed)
+        event_bus.subscribe(TRIP_EVENT_TYPES["TRIP_DELETED"], self.on_trip_deleted)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "ttl_seconds": self._ttl_seconds,
+            "hits": self._hits,
+            "misses": self._misses
+        }
+
+    def _remove(self, key: Tuple[str, str]) -> None:
+        if self._entries.pop(key, None) is not None:
+            self._forget(key)
+
+    def _forget(self, key: Tuple[str, str]) -> None:
+        users = self._users_by_trip.get(key[0])
+        if users is not None:
+            users.discard(key[1])
+            if not users:
+                del self._users_by_trip[key[0]]
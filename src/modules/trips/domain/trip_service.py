@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 from .trip import Trip, TripStatus
 from .trip_member import TripMember, TripMemberRole, TripMemberStatus
@@ -162,6 +162,10 @@ class TripService:
         member = await self._trip_member_repository.find_by_trip_and_user(trip_id, user_id)
         return member.role if member and member.is_active() else None
 
+    async def get_user_roles_in_trips(self, trip_ids: List[str], user_id: str) -> Dict[str, Optional[str]]:
+        roles = await self._trip_member_repository.find_roles_for_user(user_id, trip_ids)
+        return {trip_id: roles.get(trip_id) for trip_id in trip_ids}
+
     async def suggest_similar_destinations(self, destination: str, user_id: str, limit: int = 5) -> List[str]:
         user_trips = await self._trip_repository.find_active_by_owner_id(user_id)
         destinations = [trip.destination for trip in user_trips if trip.destination != destination]
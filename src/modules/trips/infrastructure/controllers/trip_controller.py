@@ -64,7 +64,9 @@ class TripController:
         is_group_trip: Optional[bool] = None,
         destination: Optional[str] = None,
         limit: int = 20,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        count_mode: str = "exact"
     ) -> PaginatedResponse[TripListResponseDTO]:
         """Obtener viajes del usuario con filtros"""
         try:
@@ -74,7 +76,9 @@ class TripController:
                 is_group_trip=is_group_trip,
                 destination=destination,
                 limit=limit,
-                offset=offset
+                offset=offset,
+                cursor=cursor,
+                count_mode=count_mode
             )
             
             result = await self._get_user_trips_use_case.execute(
@@ -83,6 +87,8 @@ class TripController:
             )
             return result
             
+        except ValidationError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error interno: {str(e)}")
 
@@ -217,7 +223,9 @@ class TripController:
         trip_id: str,
         current_user: dict,
         limit: int = 20,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        count_mode: str = "exact"
     ) -> PaginatedResponse[TripMemberListResponseDTO]:
         """Obtener miembros del viaje"""
         try:
@@ -231,7 +239,9 @@ class TripController:
             # Crear filtros DTO con limit y offset
             filters = TripMemberFiltersDTO(
                 limit=limit,
-                offset=offset
+                offset=offset,
+                cursor=cursor,
+                count_mode=count_mode
             )
 
             result = await self._get_trip_members_use_case.execute(
@@ -244,6 +254,8 @@ class TripController:
             raise HTTPException(status_code=404, detail=str(e))
         except ForbiddenError as e:
             raise HTTPException(status_code=403, detail=str(e))
+        except ValidationError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error interno: {str(e)}")
 
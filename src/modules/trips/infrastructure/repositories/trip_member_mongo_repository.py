@@ -2,18 +2,30 @@
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import IndexModel, ASCENDING, ReturnDocument
 from bson import ObjectId
 
 from ...domain.trip_member import TripMember, TripMemberData, TripMemberRole, TripMemberStatus
 from ...domain.interfaces.trip_member_repository import ITripMemberRepository
+from ...domain.trip_member_cache import TripMemberCache
 from shared.database.Connection import DatabaseConnection
 from shared.errors.custom_errors import DatabaseError
+from shared.utils.pagination_utils import PaginationUtils
 
 
 class TripMemberMongoRepository(ITripMemberRepository):
-    def __init__(self):
+    COLLECTION_NAME = "trip_members"
+    INDEXES = [
+        IndexModel([("trip_id", ASCENDING), ("user_id", ASCENDING)]),
+        IndexModel([("user_id", ASCENDING), ("status", ASCENDING)]),
+        IndexModel([("trip_id", ASCENDING), ("status", ASCENDING), ("joined_at", ASCENDING)]),
+        IndexModel([("trip_id", ASCENDING), ("invited_at", ASCENDING), ("_id", ASCENDING)])
+    ]
+
+    def __init__(self, member_cache: Optional[TripMemberCache] = None):
         self._db_connection = DatabaseConnection()
-        self._collection_name = "trip_members"
+        self._collection_name = self.COLLECTION_NAME
+        self._member_cache = member_cache
 
     async def _get_collection(self) -> AsyncIOMotorCollection:
         """Obtener colección de miembros de viaje"""
@@ -59,14 +71,43 @@ class TripMemberMongoRepository(ITripMemberRepository):
         
         return TripMember.from_data(member_data)
 
+    async def _find_member_document(self, trip_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+        """Documento de membresía de un usuario en un viaje (con caché fuera de transacciones)"""
+        # Dentro de una transacción se lee siempre de la base de datos: lo leído
+        # puede no estar confirmado todavía
+        use_cache = self._member_cache is not None and DatabaseConnection.current_session() is None
+
+        if use_cache:
+            document = self._member_cache.get(trip_id, user_id)
+            if document is not None:
+                return document
+            snapshot = self._member_cache.snapshot()
+
+        collection = await self._get_collection()
+        document = await collection.find_one({
+            "trip_id": trip_id,
+            "user_id": user_id,
+            "is_deleted": {"$ne": True}
+        })
+
+        if document and use_cache:
+            self._member_cache.put(document, snapshot)
+
+        return document
+
+    def _invalidate_member(self, trip_id: str, user_id: str) -> None:
+        if self._member_cache is not None:
+            self._member_cache.invalidate(trip_id, user_id)
+
     async def create(self, trip_member: TripMember) -> TripMember:
         """Crear nuevo miembro de viaje"""
         try:
             collection = await self._get_collection()
             member_data = self._member_to_document(trip_member.to_public_data())
             
-            result = await collection.insert_one(member_data)
+            result = await collection.insert_one(member_data, session=DatabaseConnection.current_session())
             member_data["_id"] = result.inserted_id
+            self._invalidate_member(trip_member.trip_id, trip_member.user_id)
             
             return self._document_to_member(member_data)
             
@@ -87,6 +128,24 @@ class TripMemberMongoRepository(ITripMemberRepository):
         except Exception as error:
             raise DatabaseError(f"Error buscando miembro por ID: {str(error)}")
 
+    async def find_by_ids(self, member_ids: List[str]) -> List[TripMember]:
+        """Buscar varios miembros por ID en una sola consulta"""
+        try:
+            if not member_ids:
+                return []
+
+            collection = await self._get_collection()
+            cursor = collection.find({
+                "_id": {"$in": list(member_ids)},
+                "is_deleted": {"$ne": True}
+            })
+            documents = await cursor.to_list(length=None)
+            
+            return [self._document_to_member(doc) for doc in documents]
+            
+        except Exception as error:
+            raise DatabaseError(f"Error buscando miembros por IDs: {str(error)}")
+
     async def update(self, trip_member: TripMember) -> TripMember:
         """Actualizar miembro de viaje"""
         try:
@@ -96,8 +155,10 @@ class TripMemberMongoRepository(ITripMemberRepository):
             
             await collection.update_one(
                 {"_id": trip_member.id},
-                {"$set": member_data}
+                {"$set": member_data},
+                session=DatabaseConnection.current_session()
             )
+            self._invalidate_member(trip_member.trip_id, trip_member.user_id)
             
             return trip_member
             
@@ -108,12 +169,18 @@ class TripMemberMongoRepository(ITripMemberRepository):
         """Eliminar miembro (soft delete)"""
         try:
             collection = await self._get_collection()
-            result = await collection.update_one(
+            previous = await collection.find_one_and_update(
                 {"_id": member_id},
-                {"$set": {"is_deleted": True}}
+                {"$set": {"is_deleted": True}},
+                projection={"trip_id": 1, "user_id": 1, "is_deleted": 1},
+                return_document=ReturnDocument.BEFORE,
+                session=DatabaseConnection.current_session()
             )
-            
-            return result.modified_count > 0
+            if previous is None:
+                return False
+
+            self._invalidate_member(previous["trip_id"], previous["user_id"])
+            return not previous.get("is_deleted", False)
             
         except Exception as error:
             raise DatabaseError(f"Error eliminando miembro: {str(error)}")
@@ -122,9 +189,13 @@ class TripMemberMongoRepository(ITripMemberRepository):
         self, 
         trip_id: str, 
         page: int = 1, 
-        limit: int = 50
-    ) -> tuple[List[TripMember], int]:
-        """Buscar miembros por ID de viaje"""
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        count_mode: str = PaginationUtils.COUNT_EXACT
+    ) -> tuple[List[TripMember], Optional[int], bool]:
+        """Buscar miembros por ID de viaje (por página o por cursor keyset)"""
+        keyset = PaginationUtils.build_keyset_filter("invited_at", 1, cursor)
+
         try:
             collection = await self._get_collection()
             query = {
@@ -132,15 +203,22 @@ class TripMemberMongoRepository(ITripMemberRepository):
                 "is_deleted": {"$ne": True}
             }
             
-            skip = (page - 1) * limit
-            
-            cursor = collection.find(query).sort("invited_at", 1).skip(skip).limit(limit)
-            documents = await cursor.to_list(length=limit)
+            sort = [("invited_at", 1), ("_id", 1)]
+
+            # Se pide limit+1 para saber si hay página siguiente sin contar
+            if keyset:
+                cursor = collection.find({"$and": [query, keyset]}).sort(sort).limit(limit + 1)
+            else:
+                skip = (page - 1) * limit
+                cursor = collection.find(query).sort(sort).skip(skip).limit(limit + 1)
+
+            documents = await cursor.to_list(length=limit + 1)
+            documents, has_next = PaginationUtils.split_page(documents, limit)
             
-            total = await collection.count_documents(query)
+            total = await PaginationUtils.count_documents(collection, query, count_mode)
             
             members = [self._document_to_member(doc) for doc in documents]
-            return members, total
+            return members, total, has_next
             
         except Exception as error:
             raise DatabaseError(f"Error buscando miembros por viaje: {str(error)}")
@@ -304,18 +382,35 @@ class TripMemberMongoRepository(ITripMemberRepository):
     ) -> Optional[TripMember]:
         """Buscar miembro específico por viaje y usuario"""
         try:
-            collection = await self._get_collection()
-            document = await collection.find_one({
-                "trip_id": trip_id,
-                "user_id": user_id,
-                "is_deleted": {"$ne": True}
-            })
-            
+            document = await self._find_member_document(trip_id, user_id)
             return self._document_to_member(document) if document else None
             
         except Exception as error:
             raise DatabaseError(f"Error buscando miembro específico: {str(error)}")
 
+    async def find_roles_for_user(self, user_id: str, trip_ids: List[str]) -> Dict[str, str]:
+        """Obtener el rol activo del usuario en varios viajes con una sola consulta"""
+        try:
+            if not trip_ids:
+                return {}
+
+            collection = await self._get_collection()
+            cursor = collection.find(
+                {
+                    "user_id": user_id,
+                    "trip_id": {"$in": list(trip_ids)},
+                    "status": TripMemberStatus.ACCEPTED.value,
+                    "is_deleted": {"$ne": True}
+                },
+                {"trip_id": 1, "role": 1}
+            )
+            documents = await cursor.to_list(length=None)
+
+            return {doc["trip_id"]: doc["role"] for doc in documents}
+
+        except Exception as error:
+            raise DatabaseError(f"Error obteniendo roles del usuario: {str(error)}")
+
     async def find_by_trip_and_role(self, trip_id: str, role: str) -> List[TripMember]:
         """Buscar miembros por viaje y rol"""
         try:
@@ -355,14 +450,7 @@ class TripMemberMongoRepository(ITripMemberRepository):
     async def exists_by_trip_and_user(self, trip_id: str, user_id: str) -> bool:
         """Verificar si existe membresía específica"""
         try:
-            collection = await self._get_collection()
-            count = await collection.count_documents({
-                "trip_id": trip_id,
-                "user_id": user_id,
-                "is_deleted": {"$ne": True}
-            })
-            
-            return count > 0
+            return await self._find_member_document(trip_id, user_id) is not None
             
         except Exception:
             return False
@@ -370,15 +458,8 @@ class TripMemberMongoRepository(ITripMemberRepository):
     async def is_user_member_of_trip(self, trip_id: str, user_id: str) -> bool:
         """Verificar si usuario es miembro activo del viaje"""
         try:
-            collection = await self._get_collection()
-            count = await collection.count_documents({
-                "trip_id": trip_id,
-                "user_id": user_id,
-                "status": TripMemberStatus.ACCEPTED.value,
-                "is_deleted": {"$ne": True}
-            })
-            
-            return count > 0
+            document = await self._find_member_document(trip_id, user_id)
+            return document is not None and document["status"] == TripMemberStatus.ACCEPTED.value
             
         except Exception:
             return False
@@ -386,15 +467,8 @@ class TripMemberMongoRepository(ITripMemberRepository):
     async def is_user_owner_of_trip(self, trip_id: str, user_id: str) -> bool:
         """Verificar si usuario es propietario del viaje"""
         try:
-            collection = await self._get_collection()
-            count = await collection.count_documents({
-                "trip_id": trip_id,
-                "user_id": user_id,
-                "role": TripMemberRole.OWNER.value,
-                "is_deleted": {"$ne": True}
-            })
-            
-            return count > 0
+            document = await self._find_member_document(trip_id, user_id)
+            return document is not None and document["role"] == TripMemberRole.OWNER.value
             
         except Exception:
             return False
@@ -402,16 +476,12 @@ class TripMemberMongoRepository(ITripMemberRepository):
     async def is_user_admin_of_trip(self, trip_id: str, user_id: str) -> bool:
         """Verificar si usuario es administrador del viaje"""
         try:
-            collection = await self._get_collection()
-            count = await collection.count_documents({
-                "trip_id": trip_id,
-                "user_id": user_id,
-                "role": {"$in": [TripMemberRole.OWNER.value, TripMemberRole.ADMIN.value]},
-                "status": TripMemberStatus.ACCEPTED.value,
-                "is_deleted": {"$ne": True}
-            })
-            
-            return count > 0
+            document = await self._find_member_document(trip_id, user_id)
+            return (
+                document is not None
+                and document["role"] in (TripMemberRole.OWNER.value, TripMemberRole.ADMIN.value)
+                and document["status"] == TripMemberStatus.ACCEPTED.value
+            )
             
         except Exception:
             return False
@@ -419,15 +489,10 @@ class TripMemberMongoRepository(ITripMemberRepository):
     async def can_user_access_trip(self, trip_id: str, user_id: str) -> bool:
         """Verificar si usuario puede acceder al viaje"""
         try:
-            collection = await self._get_collection()
-            count = await collection.count_documents({
-                "trip_id": trip_id,
-                "user_id": user_id,
-                "status": {"$in": [TripMemberStatus.ACCEPTED.value, TripMemberStatus.PENDING.value]},
-                "is_deleted": {"$ne": True}
-            })
-            
-            return count > 0
+            document = await self._find_member_document(trip_id, user_id)
+            return document is not None and document["status"] in (
+                TripMemberStatus.ACCEPTED.value, TripMemberStatus.PENDING.value
+            )
             
         except Exception:
             return False
@@ -489,8 +554,11 @@ class TripMemberMongoRepository(ITripMemberRepository):
             collection = await self._get_collection()
             result = await collection.update_many(
                 {"trip_id": trip_id},
-                {"$set": {"is_deleted": True}}
+                {"$set": {"is_deleted": True}},
+                session=DatabaseConnection.current_session()
             )
+            if self._member_cache is not None:
+                self._member_cache.invalidate_trip(trip_id)
             
             return result.modified_count > 0
             
@@ -503,8 +571,11 @@ class TripMemberMongoRepository(ITripMemberRepository):
             collection = await self._get_collection()
             result = await collection.update_many(
                 {"user_id": user_id},
-                {"$set": {"is_deleted": True}}
+                {"$set": {"is_deleted": True}},
+                session=DatabaseConnection.current_session()
             )
+            if self._member_cache is not None:
+                self._member_cache.invalidate_user(user_id)
             
             return result.modified_count > 0
             
@@ -520,7 +591,9 @@ class TripMemberMongoRepository(ITripMemberRepository):
             result = await collection.delete_many({
                 "status": TripMemberStatus.REJECTED.value,
                 "invited_at": {"$lt": cutoff_date}
-            })
+            }, session=DatabaseConnection.current_session())
+            if result.deleted_count and self._member_cache is not None:
+                self._member_cache.clear()
             
             return result.deleted_count
             
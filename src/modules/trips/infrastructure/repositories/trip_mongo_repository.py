@@ -2,23 +2,83 @@
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import IndexModel, ASCENDING, DESCENDING
 from bson import ObjectId
 from ...domain.trip import Trip, TripData, TripStatus
+from ...domain.trip_member import TripMemberStatus
 from ...domain.interfaces.trip_repository import ITripRepository
 from shared.database.Connection import DatabaseConnection
 from shared.errors.custom_errors import DatabaseError
+from shared.utils.pagination_utils import PaginationUtils
+from .trip_member_mongo_repository import TripMemberMongoRepository
 
 
 class TripMongoRepository(ITripRepository):
+    COLLECTION_NAME = "trips"
+    INDEXES = [
+        IndexModel([("owner_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+        IndexModel([
+            ("owner_id", ASCENDING), ("status", ASCENDING),
+            ("created_at", DESCENDING), ("_id", DESCENDING)
+        ]),
+        IndexModel([("is_public", ASCENDING), ("created_at", DESCENDING)])
+    ]
+
     def __init__(self):
         self._db_connection = DatabaseConnection()
-        self._collection_name = "trips"
+        self._collection_name = self.COLLECTION_NAME
 
     async def _get_collection(self) -> AsyncIOMotorCollection:
         """Obtener colección de viajes"""
         database = self._db_connection.get_database()
         return database[self._collection_name]
 
+    async def _find_page(
+        self,
+        collection: AsyncIOMotorCollection,
+        query: Dict[str, Any],
+        keyset: Optional[Dict[str, Any]],
+        page: int,
+        limit: int
+    ) -> tuple[List[Dict[str, Any]], bool]:
+        """Obtener una página ordenada por created_at DESC; con keyset no se usa skip.
+        Se pide limit+1 para saber si hay página siguiente sin contar."""
+        sort = [("created_at", -1), ("_id", -1)]
+
+        if keyset:
+            cursor = collection.find({"$and": [query, keyset]}).sort(sort).limit(limit + 1)
+        else:
+            cursor = collection.find(query).sort(sort).skip((page - 1) * limit).limit(limit + 1)
+
+        documents = await cursor.to_list(length=limit + 1)
+        return PaginationUtils.split_page(documents, limit)
+
+    async def _build_participation_query(
+        self,
+        user_id: str,
+        member_statuses: List[str]
+    ) -> Dict[str, Any]:
+        """Filtro de viajes donde el usuario es owner o miembro con alguno de los estados.
+
+        Resuelve primero los trip_id del usuario en trip_members (índice user_id + status)
+        y luego filtra viajes por _id $in, en vez de hacer $lookup sobre todos los viajes.
+        """
+        members_collection = self._db_connection.get_database()[TripMemberMongoRepository.COLLECTION_NAME]
+
+        trip_ids = await members_collection.distinct("trip_id", {
+            "user_id": user_id,
+            "status": {"$in": member_statuses},
+            "is_deleted": {"$ne": True}
+        })
+
+        return {
+            "is_deleted": {"$ne": True},
+            "$or": [
+                {"owner_id": user_id},
+                {"_id": {"$in": trip_ids}}
+            ]
+        }
+
     def _document_to_trip(self, document: Dict[str, Any]) -> Trip:
         """Convertir documento MongoDB a entidad Trip"""
         if not document:
@@ -79,7 +139,7 @@ class TripMongoRepository(ITripRepository):
             collection = await self._get_collection()
             document = self._trip_to_document(trip.to_public_data())
             
-            await collection.insert_one(document)
+            await collection.insert_one(document, session=DatabaseConnection.current_session())
             return trip
             
         except Exception as error:
@@ -94,7 +154,8 @@ class TripMongoRepository(ITripRepository):
             
             await collection.update_one(
                 {"_id": trip.id},
-                {"$set": document}
+                {"$set": document},
+                session=DatabaseConnection.current_session()
             )
             return trip
             
@@ -115,14 +176,36 @@ class TripMongoRepository(ITripRepository):
         except Exception as error:
             raise DatabaseError(f"Error buscando viaje por ID: {str(error)}")
 
+    async def find_by_ids(self, trip_ids: List[str]) -> List[Trip]:
+        """Buscar varios viajes por ID en una sola consulta"""
+        try:
+            if not trip_ids:
+                return []
+
+            collection = await self._get_collection()
+            cursor = collection.find({
+                "_id": {"$in": list(trip_ids)},
+                "is_deleted": {"$ne": True}
+            })
+            documents = await cursor.to_list(length=None)
+            
+            return [self._document_to_trip(doc) for doc in documents if doc]
+            
+        except Exception as error:
+            raise DatabaseError(f"Error buscando viajes por IDs: {str(error)}")
+
     async def find_by_owner_id(
         self, 
         owner_id: str, 
         page: int = 1, 
         limit: int = 20,
-        status: Optional[str] = None
-    ) -> tuple[List[Trip], int]:
-        """Buscar viajes por propietario"""
+        status: Optional[str] = None,
+        cursor: Optional[str] = None,
+        count_mode: str = PaginationUtils.COUNT_EXACT
+    ) -> tuple[List[Trip], Optional[int], bool]:
+        """Buscar viajes por propietario (por página o por cursor keyset)"""
+        keyset = PaginationUtils.build_keyset_filter("created_at", -1, cursor)
+
         try:
             collection = await self._get_collection()
             
@@ -134,18 +217,15 @@ class TripMongoRepository(ITripRepository):
             if status:
                 query["status"] = status
             
-            skip = (page - 1) * limit
-            
-            # Contar total de documentos
-            total = await collection.count_documents(query)
+            # Contar total de documentos (cacheado / estimado / omitido)
+            total = await PaginationUtils.count_documents(collection, query, count_mode)
             
             # Obtener viajes paginados
-            cursor = collection.find(query).skip(skip).limit(limit).sort("created_at", -1)
-            documents = await cursor.to_list(length=limit)
+            documents, has_next = await self._find_page(collection, query, keyset, page, limit)
             
             trips = [self._document_to_trip(doc) for doc in documents if doc]
             
-            return trips, total
+            return trips, total, has_next
             
         except Exception as error:
             raise DatabaseError(f"Error buscando viajes por propietario: {str(error)}")
@@ -155,78 +235,38 @@ class TripMongoRepository(ITripRepository):
         user_id: str,
         page: int = 1,
         limit: int = 20,
-        filters: Optional[Dict[str, Any]] = None
-    ) -> tuple[List[Trip], int]:
+        filters: Optional[Dict[str, Any]] = None,
+        count_mode: str = PaginationUtils.COUNT_EXACT
+    ) -> tuple[List[Trip], Optional[int], bool]:
         """Buscar viajes donde el usuario participa (como owner o miembro)"""
         try:
             collection = await self._get_collection()
             
-            # Pipeline de agregación para unir con trip_members
-            pipeline = [
-                {
-                    "$lookup": {
-                        "from": "trip_members",
-                        "localField": "_id",
-                        "foreignField": "trip_id",
-                        "as": "members"
-                    }
-                },
-                {
-                    "$match": {
-                        "$and": [
-                            {"is_deleted": {"$ne": True}},
-                            {
-                                "$or": [
-                                    {"owner_id": user_id},
-                                    {
-                                        "members": {
-                                            "$elemMatch": {
-                                                "user_id": user_id,
-                                                "status": {"$in": ["pending", "accepted"]},
-                                                "is_deleted": {"$ne": True}
-                                            }
-                                        }
-                                    }
-                                ]
-                            }
-                        ]
-                    }
-                }
-            ]
+            # Partir de las membresías del usuario en lugar de unir trip_members a cada viaje
+            query = await self._build_participation_query(
+                user_id,
+                [TripMemberStatus.PENDING.value, TripMemberStatus.ACCEPTED.value]
+            )
             
             # Aplicar filtros adicionales si se proporcionan
             if filters:
-                additional_match = {}
                 if filters.get("status"):
-                    additional_match["status"] = filters["status"]
+                    query["status"] = filters["status"]
                 if filters.get("category"):
-                    additional_match["category"] = filters["category"]
+                    query["category"] = filters["category"]
                 if filters.get("is_group_trip") is not None:
-                    additional_match["is_group_trip"] = filters["is_group_trip"]
+                    query["is_group_trip"] = filters["is_group_trip"]
                 if filters.get("destination"):
-                    additional_match["destination"] = {"$regex": filters["destination"], "$options": "i"}
-                
-                if additional_match:
-                    pipeline.append({"$match": additional_match})
+                    query["destination"] = {"$regex": filters["destination"], "$options": "i"}
             
-            # Contar total
-            count_pipeline = pipeline + [{"$count": "total"}]
-            count_result = await collection.aggregate(count_pipeline).to_list(1)
-            total = count_result[0]["total"] if count_result else 0
+            # Contar total (cacheado / estimado / omitido)
+            total = await PaginationUtils.count_documents(collection, query, count_mode)
             
             # Obtener resultados paginados
-            skip = (page - 1) * limit
-            pipeline.extend([
-                {"$sort": {"created_at": -1}},
-                {"$skip": skip},
-                {"$limit": limit},
-                {"$project": {"members": 0}}  # Excluir members del resultado
-            ])
-            
-            documents = await collection.aggregate(pipeline).to_list(limit)
+            documents, has_next = await self._find_page(collection, query, None, page, limit)
             trips = [self._document_to_trip(doc) for doc in documents if doc]
             
-            return trips, total
+            return trips, total, has_next
             
         except Exception as error:
             raise DatabaseError(f"Error buscando viajes por participación: {str(error)}")
@@ -237,7 +277,8 @@ class TripMongoRepository(ITripRepository):
             collection = await self._get_collection()
             result = await collection.update_one(
                 {"_id": trip_id},
-                {"$set": {"is_deleted": True, "updated_at": datetime.utcnow()}}
+                {"$set": {"is_deleted": True, "updated_at": datetime.utcnow()}},
+                session=DatabaseConnection.current_session()
             )
             
             return result.modified_count > 0
@@ -270,7 +311,8 @@ class TripMongoRepository(ITripRepository):
                         "actual_expenses": new_total,
                         "updated_at": datetime.utcnow()
                     }
-                }
+                },
+                session=DatabaseConnection.current_session()
             )
             
             return result.modified_count > 0
@@ -289,7 +331,8 @@ class TripMongoRepository(ITripRepository):
                         "planning_progress": max(0, min(100, progress)),
                         "updated_at": datetime.utcnow()
                     }
-                }
+                },
+                session=DatabaseConnection.current_session()
             )
             
             return result.modified_count > 0
@@ -411,43 +454,14 @@ class TripMongoRepository(ITripRepository):
         try:
             collection = await self._get_collection()
             
-            # Pipeline para buscar viajes donde el usuario es miembro
-            pipeline = [
-                {
-                    "$lookup": {
-                        "from": "trip_members",
-                        "localField": "_id",
-                        "foreignField": "trip_id",
-                        "as": "members"
-                    }
-                },
-                {
-                    "$match": {
-                        "$and": [
-                            {"is_group_trip": True},
-                            {"is_deleted": {"$ne": True}},
-                            {
-                                "$or": [
-                                    {"owner_id": user_id},
-                                    {
-                                        "members": {
-                                            "$elemMatch": {
-                                                "user_id": user_id,
-                                                "status": "accepted",
-                                                "is_deleted": {"$ne": True}
-                                            }
-                                        }
-                                    }
-                                ]
-                            }
-                        ]
-                    }
-                },
-                {"$project": {"members": 0}},
-                {"$sort": {"created_at": -1}}
-            ]
+            query = await self._build_participation_query(
+                user_id,
+                [TripMemberStatus.ACCEPTED.value]
+            )
+            query["is_group_trip"] = True
             
-            documents = await collection.aggregate(pipeline).to_list(100)
+            cursor = collection.find(query).sort([("created_at", -1), ("_id", -1)]).limit(100)
+            documents = await cursor.to_list(length=100)
             return [self._document_to_trip(doc) for doc in documents if doc]
             
         except Exception as error:
@@ -496,9 +510,13 @@ class TripMongoRepository(ITripRepository):
         self, 
         filters: Dict[str, Any], 
         page: int = 1, 
-        limit: int = 20
-    ) -> tuple[List[Trip], int]:
-        """Buscar viajes con filtros y paginación"""
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        count_mode: str = PaginationUtils.COUNT_EXACT
+    ) -> tuple[List[Trip], Optional[int], bool]:
+        """Buscar viajes con filtros y paginación (por página o por cursor keyset)"""
+        keyset = PaginationUtils.build_keyset_filter("created_at", -1, cursor)
+
         try:
             collection = await self._get_collection()
             
@@ -520,17 +538,15 @@ class TripMongoRepository(ITripRepository):
             if filters.get("end_date"):
                 query["end_date"] = {"$lte": filters["end_date"]}
             
-            # Contar total
-            total = await collection.count_documents(query)
+            # Contar total (cacheado / estimado / omitido)
+            total = await PaginationUtils.count_documents(collection, query, count_mode)
             
             # Obtener resultados paginados
-            skip = (page - 1) * limit
-            cursor = collection.find(query).skip(skip).limit(limit).sort("created_at", -1)
-            documents = await cursor.to_list(length=limit)
+            documents, has_next = await self._find_page(collection, query, keyset, page, limit)
             
             trips = [self._document_to_trip(doc) for doc in documents if doc]
             
-            return trips, total
+            return trips, total, has_next
             
         except Exception as error:
             raise DatabaseError(f"Error buscando con filtros: {str(error)}")
@@ -593,37 +609,14 @@ class TripMongoRepository(ITripRepository):
         try:
             collection = await self._get_collection()
             
+            query = await self._build_participation_query(
+                user_id,
+                [TripMemberStatus.ACCEPTED.value]
+            )
+            
             # Pipeline de agregación para estadísticas
             pipeline = [
-                {
-                    "$lookup": {
-                        "from": "trip_members",
-                        "localField": "_id",
-                        "foreignField": "trip_id",
-                        "as": "members"
-                    }
-                },
-                {
-                    "$match": {
-                        "$and": [
-                            {"is_deleted": {"$ne": True}},
-                            {
-                                "$or": [
-                                    {"owner_id": user_id},
-                                    {
-                                        "members": {
-                                            "$elemMatch": {
-                                                "user_id": user_id,
-                                                "status": "accepted",
-                                                "is_deleted": {"$ne": True}
-                                            }
-                                        }
-                                    }
-                                ]
-                            }
-                        ]
-                    }
-                },
+                {"$match": query},
                 {
                     "$group": {
                         "_id": None,
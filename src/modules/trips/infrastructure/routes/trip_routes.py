@@ -9,6 +9,7 @@ from ...application.dtos.trip_member_dto import InviteMemberDTO, HandleInvitatio
 from shared.middleware.AuthMiddleware import get_current_user
 from shared.repositories.RepositoryFactory import RepositoryFactory
 from shared.services.ServiceFactory import ServiceFactory
+from shared.repositories.LoaderFactory import LoaderFactory
 from shared.events.event_bus import EventBus
 
 from ...application.use_cases.create_trip import CreateTripUseCase
@@ -23,15 +24,18 @@ from ...application.use_cases.get_trip_members import GetTripMembersUseCase
 from ...application.use_cases.leave_trip import LeaveTripUseCase
 from ...application.use_cases.remove_trip_member import RemoveTripMemberUseCase
 from ...application.use_cases.update_member_role import UpdateMemberRoleUseCase
+from shared.services.Container import Container
+from shared.utils.json_utils import FastJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
-def get_trip_controller():
+def _build_trip_controller():
     trip_repo = RepositoryFactory.get_trip_repository()
     trip_member_repo = RepositoryFactory.get_trip_member_repository()
     user_repo = RepositoryFactory.get_user_repository()
     trip_service = ServiceFactory.get_trip_service()
     event_bus = EventBus.get_instance()
+    user_loader = LoaderFactory.get_user_loader()
     
     return TripController(
         create_trip_use_case=CreateTripUseCase(
@@ -59,7 +63,7 @@ def get_trip_controller():
             trip_repo, trip_member_repo, user_repo, trip_service, event_bus
         ),
         get_trip_members_use_case=GetTripMembersUseCase(
-            trip_member_repo, user_repo, trip_service
+            trip_member_repo, user_repo, trip_service, user_loader
         ),
         leave_trip_use_case=LeaveTripUseCase(
             trip_repo, trip_member_repo, user_repo, trip_service, event_bus
@@ -72,6 +76,8 @@ def get_trip_controller():
         )
     )
 
+get_trip_controller = Container.provider("trip_controller", _build_trip_controller)
+
 @router.get("/")
 async def get_user_trips(
     status: Optional[str] = Query(None),
@@ -80,11 +86,13 @@ async def get_user_trips(
     destination: Optional[str] = Query(None),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
+    count: str = Query("exact", description="Total: exact | estimate | none"),
     current_user: dict = Depends(get_current_user),
     controller: TripController = Depends(get_trip_controller)
 ):
     return await controller.get_user_trips(
-        current_user, status, category, is_group_trip, destination, limit, offset
+        current_user, status, category, is_group_trip, destination, limit, offset, cursor, count
     )
 
 @router.post("/")
@@ -134,10 +142,12 @@ async def get_trip_members(
     trip_id: str = Path(...),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
+    count: str = Query("exact", description="Total: exact | estimate | none"),
     current_user: dict = Depends(get_current_user),
     controller: TripController = Depends(get_trip_controller)
 ):
-    return await controller.get_trip_members(trip_id, current_user, limit, offset)
+    return await controller.get_trip_members(trip_id, current_user, limit, offset, cursor, count)
 
 @router.post("/{trip_id}/members")
 async def invite_member(
@@ -3,11 +3,13 @@ from ...domain.User import User
 from ...domain.interfaces.IUserRepository import IUserRepository
 from shared.exceptions.UserExceptions import UserAlreadyExistsException
 from shared.services.EmailService import EmailService
+from shared.services.PasswordHasher import PasswordHasher
 
 class CreateUserUseCase:
-    def __init__(self, user_repository: IUserRepository, email_service: EmailService):
+    def __init__(self, user_repository: IUserRepository, email_service: EmailService, password_hasher: PasswordHasher):
         self.user_repository = user_repository
         self.email_service = email_service
+        self.password_hasher = password_hasher
 
     async def execute(self, user_data: CreateUserDTO) -> AuthenticatedUserDTO:
         # Verificar si el usuario ya existe
@@ -19,7 +21,7 @@ class CreateUserUseCase:
         user = User(
             correo_electronico=user_data.correo_electronico,
             nombre=user_data.nombre,
-            contrasena=user_data.contrasena
+            contrasena_hash=await self.password_hasher.hash(user_data.contrasena)
         )
 
         # Generar código de verificación
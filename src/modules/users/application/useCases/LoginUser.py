@@ -1,12 +1,15 @@
 from ..dtos.UserDTOs import LoginDTO, AuthResponseDTO, AuthenticatedUserDTO
 from ...domain.interfaces.IUserRepository import IUserRepository
+from shared.errors.custom_errors import RateLimitError
 from shared.exceptions.AuthExceptions import InvalidCredentialsException, UserNotActiveException
 from shared.services.AuthService import AuthService
+from shared.services.PasswordHasher import PasswordHasher
 
 class LoginUserUseCase:
-    def __init__(self, user_repository: IUserRepository, auth_service: AuthService):
+    def __init__(self, user_repository: IUserRepository, auth_service: AuthService, password_hasher: PasswordHasher):
         self.user_repository = user_repository
         self.auth_service = auth_service
+        self.password_hasher = password_hasher
 
     async def execute(self, login_data: LoginDTO) -> AuthResponseDTO:
         # Buscar usuario por email
@@ -19,9 +22,17 @@ class LoginUserUseCase:
             raise UserNotActiveException("Usuario no activo")
 
         # Verificar contraseña
-        if not user.verify_password(login_data.contrasena):
+        if not await self.password_hasher.verify(login_data.contrasena, user.contrasena_hash):
             raise InvalidCredentialsException("Credenciales inválidas")
 
+        # Migrar el hash al coste configurado; se guarda junto con el último acceso
+        if self.password_hasher.needs_rehash(user.contrasena_hash):
+            try:
+                user.update_password_hash(await self.password_hasher.hash(login_data.contrasena))
+            except RateLimitError:
+                # Con el pool saturado se pospone al siguiente login
+                pass
+
         # Actualizar último acceso
         user.update_last_access()
         await self.user_repository.update(user)
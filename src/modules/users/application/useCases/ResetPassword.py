@@ -1,12 +1,14 @@
 from ...domain.interfaces.IUserRepository import IUserRepository
 from shared.services.EmailService import EmailService
+from shared.services.PasswordHasher import PasswordHasher
 from shared.exceptions.UserExceptions import UserNotFoundException
 from shared.exceptions.AuthExceptions import InvalidCredentialsException
 
 class ResetPasswordUseCase:
-    def __init__(self, user_repository: IUserRepository, email_service: EmailService):
+    def __init__(self, user_repository: IUserRepository, email_service: EmailService, password_hasher: PasswordHasher):
         self.user_repository = user_repository
         self.email_service = email_service
+        self.password_hasher = password_hasher
 
     async def execute(self, email: str, code: str, new_password: str) -> None:
         """Resetear contraseña con código de verificación"""
@@ -15,8 +17,13 @@ class ResetPasswordUseCase:
         if not user or user.eliminado:
             raise UserNotFoundException("Usuario no encontrado")
 
+        # Validar el código antes de pagar el coste del hash
+        if not user.is_password_reset_code_valid(code):
+            raise InvalidCredentialsException("Código de recuperación inválido o expirado")
+
         # Resetear contraseña con código
-        if not user.reset_password_with_code(code, new_password):
+        new_password_hash = await self.password_hasher.hash(new_password)
+        if not user.reset_password_with_code(code, new_password_hash):
             raise InvalidCredentialsException("Código de recuperación inválido o expirado")
 
         # Guardar cambios
@@ -2,7 +2,6 @@
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from uuid import uuid4
-import bcrypt
 import secrets
 import string
 
@@ -11,7 +10,7 @@ class User:
         self,
         correo_electronico: str,
         nombre: str,
-        contrasena: str,
+        contrasena_hash: str,
         user_id: Optional[str] = None,
         url_foto_perfil: Optional[str] = None,
         telefono: Optional[str] = None,
@@ -34,7 +33,9 @@ class User:
         self.id = user_id or str(uuid4())
         self.correo_electronico = correo_electronico.lower()
         self.nombre = nombre
-        self._contrasena_hash = self._hash_password(contrasena)
+        # El hash se calcula fuera de la entidad (PasswordHasher) para que construir
+        # o hidratar un usuario nunca pague el coste de bcrypt
+        self._contrasena_hash = contrasena_hash
         self.url_foto_perfil = url_foto_perfil
         self.telefono = telefono
         self.pais = pais
@@ -58,25 +59,17 @@ class User:
         self.codigo_recuperacion_password = codigo_recuperacion_password
         self.codigo_recuperacion_password_expira = codigo_recuperacion_password_expira
 
-    def _hash_password(self, password: str) -> str:
-        """Hashear contraseña usando bcrypt directamente"""
-        password_bytes = password.encode('utf-8')
-        salt = bcrypt.gensalt()
-        return bcrypt.hashpw(password_bytes, salt).decode('utf-8')
-
     def _generate_secure_code(self, length: int = 6) -> str:
         """Generar código seguro de verificación"""
         return ''.join(secrets.choice(string.digits) for _ in range(length))
 
-    def verify_password(self, password: str) -> bool:
-        """Verificar contraseña"""
-        password_bytes = password.encode('utf-8')
-        hash_bytes = self._contrasena_hash.encode('utf-8')
-        return bcrypt.checkpw(password_bytes, hash_bytes)
+    @property
+    def contrasena_hash(self) -> str:
+        return self._contrasena_hash
 
-    def update_password(self, new_password: str) -> None:
-        """Actualizar contraseña"""
-        self._contrasena_hash = self._hash_password(new_password)
+    def update_password_hash(self, new_password_hash: str) -> None:
+        """Actualizar contraseña con un hash ya calculado"""
+        self._contrasena_hash = new_password_hash
         self.actualizado_en = datetime.utcnow()
 
     def generate_email_verification_code(self) -> str:
@@ -109,13 +102,18 @@ class User:
         self.actualizado_en = datetime.utcnow()
         return code
 
-    def reset_password_with_code(self, code: str, new_password: str) -> bool:
-        """Resetear contraseña con código de verificación"""
-        if (self.codigo_recuperacion_password == code and 
+    def is_password_reset_code_valid(self, code: str) -> bool:
+        """Verificar código de recuperación sin consumirlo"""
+        return bool(
+            self.codigo_recuperacion_password == code and
             self.codigo_recuperacion_password_expira and
-            datetime.utcnow() <= self.codigo_recuperacion_password_expira):
-            
-            self.update_password(new_password)
+            datetime.utcnow() <= self.codigo_recuperacion_password_expira
+        )
+
+    def reset_password_with_code(self, code: str, new_password_hash: str) -> bool:
+        """Resetear contraseña con código de verificación"""
+        if self.is_password_reset_code_valid(code):
+            self.update_password_hash(new_password_hash)
             self.codigo_recuperacion_password = None
             self.codigo_recuperacion_password_expira = None
             return True
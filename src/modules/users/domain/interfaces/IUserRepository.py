@@ -12,6 +12,10 @@ class IUserRepository(ABC):
     async def find_by_id(self, user_id: str) -> Optional[User]:
         pass
     
+    @abstractmethod
+    async def find_by_ids(self, user_ids: List[str]) -> List[User]:
+        pass
+    
     @abstractmethod
     async def find_by_email(self, email: str) -> Optional[User]:
         pass
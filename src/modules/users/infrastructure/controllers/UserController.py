@@ -23,23 +23,31 @@ from ...application.useCases.ResetPassword import ResetPasswordUseCase
 from ...domain.interfaces.IUserRepository import IUserRepository
 from shared.services.AuthService import AuthService
 from shared.services.EmailService import EmailService
+from shared.services.PasswordHasher import PasswordHasher
+from shared.errors.custom_errors import RateLimitError
 from shared.exceptions.UserExceptions import UserNotFoundException, UserAlreadyExistsException
 from shared.exceptions.AuthExceptions import InvalidCredentialsException, UserNotActiveException
 
 class UserController:
-    def __init__(self, user_repository: IUserRepository, auth_service: AuthService, email_service: EmailService):
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        auth_service: AuthService,
+        email_service: EmailService,
+        password_hasher: PasswordHasher
+    ):
         self.user_repository = user_repository
         self.auth_service = auth_service
         self.email_service = email_service
         
         # Casos de uso
-        self.create_user_use_case = CreateUserUseCase(user_repository, email_service)
-        self.login_user_use_case = LoginUserUseCase(user_repository, auth_service)
+        self.create_user_use_case = CreateUserUseCase(user_repository, email_service, password_hasher)
+        self.login_user_use_case = LoginUserUseCase(user_repository, auth_service, password_hasher)
         self.update_profile_use_case = UpdateProfileUseCase(user_repository)
         self.verify_email_use_case = VerifyEmailUseCase(user_repository)
         self.resend_verification_use_case = ResendVerificationUseCase(user_repository, email_service)
         self.request_password_reset_use_case = RequestPasswordResetUseCase(user_repository, email_service)
-        self.reset_password_use_case = ResetPasswordUseCase(user_repository, email_service)
+        self.reset_password_use_case = ResetPasswordUseCase(user_repository, email_service, password_hasher)
 
     async def register(self, user_data: CreateUserDTO) -> dict:
         try:
@@ -54,6 +62,11 @@ class UserController:
                 status_code=status.HTTP_409_CONFLICT,
                 detail=str(e)
             )
+        except RateLimitError as e:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=e.message
+            )
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -73,6 +86,11 @@ class UserController:
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail=str(e)
             )
+        except RateLimitError as e:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=e.message
+            )
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -139,6 +157,11 @@ class UserController:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=str(e)
             )
+        except RateLimitError as e:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=e.message
+            )
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -298,6 +321,11 @@ class UserController:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=str(e)
             )
+        except RateLimitError as e:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=e.message
+            )
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,13 +1,23 @@
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import IndexModel, ASCENDING
 from typing import Optional, List, Dict, Any
 from ...domain.User import User
 from ...domain.interfaces.IUserRepository import IUserRepository
 from shared.database.Connection import DatabaseConnection
 
 class UserMongoRepository(IUserRepository):
+    COLLECTION_NAME = "users"
+    INDEXES = [
+        IndexModel(
+            [("correo_electronico", ASCENDING)],
+            unique=True,
+            partialFilterExpression={"eliminado": False}
+        )
+    ]
+
     def __init__(self):
         self.db = DatabaseConnection.get_database()
-        self.collection: AsyncIOMotorCollection = self.db["users"]
+        self.collection: AsyncIOMotorCollection = self.db[self.COLLECTION_NAME]
         
     async def create(self, user: User) -> None:
         user_data = user.to_dict()
@@ -22,6 +32,17 @@ class UserMongoRepository(IUserRepository):
             return None
         return self._document_to_user(user_data)
     
+    async def find_by_ids(self, user_ids: List[str]) -> List[User]:
+        if not user_ids:
+            return []
+        cursor = self.collection.find({"_id": {"$in": list(user_ids)}, "eliminado": False})
+        
+        users = []
+        async for user_data in cursor:
+            users.append(self._document_to_user(user_data))
+        
+        return users
+    
     async def find_by_email(self, email: str) -> Optional[User]:
         user_data = await self.collection.find_one({
             "correo_electronico": email.lower(),
@@ -14,18 +14,21 @@ from shared.middleware.AuthMiddleware import get_current_user, get_user_from_req
 from shared.repositories.RepositoryFactory import RepositoryFactory
 from shared.services.ServiceFactory import ServiceFactory
 from shared.controllers.UploadController import UploadController
+from shared.routes.UploadRoutes import get_upload_controller
+from shared.services.Container import Container
+from shared.utils.json_utils import FastJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
-def get_user_controller():
+def _build_user_controller():
     return UserController(
         user_repository=RepositoryFactory.get_user_repository(),
         auth_service=ServiceFactory.get_auth_service(),
-        email_service=ServiceFactory.get_email_service()
+        email_service=ServiceFactory.get_email_service(),
+        password_hasher=ServiceFactory.get_password_hasher()
     )
 
-def get_upload_controller():
-    return UploadController()
+get_user_controller = Container.provider("user_controller", _build_user_controller)
 
 # ===============================================
 # ENDPOINTS PÚBLICOS (SIN AUTENTICACIÓN)
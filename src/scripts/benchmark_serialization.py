@@ -0,0 +1,110 @@
+# src/scripts/benchmark_serialization.py
+"""Benchmark de serialización de una página de 100 viajes.
+
+Compara el camino por defecto de FastAPI (jsonable_encoder + JSONResponse)
+con FastJSONResponse (orjson). Ejecutar desde src:
+
+    python -m scripts.benchmark_serialization [--trips 100] [--repeat 200]
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from modules.trips.application.dtos.trip_dto import TripResponseDTO
+from shared.utils.json_utils import FastJSONResponse
+from shared.utils.response_utils import PaginatedResponse
+
+
+def build_trip_page(trips: int) -> PaginatedResponse:
+    now = datetime.utcnow()
+    data = []
+    for index in range(trips):
+        start = now + timedelta(days=index)
+        data.append(TripResponseDTO(
+            id=f"trip-{index:04d}",
+            title=f"Viaje {index}",
+            description="Recorrido por la costa con paradas en pueblos y playas",
+            destination="Oaxaca, México",
+            start_date=start,
+            end_date=start + timedelta(days=7),
+            owner_id=f"user-{index % 17:04d}",
+            category="leisure",
+            status="planning",
+            is_group_trip=index % 2 == 0,
+            is_public=False,
+            budget_limit=15000.0,
+            currency="MXN",
+            image_url=f"https://res.cloudinary.com/voyaj/image/upload/trips/{index}.jpg",
+            notes=None,
+            total_expenses=Decimal("1234.50") + index,
+            member_count=4,
+            created_at=now,
+            updated_at=now,
+            owner_info={
+                "id": f"user-{index % 17:04d}",
+                "nombre": "Ana",
+                "correo_electronico": "ana@example.com",
+                "last_login": now
+            },
+            user_role="member",
+            can_edit=False
+        ))
+
+    return PaginatedResponse(data=data, total=trips * 5, page=1, limit=trips, total_pages=0)
+
+
+def measure(render, repeat: int) -> list:
+    samples = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        render()
+        samples.append((time.perf_counter() - started_at) * 1000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trips", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    page = build_trip_page(args.trips)
+
+    def default_render() -> bytes:
+        return JSONResponse(jsonable_encoder(page)).body
+
+    def orjson_render() -> bytes:
+        return FastJSONResponse(page).body
+
+    # Mismo JSON con ambos caminos
+    if json.loads(default_render()) != json.loads(orjson_render()):
+        raise SystemExit("La salida de FastJSONResponse no coincide con jsonable_encoder")
+
+    results = {
+        "jsonable_encoder + JSONResponse": measure(default_render, args.repeat),
+        "FastJSONResponse (orjson)": measure(orjson_render, args.repeat)
+    }
+
+    print(f"Página de {args.trips} viajes, {args.repeat} repeticiones, {len(orjson_render())} bytes")
+    for name, samples in results.items():
+        print(
+            f"  {name:<34} mediana {statistics.median(samples):8.3f} ms"
+            f"   p95 {sorted(samples)[int(len(samples) * 0.95) - 1]:8.3f} ms"
+        )
+
+    baseline = statistics.median(results["jsonable_encoder + JSONResponse"])
+    optimized = statistics.median(results["FastJSONResponse (orjson)"])
+    print(f"  Mejora: {baseline / optimized:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
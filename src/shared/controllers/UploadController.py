@@ -1,6 +1,8 @@
 # src/shared/controllers/UploadController.py
+import time
 from fastapi import HTTPException, UploadFile, status
-from typing import List
+from fastapi.responses import FileResponse
+from typing import List, Optional
 from ..services.ServiceFactory import ServiceFactory
 from ..repositories.RepositoryFactory import RepositoryFactory
 from ..dtos.UploadDTOs import (
@@ -13,8 +15,9 @@ from ..dtos.UploadDTOs import (
 from ..exceptions.UploadExceptions import (
     FileTooLargeException, 
     InvalidFileTypeException, 
-    CloudinaryException
+    StorageException
 )
+from ..storage.LocalStorage import LocalStorage
 from ..utils.response_utils import ResponseUtils
 
 class UploadController:
@@ -64,7 +67,7 @@ class UploadController:
             
         except (FileTooLargeException, InvalidFileTypeException) as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-        except CloudinaryException as e:
+        except StorageException as e:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
         except Exception as e:
             raise HTTPException(
@@ -92,7 +95,7 @@ class UploadController:
             
         except (FileTooLargeException, InvalidFileTypeException) as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-        except CloudinaryException as e:
+        except StorageException as e:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
     async def upload_document(self, folder: str, file: UploadFile, current_user: dict) -> dict:
@@ -114,11 +117,11 @@ class UploadController:
             
         except (FileTooLargeException, InvalidFileTypeException) as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-        except CloudinaryException as e:
+        except StorageException as e:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
     async def delete_file(self, public_id: str, resource_type: str, current_user: dict) -> dict:
-        """Eliminar archivo de Cloudinary"""
+        """Eliminar archivo del almacenamiento"""
         try:
             success = await self.upload_service.delete_file(public_id, resource_type)
             
@@ -127,8 +130,63 @@ class UploadController:
                     data={"public_id": public_id, "deleted": True},
                     message="Archivo eliminado exitosamente"
                 ).__dict__
+            elif await self.upload_service.is_file_in_use(public_id):
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="El archivo sigue en uso por otro registro"
+                )
             else:
-                raise CloudinaryException("No se pudo eliminar el archivo")
+                raise StorageException("No se pudo eliminar el archivo")
                 
-        except CloudinaryException as e:
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
\ No newline at end of file
+        except StorageException as e:
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+    async def delete_document(self, folder: str, public_id: str, current_user: dict) -> dict:
+        """Eliminar un documento del usuario (el archivo se conserva si otro registro lo usa)"""
+        try:
+            user_id = current_user["sub"]
+            deleted = await self.upload_service.delete_document(user_id, folder, public_id)
+
+            if deleted:
+                message = "Documento eliminado exitosamente"
+            elif await self.upload_service.is_file_in_use(public_id):
+                message = "Documento eliminado; el archivo sigue en uso por otro registro"
+            else:
+                raise StorageException("No se pudo eliminar el documento")
+
+            return ResponseUtils.success(
+                data={"public_id": public_id, "deleted": deleted},
+                message=message
+            ).__dict__
+
+        except StorageException as e:
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+    async def get_local_file(self, public_id: str, expires: Optional[int], signature: Optional[str]) -> FileResponse:
+        """Servir un archivo del almacenamiento local"""
+        storage = self.upload_service.storage
+        if not isinstance(storage, LocalStorage):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Archivo no encontrado")
+
+        if not storage.verify_signature(public_id, expires, signature):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="URL inválida o caducada")
+
+        found = storage.stat(public_id)
+        if found is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Archivo no encontrado")
+
+        path, stat_result = found
+        # Los nombres aleatorios nunca cambian de contenido; los public_id fijos
+        # (p. ej. la foto de perfil) se pueden sobrescribir y se revalidan.
+        # Las URLs firmadas solo se cachean hasta caducar
+        if expires is not None:
+            cache_control = f"private, max-age={max(int(expires - time.time()), 0)}"
+        elif storage.is_immutable(public_id):
+            cache_control = "public, max-age=31536000, immutable"
+        else:
+            cache_control = "public, no-cache"
+        return FileResponse(
+            path,
+            stat_result=stat_result,
+            headers={"Cache-Control": cache_control}
+        )
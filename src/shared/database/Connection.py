@@ -1,6 +1,15 @@
 import os
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
-from typing import Optional
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorClientSession, AsyncIOMotorDatabase
+from typing import AsyncIterator, Optional, Dict, List
+from .IndexRegistry import IndexRegistry
+from ..utils.request_timing import DatabaseTimingListener
+
+# Sesión de la transacción activa en la tarea actual (ver DatabaseConnection.transaction)
+_current_session: ContextVar[Optional[AsyncIOMotorClientSession]] = ContextVar(
+    "mongo_current_session", default=None
+)
 
 class DatabaseConnection:
     _instance: Optional["DatabaseConnection"] = None
@@ -18,12 +27,18 @@ class DatabaseConnection:
             mongodb_url = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
             database_name = os.getenv("MONGODB_DATABASE", "voyaj")
             
-            self._client = AsyncIOMotorClient(mongodb_url)
+            self._client = AsyncIOMotorClient(mongodb_url, event_listeners=[DatabaseTimingListener()])
             self._database = self._client[database_name]
             
             # Verificar conexión
             await self._client.admin.command('ping')
 
+    async def ensure_indexes(self) -> Dict[str, Dict[str, List[str]]]:
+        """Aplicar los índices registrados y devolver el reporte de drift"""
+        if self._database is None:
+            await self.connect()
+        return await IndexRegistry.apply(self._database)
+
     async def disconnect(self) -> None:
         """Desconectar de MongoDB"""
         if self._client:
@@ -45,4 +60,37 @@ class DatabaseConnection:
         instance = cls()
         if instance._client is None:
             await instance.connect()
-        return instance._client
\ No newline at end of file
+        return instance._client
+
+    @staticmethod
+    def current_session() -> Optional[AsyncIOMotorClientSession]:
+        """Sesión de la transacción en curso (None fuera de transaction())"""
+        return _current_session.get()
+
+    @staticmethod
+    def transactions_enabled() -> bool:
+        # Requiere replica set o cluster; un mongod standalone no soporta transacciones
+        return os.getenv("MONGODB_TRANSACTIONS", "false").lower() in ("1", "true", "yes")
+
+    @classmethod
+    @asynccontextmanager
+    async def transaction(cls) -> AsyncIterator[Optional[AsyncIOMotorClientSession]]:
+        """Agrupar escrituras (agregado + outbox) en una transacción.
+
+        Los repositorios pasan current_session() a sus escrituras. Si las
+        transacciones están deshabilitadas las escrituras se ejecutan igual,
+        una a una, y el bloque no aporta atomicidad. Las transacciones
+        anidadas reutilizan la sesión exterior.
+        """
+        if _current_session.get() is not None or not cls.transactions_enabled():
+            yield _current_session.get()
+            return
+
+        client = await cls.get_client()
+        async with await client.start_session() as session:
+            async with session.start_transaction():
+                token = _current_session.set(session)
+                try:
+                    yield session
+                finally:
+                    _current_session.reset(token)
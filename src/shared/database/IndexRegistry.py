@@ -0,0 +1,98 @@
+# src/shared/database/IndexRegistry.py
+from typing import Dict, List, Any, Type
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import IndexModel
+from pymongo.errors import OperationFailure
+
+
+class IndexRegistry:
+    """Registro declarativo de índices por colección"""
+
+    _definitions: Dict[str, List[IndexModel]] = {}
+
+    # Opciones que se comparan contra el índice existente para detectar drift
+    _COMPARED_OPTIONS = ("unique", "sparse", "partialFilterExpression", "expireAfterSeconds")
+
+    @classmethod
+    def register(cls, collection_name: str, indexes: List[IndexModel]) -> None:
+        """Registrar índices requeridos para una colección"""
+        registered = cls._definitions.setdefault(collection_name, [])
+        known_names = {index.document["name"] for index in registered}
+
+        for index in indexes:
+            if index.document["name"] not in known_names:
+                registered.append(index)
+                known_names.add(index.document["name"])
+
+    @classmethod
+    def register_repository(cls, repository_class: Type[Any]) -> None:
+        """Registrar los índices declarados por un repositorio (COLLECTION_NAME / INDEXES)"""
+        collection_name = getattr(repository_class, "COLLECTION_NAME", None)
+        indexes = getattr(repository_class, "INDEXES", None)
+
+        if collection_name and indexes:
+            cls.register(collection_name, indexes)
+
+    @classmethod
+    def get_definitions(cls) -> Dict[str, List[IndexModel]]:
+        """Obtener índices registrados"""
+        return dict(cls._definitions)
+
+    @classmethod
+    async def apply(cls, database: AsyncIOMotorDatabase) -> Dict[str, Dict[str, List[str]]]:
+        """Crear índices faltantes (idempotente) y reportar diferencias con los existentes"""
+        report: Dict[str, Dict[str, List[str]]] = {}
+
+        for collection_name, indexes in cls._definitions.items():
+            collection = database[collection_name]
+            existing = await collection.index_information()
+
+            created: List[str] = []
+            drift: List[str] = []
+
+            for index in indexes:
+                spec = index.document
+                current = existing.get(spec["name"])
+
+                if current is None:
+                    try:
+                        await collection.create_indexes([index])
+                        created.append(spec["name"])
+                    except OperationFailure as error:
+                        drift.append(f"{spec['name']}: {error}")
+                elif not cls._matches(spec, current):
+                    drift.append(f"{spec['name']}: definición distinta a la declarada")
+
+            declared_names = {index.document["name"] for index in indexes}
+            extra = [name for name in existing if name != "_id_" and name not in declared_names]
+
+            report[collection_name] = {
+                "created": created,
+                "drift": drift,
+                "extra": extra
+            }
+
+        return report
+
+    @classmethod
+    def _matches(cls, spec: Dict[str, Any], current: Dict[str, Any]) -> bool:
+        """Comparar índice declarado contra index_information()"""
+        if cls._normalize_key(spec["key"].items()) != cls._normalize_key(current.get("key", [])):
+            return False
+
+        for option in cls._COMPARED_OPTIONS:
+            if spec.get(option) != current.get(option):
+                # unique/sparse ausentes equivalen a False
+                if option in ("unique", "sparse") and not spec.get(option) and not current.get(option):
+                    continue
+                return False
+
+        return True
+
+    @staticmethod
+    def _normalize_key(key: Any) -> List[tuple]:
+        """Normalizar direcciones (MongoDB puede devolver 1.0 en lugar de 1)"""
+        return [
+            (field, int(direction) if isinstance(direction, float) else direction)
+            for field, direction in key
+        ]
@@ -1,8 +1,15 @@
 
 import asyncio
-from typing import Dict, List, Callable, Any, Optional
+import contextvars
+import inspect
+import logging
+import os
+import time
+from typing import Dict, List, Callable, Any, Optional, Set, Tuple
 from dataclasses import dataclass
 from datetime import datetime
+from shared.utils import request_timing
+from .event_coalescer import EventCoalescer
 
 
 @dataclass
@@ -16,15 +23,111 @@ class DomainEvent:
     metadata: Optional[Dict[str, Any]] = None
 
 
-EventHandler = Callable[[DomainEvent], None]
+EventHandler = Callable[[DomainEvent], Any]
+ErrorReporter = Callable[[DomainEvent, EventHandler, BaseException], None]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Subscription:
+    handler: EventHandler
+    critical: bool
+    timeout: Optional[float]
+
+
+@dataclass
+class _LatencyStats:
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_seconds / self.count * 1000, 3) if self.count else 0.0,
+            "max_ms": round(self.max_seconds * 1000, 3)
+        }
+
+
+# (evento, handlers a ejecutar, instante de encolado)
+_QueueItem = Tuple[DomainEvent, List[_Subscription], float]
 
 
 class EventBus:
+    """Bus de eventos en proceso.
+
+    Los handlers críticos se ejecutan en paralelo y publish() los espera; los
+    no críticos (por defecto) no bloquean a publish(). En modo "inline" se
+    lanzan como tasks sueltos; en modo "queue" se encolan en una cola acotada
+    que drena un pool de workers, con una política para cuando la cola está
+    llena ("block" espera hueco, "drop_oldest" descarta el más antiguo y
+    "shed" descarta el nuevo). Cada handler tiene un timeout y sus errores se
+    aíslan y se reportan por logging (y por el error_reporter si se configuró).
+
+    Los tipos de evento con agrupación habilitada (ver EventCoalescer) se
+    retienen durante una ventana corta y los handlers no críticos reciben un
+    único evento por (event_type, aggregate_id); los críticos los ven todos.
+    """
+
+    MODE_INLINE = "inline"
+    MODE_QUEUE = "queue"
+
+    POLICY_BLOCK = "block"
+    POLICY_DROP_OLDEST = "drop_oldest"
+    POLICY_SHED = "shed"
+    FULL_POLICIES = (POLICY_BLOCK, POLICY_DROP_OLDEST, POLICY_SHED)
+
     _instance: Optional['EventBus'] = None
     
-    def __init__(self):
-        self._handlers: Dict[str, List[EventHandler]] = {}
+    def __init__(
+        self,
+        handler_timeout: Optional[float] = None,
+        error_reporter: Optional[ErrorReporter] = None,
+        mode: Optional[str] = None,
+        queue_size: Optional[int] = None,
+        workers: Optional[int] = None,
+        full_policy: Optional[str] = None,
+        coalescer: Optional[EventCoalescer] = None
+    ):
+        self._handlers: Dict[str, List[_Subscription]] = {}
         self._max_listeners = 100
+        self._handler_timeout = handler_timeout or float(os.getenv("EVENT_HANDLER_TIMEOUT_SECONDS", "5"))
+        self._error_reporter = error_reporter
+        self._background_tasks: Set[asyncio.Task] = set()
+        self._handler_failures = 0
+        self._handler_timeouts = 0
+        self._handler_latency: Dict[str, _LatencyStats] = {}
+
+        self._mode = mode or os.getenv("EVENT_BUS_MODE", self.MODE_QUEUE)
+        if self._mode not in (self.MODE_INLINE, self.MODE_QUEUE):
+            raise ValueError(f"Modo de event bus inválido: {self._mode}")
+
+        self._full_policy = full_policy or os.getenv("EVENT_BUS_FULL_POLICY", self.POLICY_BLOCK)
+        if self._full_policy not in self.FULL_POLICIES:
+            raise ValueError(f"Política de cola llena inválida: {self._full_policy}")
+
+        self._queue_size = queue_size or int(os.getenv("EVENT_BUS_QUEUE_SIZE", "1000"))
+        self._worker_count = workers or int(os.getenv("EVENT_BUS_WORKERS", "4"))
+        # La cola y los workers se crean en el primer publish, dentro del event loop
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._queue_wait = _LatencyStats()
+        self._enqueued = 0
+        self._dropped = 0
+        self._shed = 0
+
+        self._coalescer = coalescer or EventCoalescer()
+
+        # Outbox durable (ver enable_outbox)
+        self._outbox: Optional[Any] = None
+        self._is_durable: Callable[[DomainEvent], bool] = lambda event: False
+        self._on_outbox_write: Optional[Callable[[], None]] = None
 
     @classmethod
     def get_instance(cls) -> 'EventBus':
@@ -34,55 +137,252 @@ class EventBus:
 
     async def publish(self, event: DomainEvent) -> None:
         """Publicar un evento"""
+        started_at = time.perf_counter()
         try:
-            # Obtener handlers para este tipo de evento
-            handlers = self._handlers.get(event.event_type, [])
-            
-            # También obtener handlers globales (*)
-            global_handlers = self._handlers.get('*', [])
-            
-            all_handlers = handlers + global_handlers
-            
-            if not all_handlers:
-                return
+            await self._publish(event)
+        finally:
+            # Tiempo de despacho dentro de la petición (Server-Timing "events")
+            request_timing.record_events(time.perf_counter() - started_at)
+
+    async def _publish(self, event: DomainEvent) -> None:
+        # Handlers del tipo de evento más los globales (*)
+        subscriptions = self._handlers.get(event.event_type, []) + self._handlers.get('*', [])
+        critical = [subscription for subscription in subscriptions if subscription.critical]
+        background = [subscription for subscription in subscriptions if not subscription.critical]
+
+        if self._outbox is not None and self._is_durable(event):
+            # Se persiste con la transacción en curso; el relay hará la entrega.
+            # Los agrupables quedan disponibles al cerrar la ventana para que el
+            # relay los lea juntos
+            await self._outbox.add(event, delay_seconds=self._coalescer.window_for(event))
+            if self._on_outbox_write:
+                self._on_outbox_write()
+        elif background:
+            if self._coalescer.window_for(event):
+                self._coalescer.add(event, self._emit_coalesced)
+            else:
+                await self._dispatch_background(event, background)
+
+        if critical:
+            # _run_handler nunca lanza: un handler no puede cancelar a los demás
+            await asyncio.gather(*(self._run_handler(subscription, event) for subscription in critical))
+
+    def enable_outbox(
+        self,
+        outbox: Any,
+        is_durable: Callable[[DomainEvent], bool],
+        on_write: Optional[Callable[[], None]] = None
+    ) -> None:
+        """Enviar los eventos durables al outbox en lugar de a los handlers no críticos.
+
+        Los handlers críticos siguen ejecutándose en publish(); los demás los
+        invoca el OutboxRelay mediante deliver() cuando lee el outbox.
+        """
+        self._outbox = outbox
+        self._is_durable = is_durable
+        self._on_outbox_write = on_write
+
+    async def deliver(self, event: DomainEvent) -> bool:
+        """Ejecutar los handlers no críticos de un evento y esperar a que terminen.
+
+        Devuelve False si alguno falló o excedió su timeout, para que quien
+        entrega (el relay del outbox) pueda reintentar.
+        """
+        subscriptions = self._handlers.get(event.event_type, []) + self._handlers.get('*', [])
+        background = [subscription for subscription in subscriptions if not subscription.critical]
+        if not background:
+            return True
+
+        results = await asyncio.gather(*(self._run_handler(subscription, event) for subscription in background))
+        return all(results)
 
-            # Ejecutar todos los handlers
-            for handler in all_handlers:
-                try:
-                    if asyncio.iscoroutinefunction(handler):
-                        await handler(event)
-                    else:
-                        handler(event)
-                except Exception as e:
-                    print(f"Error en handler para evento {event.event_type}: {e}")
-
-        except Exception as e:
-            print(f"Error publicando evento: {e}")
-            raise e
-
-    def subscribe(self, event_type: str, handler: EventHandler) -> None:
-        """Suscribirse a un tipo de evento"""
+    def coalesce(self, event_type: str, window_seconds: Optional[float] = None) -> None:
+        """Agrupar las ráfagas de un tipo de evento (window_seconds=0 lo desactiva)"""
+        self._coalescer.enable(event_type, window_seconds)
+
+    def coalesce_batch(self, events: List[DomainEvent]) -> List[Tuple[DomainEvent, List[int]]]:
+        """Agrupar un lote de eventos ya leído (lo usa el relay del outbox)"""
+        return self._coalescer.group(events)
+
+    def subscribe(
+        self,
+        event_type: str,
+        handler: EventHandler,
+        critical: bool = False,
+        timeout: Optional[float] = None
+    ) -> None:
+        """Suscribirse a un tipo de evento.
+
+        critical=True hace que publish() espere al handler (p. ej. invalidar una
+        caché antes de responder); timeout sobrescribe el timeout por defecto.
+        """
         if event_type not in self._handlers:
             self._handlers[event_type] = []
         
         if len(self._handlers[event_type]) >= self._max_listeners:
             raise ValueError(f"Máximo número de listeners alcanzado para {event_type}")
         
-        self._handlers[event_type].append(handler)
+        self._handlers[event_type].append(_Subscription(handler, critical, timeout))
 
-    def subscribe_to_all(self, handler: EventHandler) -> None:
+    def subscribe_to_all(self, handler: EventHandler, critical: bool = False, timeout: Optional[float] = None) -> None:
         """Suscribirse a todos los eventos"""
-        self.subscribe('*', handler)
+        self.subscribe('*', handler, critical, timeout)
 
     def unsubscribe(self, event_type: str, handler: EventHandler) -> None:
         """Desuscribirse de un evento"""
-        if event_type in self._handlers:
+        subscriptions = self._handlers.get(event_type)
+        if not subscriptions:
+            return
+
+        remaining = [subscription for subscription in subscriptions if subscription.handler != handler]
+        if remaining:
+            self._handlers[event_type] = remaining
+        else:
+            del self._handlers[event_type]
+
+    def set_error_reporter(self, error_reporter: Optional[ErrorReporter]) -> None:
+        """Configurar a quién se reportan los fallos de handlers"""
+        self._error_reporter = error_reporter
+
+    async def wait_for_background_tasks(self, timeout: Optional[float] = None) -> None:
+        """Esperar a los handlers en segundo plano (p. ej. al apagar la app)"""
+        if self._background_tasks:
+            await asyncio.wait(set(self._background_tasks), timeout=timeout)
+
+    async def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Drenar la cola y los handlers pendientes y detener los workers"""
+        timeout = timeout or float(os.getenv("EVENT_BUS_DRAIN_TIMEOUT_SECONDS", "10"))
+
+        # Las ráfagas retenidas se entregan sin esperar a que cierre su ventana
+        self._coalescer.flush_all(self._emit_coalesced)
+        await self.wait_for_background_tasks(timeout)
+
+        if self._queue is not None:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Event bus apagado con %d eventos sin procesar", self._queue.qsize())
+
+            for worker in self._workers:
+                worker.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
+            self._workers = []
+            self._queue = None
+
+        await self.wait_for_background_tasks(timeout)
+
+    async def _dispatch_background(self, event: DomainEvent, subscriptions: List[_Subscription]) -> None:
+        if self._mode == self.MODE_QUEUE:
+            await self._enqueue(event, subscriptions)
+        else:
+            for subscription in subscriptions:
+                self._spawn(self._run_handler(subscription, event))
+
+    def _emit_coalesced(self, event: DomainEvent) -> None:
+        # Los suscriptores se resuelven al cerrar la ventana
+        subscriptions = self._handlers.get(event.event_type, []) + self._handlers.get('*', [])
+        background = [subscription for subscription in subscriptions if not subscription.critical]
+        if background:
+            self._spawn(self._dispatch_background(event, background))
+
+    async def _enqueue(self, event: DomainEvent, subscriptions: List[_Subscription]) -> None:
+        queue = self._ensure_workers()
+        item: _QueueItem = (event, subscriptions, time.monotonic())
+
+        if queue.full():
+            if self._full_policy == self.POLICY_SHED:
+                self._shed += 1
+                logger.warning("Cola de eventos llena: descartado %s", event.event_type)
+                return
+
+            if self._full_policy == self.POLICY_DROP_OLDEST:
+                dropped_event = queue.get_nowait()[0]
+                queue.task_done()
+                self._dropped += 1
+                logger.warning("Cola de eventos llena: descartado el más antiguo (%s)", dropped_event.event_type)
+
+        # Con "block" espera hueco; con "drop_oldest" ya lo hay
+        await queue.put(item)
+        self._enqueued += 1
+
+    def _ensure_workers(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._queue_size)
+            loop = asyncio.get_running_loop()
+            # Contexto vacío: los workers no heredan la petición ni la
+            # transacción del primer publish
+            self._workers = [
+                self._create_detached_task(loop, self._worker(), name=f"event-bus-worker-{index}")
+                for index in range(self._worker_count)
+            ]
+        return self._queue
+
+    async def _worker(self) -> None:
+        queue = self._queue
+        while True:
+            event, subscriptions, enqueued_at = await queue.get()
+            try:
+                self._queue_wait.record(time.monotonic() - enqueued_at)
+                await asyncio.gather(*(self._run_handler(subscription, event) for subscription in subscriptions))
+            finally:
+                queue.task_done()
+
+    async def _run_handler(self, subscription: _Subscription, event: DomainEvent) -> bool:
+        timeout = subscription.timeout or self._handler_timeout
+        started_at = time.monotonic()
+        try:
+            result = subscription.handler(event)
+            if inspect.isawaitable(result):
+                await asyncio.wait_for(result, timeout=timeout)
+            return True
+        except asyncio.TimeoutError as error:
+            self._handler_timeouts += 1
+            self._report_failure(event, subscription.handler, error)
+            return False
+        except Exception as error:
+            self._handler_failures += 1
+            self._report_failure(event, subscription.handler, error)
+            return False
+        finally:
+            handler_name = self._handler_name(subscription.handler)
+            stats = self._handler_latency.get(handler_name)
+            if stats is None:
+                stats = self._handler_latency[handler_name] = _LatencyStats()
+            stats.record(time.monotonic() - started_at)
+
+    @staticmethod
+    def _handler_name(handler: EventHandler) -> str:
+        return getattr(handler, "__qualname__", repr(handler))
+
+    def _spawn(self, coroutine) -> None:
+        # Contexto vacío: el handler no hereda la petición (tiempos, caché de
+        # DataLoader) ni la transacción de Mongo del publish que lo lanzó
+        task = self._create_detached_task(asyncio.get_running_loop(), coroutine)
+        # Guardar referencia para que el task no se recolecte antes de terminar
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    @staticmethod
+    def _create_detached_task(loop: asyncio.AbstractEventLoop, coroutine, name: Optional[str] = None) -> asyncio.Task:
+        # El task copia el contexto en el que se crea; crearlo dentro de un
+        # Context vacío equivale a create_task(context=...) sin requerir 3.11
+        return contextvars.Context().run(loop.create_task, coroutine, name=name)
+
+    def _report_failure(self, event: DomainEvent, handler: EventHandler, error: BaseException) -> None:
+        handler_name = self._handler_name(handler)
+        if isinstance(error, asyncio.TimeoutError):
+            logger.error("Handler %s excedió el timeout para evento %s", handler_name, event.event_type)
+        else:
+            logger.error(
+                "Error en handler %s para evento %s", handler_name, event.event_type,
+                exc_info=(type(error), error, error.__traceback__)
+            )
+
+        if self._error_reporter:
             try:
-                self._handlers[event_type].remove(handler)
-                if not self._handlers[event_type]:
-                    del self._handlers[event_type]
-            except ValueError:
-                pass
+                self._error_reporter(event, handler, error)
+            except Exception:
+                logger.exception("Error en el reporter de fallos del event bus")
 
     def get_listener_count(self, event_type: str) -> int:
         """Obtener número de listeners para un evento"""
@@ -142,5 +442,25 @@ class EventBus:
             "total_events": len(self._handlers),
             "total_handlers": total_handlers,
             "event_types": self.get_registered_events(),
-            "max_listeners": self._max_listeners
+            "max_listeners": self._max_listeners,
+            "handler_timeout_seconds": self._handler_timeout,
+            "background_tasks": len(self._background_tasks),
+            "handler_failures": self._handler_failures,
+            "handler_timeouts": self._handler_timeouts,
+            "handler_latency": {
+                name: stats.to_dict() for name, stats in self._handler_latency.items()
+            },
+            "mode": self._mode,
+            "outbox_enabled": self._outbox is not None,
+            "coalescing": self._coalescer.get_stats(),
+            "queue": {
+                "depth": self._queue.qsize() if self._queue is not None else 0,
+                "max_size": self._queue_size,
+                "workers": len(self._workers),
+                "full_policy": self._full_policy,
+                "enqueued": self._enqueued,
+                "dropped": self._dropped,
+                "shed": self._shed,
+                "wait": self._queue_wait.to_dict()
+            }
         }
\ No newline at end of file
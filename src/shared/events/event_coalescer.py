@@ -0,0 +1,126 @@
+# src/shared/events/event_coalescer.py
+import asyncio
+import copy
+import os
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# (event_type, aggregate_id)
+_CoalesceKey = Tuple[str, str]
+
+
+class EventCoalescer:
+    """Agrupa ráfagas de eventos con el mismo (event_type, aggregate_id).
+
+    Solo se agrupan los tipos habilitados y que tienen aggregate_id. La ráfaga
+    se entrega como un único evento: el último (su payload refleja el estado
+    final) salvo que la clase del evento defina merge_coalesced(events) para
+    combinar los payloads. metadata["coalesced_count"] indica cuántos eventos
+    representa y metadata["coalesced_keys"] sus claves de idempotencia.
+    """
+
+    def __init__(self, window_seconds: Optional[float] = None, event_types: Optional[Iterable[str]] = None):
+        if window_seconds is None:
+            window_seconds = float(os.getenv("EVENT_COALESCE_WINDOW_MS", "250")) / 1000
+        if event_types is None:
+            event_types = os.getenv("EVENT_COALESCE_TYPES", "activities.reordered,days.bulk_created").split(",")
+
+        self._default_window = window_seconds
+        self._windows: Dict[str, float] = {
+            event_type.strip(): window_seconds for event_type in event_types if event_type.strip()
+        }
+        self._pending: Dict[_CoalesceKey, List[Any]] = {}
+        self._timers: Dict[_CoalesceKey, asyncio.TimerHandle] = {}
+        self._received = 0
+        self._emitted = 0
+
+    def enable(self, event_type: str, window_seconds: Optional[float] = None) -> None:
+        """Agrupar los eventos de un tipo (window_seconds=0 lo desactiva)"""
+        self._windows[event_type] = self._default_window if window_seconds is None else window_seconds
+
+    def disable(self, event_type: str) -> None:
+        self._windows.pop(event_type, None)
+
+    def window_for(self, event) -> float:
+        """Ventana de agrupación del evento en segundos (0 si no se agrupa)"""
+        if not event.aggregate_id:
+            return 0.0
+        return self._windows.get(event.event_type, 0.0)
+
+    def add(self, event, emit: Callable[[Any], None]) -> None:
+        """Retener el evento; al cerrar su ventana se llama a emit con el evento combinado"""
+        key = (event.event_type, event.aggregate_id)
+        self._received += 1
+
+        if key in self._pending:
+            self._pending[key].append(event)
+            return
+
+        self._pending[key] = [event]
+        loop = asyncio.get_running_loop()
+        self._timers[key] = loop.call_later(self.window_for(event), self._flush, key, emit)
+
+    def flush_all(self, emit: Callable[[Any], None]) -> None:
+        """Entregar ya todas las ráfagas retenidas (p. ej. al apagar)"""
+        for key in list(self._pending):
+            timer = self._timers.get(key)
+            if timer is not None:
+                timer.cancel()
+            self._flush(key, emit)
+
+    def group(self, events: List[Any]) -> List[Tuple[Any, List[int]]]:
+        """Agrupar una lista ya disponible (p. ej. un lote del outbox).
+
+        Devuelve (evento combinado, índices de los eventos originales) en el
+        orden de la primera aparición de cada grupo.
+        """
+        groups: Dict[Any, List[int]] = {}
+        for index, event in enumerate(events):
+            if self.window_for(event):
+                key: Any = (event.event_type, event.aggregate_id)
+            else:
+                key = index
+            groups.setdefault(key, []).append(index)
+
+        result = []
+        for indexes in groups.values():
+            members = [events[index] for index in indexes]
+            self._received += len(members)
+            self._emitted += 1
+            result.append((self.merge(members), indexes))
+        return result
+
+    @staticmethod
+    def merge(events: List[Any]):
+        """Combinar una ráfaga en un único evento"""
+        last = events[-1]
+        if len(events) == 1:
+            return last
+
+        merge_coalesced = getattr(type(last), "merge_coalesced", None)
+        merged = merge_coalesced(events) if merge_coalesced else copy.copy(last)
+        merged.occurred_at = last.occurred_at
+
+        metadata: Dict[str, Any] = {}
+        for event in events:
+            metadata.update(event.metadata or {})
+        metadata["coalesced_count"] = len(events)
+        keys = [event.metadata["idempotency_key"] for event in events if event.metadata and "idempotency_key" in event.metadata]
+        if keys:
+            metadata["coalesced_keys"] = keys
+        merged.metadata = metadata
+        return merged
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "event_types": {event_type: window for event_type, window in self._windows.items() if window},
+            "pending_groups": len(self._pending),
+            "received": self._received,
+            "emitted": self._emitted
+        }
+
+    def _flush(self, key: _CoalesceKey, emit: Callable[[Any], None]) -> None:
+        self._timers.pop(key, None)
+        events = self._pending.pop(key, None)
+        if events:
+            self._emitted += 1
+            emit(self.merge(events))
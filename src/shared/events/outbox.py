@@ -0,0 +1,194 @@
+# src/shared/events/outbox.py
+import dataclasses
+import importlib
+import os
+from datetime import date, datetime, timedelta
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from uuid import uuid4
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import IndexModel, ASCENDING
+from pymongo.errors import DuplicateKeyError
+from shared.database.Connection import DatabaseConnection
+from shared.errors.custom_errors import DatabaseError
+from .base_event import DomainEvent
+
+
+class EventOutbox:
+    """Outbox de eventos de dominio en MongoDB.
+
+    add() escribe el evento con la sesión de la transacción en curso, de modo
+    que queda persistido junto con el cambio del agregado. El _id del
+    documento es la clave de idempotencia del evento: reinsertar el mismo
+    evento no lo duplica y los handlers la reciben en metadata.
+    """
+
+    COLLECTION_NAME = "event_outbox"
+    INDEXES = [
+        IndexModel([("status", ASCENDING), ("available_at", ASCENDING)], name="status_available_at"),
+        IndexModel([("claim_token", ASCENDING)], name="claim_token", sparse=True),
+        IndexModel(
+            [("delivered_at", ASCENDING)],
+            name="delivered_at_ttl",
+            expireAfterSeconds=int(os.getenv("EVENT_OUTBOX_RETENTION_SECONDS", "604800"))
+        )
+    ]
+
+    STATUS_PENDING = "pending"
+    STATUS_PROCESSING = "processing"
+    STATUS_DELIVERED = "delivered"
+    STATUS_FAILED = "failed"
+
+    IDEMPOTENCY_KEY = "idempotency_key"
+
+    def _get_collection(self) -> AsyncIOMotorCollection:
+        return DatabaseConnection.get_database()[self.COLLECTION_NAME]
+
+    async def add(self, event: DomainEvent, delay_seconds: float = 0) -> str:
+        """Registrar un evento pendiente de entrega y devolver su clave de idempotencia.
+
+        delay_seconds retrasa su disponibilidad (ventana de agrupación).
+        """
+        metadata = dict(event.metadata or {})
+        key = metadata.get(self.IDEMPOTENCY_KEY) or str(uuid4())
+        metadata[self.IDEMPOTENCY_KEY] = key
+        event.metadata = metadata
+
+        now = datetime.utcnow()
+        document = {
+            "_id": key,
+            "event_type": event.event_type,
+            "aggregate_id": event.aggregate_id,
+            "event_class": f"{type(event).__module__}:{type(event).__qualname__}",
+            "payload": _to_document(dataclasses.asdict(event)),
+            "status": self.STATUS_PENDING,
+            "attempts": 0,
+            "created_at": now,
+            "available_at": now + timedelta(seconds=delay_seconds)
+        }
+
+        try:
+            await self._get_collection().insert_one(document, session=DatabaseConnection.current_session())
+        except DuplicateKeyError:
+            # Mismo evento ya registrado (reintento del caso de uso)
+            pass
+        except Exception as error:
+            raise DatabaseError(f"Error guardando evento en outbox: {str(error)}")
+
+        return key
+
+    async def claim_batch(self, limit: int, lease_seconds: float) -> List[Dict[str, Any]]:
+        """Reservar hasta limit eventos listos; los reservados por un proceso caído
+        vuelven a estar disponibles cuando vence su lease"""
+        try:
+            collection = self._get_collection()
+            now = datetime.utcnow()
+            claimable = {
+                "$or": [
+                    {"status": self.STATUS_PENDING, "available_at": {"$lte": now}},
+                    {"status": self.STATUS_PROCESSING, "locked_until": {"$lt": now}}
+                ]
+            }
+
+            cursor = collection.find(claimable, {"_id": 1}).sort("created_at", ASCENDING).limit(limit)
+            ids = [doc["_id"] async for doc in cursor]
+            if not ids:
+                return []
+
+            # Solo se quedan los que nadie reservó entre la lectura y la actualización
+            claim_token = str(uuid4())
+            await collection.update_many(
+                {"$and": [{"_id": {"$in": ids}}, claimable]},
+                {
+                    "$set": {
+                        "status": self.STATUS_PROCESSING,
+                        "claim_token": claim_token,
+                        "locked_until": now + timedelta(seconds=lease_seconds)
+                    },
+                    "$inc": {"attempts": 1}
+                }
+            )
+
+            cursor = collection.find({"claim_token": claim_token}).sort("created_at", ASCENDING)
+            return await cursor.to_list(length=limit)
+
+        except Exception as error:
+            raise DatabaseError(f"Error reservando eventos de outbox: {str(error)}")
+
+    async def mark_delivered(self, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        if not keys:
+            return
+
+        try:
+            await self._get_collection().update_many(
+                {"_id": {"$in": keys}},
+                {
+                    "$set": {"status": self.STATUS_DELIVERED, "delivered_at": datetime.utcnow()},
+                    "$unset": {"claim_token": "", "locked_until": ""}
+                }
+            )
+        except Exception as error:
+            raise DatabaseError(f"Error marcando eventos entregados: {str(error)}")
+
+    async def mark_failed(self, key: str, error_message: str, retry_at: Optional[datetime]) -> None:
+        """Reprogramar un evento o, sin retry_at, darlo por fallido definitivamente"""
+        update: Dict[str, Any] = {"last_error": error_message[:500]}
+        if retry_at is None:
+            update["status"] = self.STATUS_FAILED
+        else:
+            update["status"] = self.STATUS_PENDING
+            update["available_at"] = retry_at
+
+        try:
+            await self._get_collection().update_one(
+                {"_id": key},
+                {"$set": update, "$unset": {"claim_token": "", "locked_until": ""}}
+            )
+        except Exception as error:
+            raise DatabaseError(f"Error reprogramando evento de outbox: {str(error)}")
+
+    @staticmethod
+    def module_filter(module_names: Iterable[str]) -> Callable[[DomainEvent], bool]:
+        """Predicado de durabilidad: eventos definidos en los módulos indicados (p. ej. "trips")"""
+        durable_modules = {name.strip() for name in module_names if name.strip()}
+
+        def is_durable(event: DomainEvent) -> bool:
+            parts = type(event).__module__.split(".")
+            return len(parts) > 1 and parts[0] == "modules" and parts[1] in durable_modules
+
+        return is_durable
+
+    @staticmethod
+    def to_event(document: Dict[str, Any]) -> DomainEvent:
+        """Reconstruir el evento original a partir del documento de outbox"""
+        module_name, _, class_name = document["event_class"].partition(":")
+        event_class = getattr(importlib.import_module(module_name), class_name)
+
+        payload = document["payload"]
+        init_fields = {
+            field.name: payload[field.name]
+            for field in dataclasses.fields(event_class)
+            if field.init and field.name in payload
+        }
+        event = event_class(**init_fields)
+
+        # __post_init__ de los eventos recalcula estos campos; se restauran los originales
+        event.occurred_at = payload.get("occurred_at") or event.occurred_at
+        event.metadata = payload.get("metadata") or event.metadata
+        return event
+
+
+def _to_document(value: Any) -> Any:
+    """Convertir el payload de un evento a tipos que BSON acepta"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return datetime.combine(value, datetime.min.time())
+    if isinstance(value, dict):
+        return {str(key): _to_document(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_to_document(item) for item in value]
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return _to_document(dataclasses.asdict(value))
+    return value
@@ -0,0 +1,142 @@
+# src/shared/events/outbox_relay.py
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Optional
+from shared.utils.cache_utils import TTLCache
+from .event_bus import EventBus
+from .outbox import EventOutbox
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRelay:
+    """Entrega en segundo plano los eventos del outbox a los suscriptores del EventBus.
+
+    Semántica at-least-once: un evento solo se marca entregado cuando todos
+    sus handlers terminaron sin error; si falla se reintenta con backoff
+    exponencial hasta max_attempts. Los handlers reciben la clave de
+    idempotencia en event.metadata["idempotency_key"] para descartar
+    duplicados, y el relay recuerda las claves que ya entregó.
+    """
+
+    def __init__(
+        self,
+        outbox: EventOutbox,
+        event_bus: EventBus,
+        batch_size: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        lease_seconds: Optional[float] = None,
+        max_attempts: Optional[int] = None
+    ):
+        self._outbox = outbox
+        self._event_bus = event_bus
+        self._batch_size = batch_size or int(os.getenv("EVENT_OUTBOX_BATCH_SIZE", "100"))
+        self._poll_interval = poll_interval or float(os.getenv("EVENT_OUTBOX_POLL_SECONDS", "1"))
+        self._lease_seconds = lease_seconds or float(os.getenv("EVENT_OUTBOX_LEASE_SECONDS", "60"))
+        self._max_attempts = max_attempts or int(os.getenv("EVENT_OUTBOX_MAX_ATTEMPTS", "10"))
+
+        self._delivered_keys: TTLCache = TTLCache(max_entries=10000, ttl_seconds=self._lease_seconds * 2)
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._delivered = 0
+        self._retried = 0
+        self._failed = 0
+
+    def start(self) -> None:
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.get_running_loop().create_task(self._run(), name="outbox-relay")
+
+    async def stop(self) -> None:
+        """Terminar el lote en curso y detener el relay"""
+        if self._task is None:
+            return
+
+        self._stopping = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+
+    def notify(self) -> None:
+        """Despertar al relay tras registrar un evento (evita esperar al siguiente sondeo)"""
+        self._wakeup.set()
+
+    def get_stats(self):
+        return {
+            "running": self._task is not None,
+            "batch_size": self._batch_size,
+            "delivered": self._delivered,
+            "retried": self._retried,
+            "failed": self._failed
+        }
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                processed = await self.relay_batch()
+            except Exception:
+                logger.exception("Error procesando el outbox de eventos")
+                processed = 0
+
+            # Con un lote completo puede haber más pendientes: seguir sin esperar
+            if processed < self._batch_size and not self._stopping:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self._poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def relay_batch(self) -> int:
+        """Entregar un lote de eventos pendientes; devuelve cuántos se procesaron"""
+        documents = await self._outbox.claim_batch(self._batch_size, self._lease_seconds)
+        delivered_keys = []
+        claimed = []
+
+        for document in documents:
+            key = document["_id"]
+
+            if self._delivered_keys.get(key):
+                delivered_keys.append(key)
+                continue
+
+            try:
+                claimed.append((document, EventOutbox.to_event(document)))
+            except Exception as error:
+                await self._retry_or_fail(document, str(error))
+
+        # Las ráfagas del mismo agregado se entregan una sola vez y se marcan juntas
+        for event, indexes in self._event_bus.coalesce_batch([event for _, event in claimed]):
+            group = [claimed[index][0] for index in indexes]
+
+            try:
+                success = await self._event_bus.deliver(event)
+                error_message = "Uno o más handlers fallaron"
+            except Exception as error:
+                success = False
+                error_message = str(error)
+
+            for document in group:
+                if success:
+                    self._delivered_keys.set(document["_id"], True)
+                    delivered_keys.append(document["_id"])
+                else:
+                    await self._retry_or_fail(document, error_message)
+
+        await self._outbox.mark_delivered(delivered_keys)
+        self._delivered += len(delivered_keys)
+        return len(documents)
+
+    async def _retry_or_fail(self, document, error_message: str) -> None:
+        key = document["_id"]
+        attempts = document.get("attempts", 1)
+        if attempts >= self._max_attempts:
+            self._failed += 1
+            logger.error("Evento %s (%s) descartado tras %d intentos", key, document["event_type"], attempts)
+            await self._outbox.mark_failed(key, error_message, None)
+        else:
+            self._retried += 1
+            retry_at = datetime.utcnow() + timedelta(seconds=min(2 ** attempts, 300))
+            await self._outbox.mark_failed(key, error_message, retry_at)
@@ -13,7 +13,12 @@ class UploadFailedException(Exception):
         self.message = message
         super().__init__(self.message)
 
-class CloudinaryException(Exception):
+class StorageException(Exception):
+    def __init__(self, message: str = "Error en el almacenamiento de archivos"):
+        self.message = message
+        super().__init__(self.message)
+
+class CloudinaryException(StorageException):
     def __init__(self, message: str = "Error en Cloudinary"):
         self.message = message
         super().__init__(self.message)
\ No newline at end of file
@@ -7,9 +7,10 @@ from ..exceptions.AuthExceptions import TokenExpiredException, TokenInvalidExcep
 
 security = HTTPBearer(auto_error=False)
 
-def get_auth_service():
-    """Factory para obtener instancia de AuthService"""
-    return AuthService()
+def get_auth_service() -> AuthService:
+    """Instancia compartida de AuthService (una por proceso)"""
+    from ..services.ServiceFactory import ServiceFactory
+    return ServiceFactory.get_auth_service()
 
 async def get_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
@@ -19,7 +20,6 @@ async def get_current_user(
     
     # Verificar que se proporcionó el header de autorización
     if not credentials:
-        print("[ERROR] No se proporcionó token de autorización")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token de autorización requerido",
@@ -28,30 +28,28 @@ async def get_current_user(
     
     try:
         token = credentials.credentials
-        print(f"[DEBUG] Verificando token: {token[:20]}...")
-        
+
+        # Token reciente ya verificado: se evita decodificar y validar la firma
+        payload = auth_service.get_cached_claims(token, "access")
+        if payload is not None:
+            return payload
+
         # Verificar y decodificar token
-        payload = auth_service.verify_token(token, "access")
-        
-        print(f"[DEBUG] Usuario autenticado: {payload.get('sub')}")
-        return payload
+        return auth_service.verify_token(token, "access")
         
     except TokenExpiredException:
-        print("[ERROR] Token expirado")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token expirado",
             headers={"WWW-Authenticate": "Bearer"},
         )
     except TokenInvalidException as e:
-        print(f"[ERROR] Token inválido: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Token inválido: {str(e)}",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    except Exception as e:
-        print(f"[ERROR] Error inesperado en autenticación: {str(e)}")
+    except Exception:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="No se pudo validar las credenciales",
@@ -78,14 +76,13 @@ async def get_user_from_request(request: Request) -> Optional[Dict[str, Any]]:
             return None
         
         token = auth_header.replace("Bearer ", "")
-        auth_service = AuthService()
-        
-        # Debug: mostrar token decodificado sin verificar
-        decoded = auth_service.decode_token_without_verification(token)
-        print(f"[DEBUG] Token decodificado: {decoded}")
+        auth_service = get_auth_service()
         
-        payload = auth_service.verify_token(token, "access")
-        return payload
+        payload = auth_service.get_cached_claims(token, "access")
+        if payload is not None:
+            return payload
+
+        return auth_service.verify_token(token, "access")
         
     except Exception as e:
         print(f"[ERROR] Error obteniendo usuario desde request: {e}")
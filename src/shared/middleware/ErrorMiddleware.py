@@ -1,39 +1,89 @@
-from fastapi import Request, Response
+import json
+import logging
+import traceback
+from datetime import datetime
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
 from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
-from datetime import datetime
-import traceback
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from ..errors.custom_errors import AppError
+from ..utils import request_timing
+
+logger = logging.getLogger("voyaj.requests")
+
+
+class ErrorMiddleware:
+    """Middleware ASGI de errores y tiempos de petición.
+
+    Convierte las excepciones no controladas en el sobre de error JSON de la
+    API, añade la cabecera Server-Timing (total, base de datos y eventos) y
+    emite una línea de log JSON por petición. Al ser ASGI puro no envuelve la
+    respuesta en tasks ni streams, así que las respuestas en streaming pasan
+    sin cambios.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings, token = request_timing.begin_request()
+        response_started = False
+        status_code = HTTP_500_INTERNAL_SERVER_ERROR
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal response_started, status_code
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+                MutableHeaders(scope=message).append("Server-Timing", timings.server_timing())
+            await send(message)
 
-class ErrorMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
         try:
-            response = await call_next(request)
-            return response
-        except AppError as e:
+            await self.app(scope, receive, send_with_timing)
+        except Exception as error:
+            if response_started:
+                # Ya se enviaron las cabeceras: no se puede sustituir la respuesta
+                raise
+            await self._error_response(error)(scope, receive, send_with_timing)
+        finally:
+            summary = timings.to_dict()
+            request_timing.end_request(token)
+            logger.info(json.dumps({
+                "method": scope["method"],
+                "path": scope["path"],
+                "status": status_code,
+                **summary
+            }))
+
+    @staticmethod
+    def _error_response(error: Exception) -> JSONResponse:
+        if isinstance(error, AppError):
             return JSONResponse(
-                status_code=e.status_code,
+                status_code=error.status_code,
                 content={
                     "success": False,
-                    "error": e.error_code,
-                    "message": e.message,
-                    "details": e.details,
-                    "timestamp": e.timestamp.isoformat()
+                    "error": error.error_code,
+                    "message": error.message,
+                    "details": error.details,
+                    "timestamp": error.timestamp.isoformat()
                 }
             )
-        except Exception as e:
-            error_id = str(datetime.utcnow().timestamp())
-            print(f"[{datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}] [ERROR_MIDDLEWARE] [ERROR] Error no controlado ID:{error_id} - {str(e)}")
-            print(traceback.format_exc())
-            
-            return JSONResponse(
-                status_code=HTTP_500_INTERNAL_SERVER_ERROR,
-                content={
-                    "success": False,
-                    "error": "INTERNAL_SERVER_ERROR",
-                    "message": "Error interno del servidor",
-                    "error_id": error_id,
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-            )
\ No newline at end of file
+
+        error_id = str(datetime.utcnow().timestamp())
+        print(f"[{datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}] [ERROR_MIDDLEWARE] [ERROR] Error no controlado ID:{error_id} - {str(error)}")
+        print(traceback.format_exc())
+
+        return JSONResponse(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            content={
+                "success": False,
+                "error": "INTERNAL_SERVER_ERROR",
+                "message": "Error interno del servidor",
+                "error_id": error_id,
+                "timestamp": datetime.utcnow().isoformat()
+            }
+        )
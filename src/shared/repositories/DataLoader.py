@@ -0,0 +1,108 @@
+# src/shared/repositories/DataLoader.py
+import asyncio
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Iterable, List, Optional, Set, TypeVar
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+BatchLoadFn = Callable[[List[K]], Awaitable[Dict[K, V]]]
+
+# Estado de los loaders para la petición actual (id(loader) -> estado)
+_request_state: ContextVar[Optional[Dict[int, "_LoaderState"]]] = ContextVar(
+    "data_loader_request_state", default=None
+)
+
+
+class _LoaderState:
+    """Caché y cola pendiente de un loader dentro de una petición"""
+
+    def __init__(self):
+        self.cache: Dict[Any, asyncio.Future] = {}
+        self.queue: List[Any] = []
+        self.scheduled = False
+
+
+class DataLoader(Generic[K, V]):
+    """Agrupa las cargas por clave emitidas en el mismo tick del event loop
+    en una sola consulta y memoriza los resultados durante la petición"""
+
+    def __init__(self, batch_load_fn: BatchLoadFn, max_batch_size: int = 500):
+        self._batch_load_fn = batch_load_fn
+        self._max_batch_size = max_batch_size
+        self._pending_batches: Set[asyncio.Task] = set()
+
+    @staticmethod
+    def begin_request_scope() -> None:
+        """Iniciar un ámbito nuevo (caché vacía) para la petición actual"""
+        _request_state.set({})
+
+    async def load(self, key: K) -> Optional[V]:
+        """Cargar un valor por clave (None si no existe)"""
+        state = self._get_state()
+
+        future = state.cache.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            state.cache[key] = future
+            state.queue.append(key)
+
+            if not state.scheduled:
+                state.scheduled = True
+                loop.call_soon(self._dispatch, state)
+
+        return await future
+
+    async def load_many(self, keys: Iterable[K]) -> List[Optional[V]]:
+        """Cargar varios valores en un solo lote conservando el orden"""
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: K, value: V) -> None:
+        """Guardar un valor ya conocido en la caché de la petición"""
+        state = self._get_state()
+        if key not in state.cache:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            state.cache[key] = future
+
+    def clear(self, key: K) -> None:
+        """Invalidar una clave (p. ej. tras actualizar la entidad)"""
+        self._get_state().cache.pop(key, None)
+
+    def _get_state(self) -> _LoaderState:
+        states = _request_state.get()
+        if states is None:
+            states = {}
+            _request_state.set(states)
+
+        state = states.get(id(self))
+        if state is None:
+            state = _LoaderState()
+            states[id(self)] = state
+        return state
+
+    def _dispatch(self, state: _LoaderState) -> None:
+        keys, state.queue, state.scheduled = state.queue, [], False
+
+        for start in range(0, len(keys), self._max_batch_size):
+            batch = keys[start:start + self._max_batch_size]
+            task = asyncio.ensure_future(self._run_batch(state, batch))
+            # Guardar referencia para que el task no se recolecte antes de terminar
+            self._pending_batches.add(task)
+            task.add_done_callback(self._pending_batches.discard)
+
+    async def _run_batch(self, state: _LoaderState, keys: List[K]) -> None:
+        try:
+            results = await self._batch_load_fn(keys)
+        except Exception as error:
+            for key in keys:
+                future = state.cache.pop(key, None)
+                if future is not None and not future.done():
+                    future.set_exception(error)
+            return
+
+        for key in keys:
+            future = state.cache.get(key)
+            if future is not None and not future.done():
+                future.set_result(results.get(key))
@@ -0,0 +1,51 @@
+# src/shared/repositories/LoaderFactory.py
+from typing import Dict, Any, List
+from .DataLoader import DataLoader
+from .RepositoryFactory import RepositoryFactory
+
+
+class LoaderFactory:
+    """Loaders por lotes compartidos; su caché vive solo durante cada petición"""
+
+    _instances: Dict[str, Any] = {}
+
+    @staticmethod
+    async def begin_request_scope() -> None:
+        """Dependencia FastAPI: abre una caché de loaders vacía para la petición"""
+        DataLoader.begin_request_scope()
+
+    @classmethod
+    def get_user_loader(cls) -> DataLoader:
+        if 'user' not in cls._instances:
+            user_repo = RepositoryFactory.get_user_repository()
+
+            async def load_users(user_ids: List[str]) -> Dict[str, Any]:
+                users = await user_repo.find_by_ids(user_ids)
+                return {user.id: user for user in users}
+
+            cls._instances['user'] = DataLoader(load_users)
+        return cls._instances['user']
+
+    @classmethod
+    def get_trip_loader(cls) -> DataLoader:
+        if 'trip' not in cls._instances:
+            trip_repo = RepositoryFactory.get_trip_repository()
+
+            async def load_trips(trip_ids: List[str]) -> Dict[str, Any]:
+                trips = await trip_repo.find_by_ids(trip_ids)
+                return {trip.id: trip for trip in trips}
+
+            cls._instances['trip'] = DataLoader(load_trips)
+        return cls._instances['trip']
+
+    @classmethod
+    def get_trip_member_loader(cls) -> DataLoader:
+        if 'trip_member' not in cls._instances:
+            trip_member_repo = RepositoryFactory.get_trip_member_repository()
+
+            async def load_trip_members(member_ids: List[str]) -> Dict[str, Any]:
+                members = await trip_member_repo.find_by_ids(member_ids)
+                return {member.id: member for member in members}
+
+            cls._instances['trip_member'] = DataLoader(load_trip_members)
+        return cls._instances['trip_member']
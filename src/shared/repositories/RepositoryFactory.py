@@ -1,5 +1,5 @@
 # src/shared/repositories/RepositoryFactory.py
-from typing import Dict, Any
+from typing import Dict, Any, List
 from modules.users.infrastructure.repositories.UserMongoRepository import UserMongoRepository
 from modules.friendships.infrastructure.repositories.friendship_mongo_repository import FriendshipMongoRepository
 from modules.trips.infrastructure.repositories.trip_mongo_repository import TripMongoRepository
@@ -13,10 +13,37 @@ from modules.photos.infrastructure.repositories.photo_mongo_repository import Ph
 from modules.activity_votes.infrastructure.repositories.activity_vote_mongo_repository import ActivityVoteMongoRepository
 from modules.diary_recommendations.infrastructure.repositories.diary_recommendation_mongo_repository import DiaryRecommendationMongoRepository
 from modules.plan_reality_differences.infrastructure.repositories.plan_reality_difference_mongo_repository import PlanRealityDifferenceMongoRepository
+from shared.database.IndexRegistry import IndexRegistry
+from shared.events.outbox import EventOutbox
+from shared.storage.AssetIndex import AssetIndex
 
 
 class RepositoryFactory:
     _instances: Dict[str, Any] = {}
+
+    # Repositorios cuyos índices se aplican al arrancar
+    _indexed_repositories: List[type] = [
+        UserMongoRepository,
+        FriendshipMongoRepository,
+        TripMongoRepository,
+        TripMemberMongoRepository,
+        DayMongoRepository,
+        ActivityMongoRepository,
+        ExpenseMongoRepository,
+        ExpenseSplitMongoRepository,
+        PhotoMongoRepository,
+        ActivityVoteMongoRepository,
+        DiaryRecommendationMongoRepository,
+        PlanRealityDifferenceMongoRepository,
+        EventOutbox,
+        AssetIndex
+    ]
+
+    @classmethod
+    def register_indexes(cls) -> None:
+        """Registrar en IndexRegistry los índices declarados por cada repositorio"""
+        for repository_class in cls._indexed_repositories:
+            IndexRegistry.register_repository(repository_class)
     
     @classmethod
     def get_user_repository(cls) -> UserMongoRepository:
@@ -45,7 +72,12 @@ class RepositoryFactory:
         """Obtener repositorio de miembros de viaje"""
         if 'trip_member' not in cls._instances:
             from modules.trips.infrastructure.repositories.trip_member_mongo_repository import TripMemberMongoRepository
-            cls._instances['trip_member'] = TripMemberMongoRepository()
+            from modules.trips.domain.trip_member_cache import TripMemberCache
+            from shared.events.event_bus import EventBus
+
+            member_cache = TripMemberCache()
+            member_cache.register_handlers(EventBus.get_instance())
+            cls._instances['trip_member'] = TripMemberMongoRepository(member_cache)
         return cls._instances['trip_member']
     
     @classmethod
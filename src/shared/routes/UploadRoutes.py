@@ -1,13 +1,17 @@
 from fastapi import APIRouter, Depends, UploadFile, File, Form
-from typing import List
+from typing import List, Optional
 from ..controllers.UploadController import UploadController
 from ..middleware.AuthMiddleware import get_current_user
+from ..services.Container import Container
+from ..utils.json_utils import FastJSONRoute
 
-router = APIRouter(prefix="/api/upload")
+router = APIRouter(prefix="/api/upload", route_class=FastJSONRoute)
 
-def get_upload_controller():
+def _build_upload_controller():
     return UploadController()
 
+get_upload_controller = Container.provider("upload_controller", _build_upload_controller)
+
 @router.post("/profile-picture", summary="Subir foto de perfil")
 async def upload_profile_picture(
     file: UploadFile = File(...),
@@ -65,7 +69,43 @@ async def upload_document(
     """
     return await controller.upload_document(folder, file, current_user)
 
-@router.delete("/file/{public_id}", summary="Eliminar archivo")
+@router.delete("/document/{folder}/{public_id:path}", summary="Eliminar documento")
+async def delete_document(
+    folder: str,
+    public_id: str,
+    controller: UploadController = Depends(get_upload_controller),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Eliminar un documento subido a una carpeta del usuario.
+    
+    - **folder**: Carpeta en la que se subió el documento
+    - **public_id**: ID público del documento
+    
+    Si el mismo archivo sigue en uso por otro registro se conserva y la
+    respuesta indica **deleted**: false.
+    """
+    return await controller.delete_document(folder, public_id, current_user)
+
+@router.get("/files/{public_id:path}", summary="Descargar archivo local")
+async def get_local_file(
+    public_id: str,
+    expires: Optional[int] = None,
+    signature: Optional[str] = None,
+    controller: UploadController = Depends(get_upload_controller)
+):
+    """
+    Servir un archivo guardado con STORAGE_BACKEND=local.
+    
+    - **public_id**: Ruta del archivo
+    - **expires** / **signature**: Parámetros de una URL firmada
+    
+    Soporta peticiones Range; las URLs sin firma de nombre aleatorio se cachean
+    como inmutables.
+    """
+    return await controller.get_local_file(public_id, expires, signature)
+
+@router.delete("/file/{public_id:path}", summary="Eliminar archivo")
 async def delete_file(
     public_id: str,
     resource_type: str = "image",
@@ -73,11 +113,14 @@ async def delete_file(
     current_user: dict = Depends(get_current_user)
 ):
     """
-    Eliminar archivo de Cloudinary.
+    Eliminar archivo del almacenamiento.
     
-    - **public_id**: ID público del archivo en Cloudinary
+    - **public_id**: ID público del archivo
     - **resource_type**: Tipo de recurso ("image", "raw", "video")
     
+    Devuelve 409 si el archivo sigue en uso por otro registro; los documentos
+    se eliminan con DELETE /document/{folder}/{public_id}.
+    
     ⚠️ **Advertencia**: Esta acción es irreversible.
     """
     return await controller.delete_file(public_id, resource_type, current_user)
\ No newline at end of file
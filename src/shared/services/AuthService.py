@@ -1,9 +1,12 @@
 # src/shared/services/AuthService.py
+import hashlib
 import os
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, Optional
 import jwt
 from ..exceptions.AuthExceptions import TokenExpiredException, TokenInvalidException
+from ..utils.cache_utils import TTLCache
 
 class AuthService:
     def __init__(self):
@@ -11,6 +14,13 @@ class AuthService:
         self.algorithm = "HS256"
         self.access_token_expire_minutes = int(os.getenv("JWT_EXPIRATION_HOURS", "24")) * 60
         self.refresh_token_expire_days = int(os.getenv("REFRESH_TOKEN_EXPIRATION_DAYS", "30"))
+
+        # Claims ya verificados por digest del token; ninguna entrada sobrevive a su "exp"
+        self._claims_cache_ttl = float(os.getenv("JWT_CLAIMS_CACHE_TTL_SECONDS", "300"))
+        self._verified_claims: TTLCache = TTLCache(
+            max_entries=int(os.getenv("JWT_CLAIMS_CACHE_MAX_ENTRIES", "10000")),
+            ttl_seconds=self._claims_cache_ttl
+        )
         
         # Log de configuración para debug
         print(f"[INFO] AuthService inicializado:")
@@ -30,9 +40,7 @@ class AuthService:
             "type": "access"
         })
         
-        token = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
-        print(f"[DEBUG] Token creado para usuario: {data.get('sub', 'unknown')}")
-        return token
+        return jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
 
     def create_refresh_token(self, data: Dict[str, Any]) -> str:
         """Crear refresh token"""
@@ -50,7 +58,7 @@ class AuthService:
         return jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
 
     def verify_token(self, token: str, token_type: str = "access") -> Dict[str, Any]:
-        """Verificar y decodificar token"""
+        """Verificar y decodificar token (guarda los claims válidos en caché)"""
         try:
             # Decodificar token
             payload = jwt.decode(
@@ -62,27 +70,53 @@ class AuthService:
             
             # Verificar tipo de token
             if payload.get("type") != token_type:
-                print(f"[ERROR] Tipo de token inválido. Esperado: {token_type}, Recibido: {payload.get('type')}")
                 raise TokenInvalidException("Tipo de token inválido")
             
             # Verificar que el token tenga un subject
             if not payload.get("sub"):
-                print("[ERROR] Token sin subject (sub)")
                 raise TokenInvalidException("Token sin identificador de usuario")
             
-            print(f"[DEBUG] Token verificado exitosamente para usuario: {payload.get('sub')}")
-            return payload
+            self._cache_claims(token, payload)
+            return dict(payload)
             
+        except TokenInvalidException:
+            raise
         except jwt.ExpiredSignatureError:
-            print("[ERROR] Token expirado")
             raise TokenExpiredException("Token expirado")
         except jwt.InvalidTokenError as e:
-            print(f"[ERROR] Token inválido: {str(e)}")
             raise TokenInvalidException(f"Token inválido: {str(e)}")
         except Exception as e:
-            print(f"[ERROR] Error inesperado verificando token: {str(e)}")
             raise TokenInvalidException(f"Error verificando token: {str(e)}")
 
+    def get_cached_claims(self, token: str, token_type: str = "access") -> Optional[Dict[str, Any]]:
+        """Claims de un token ya verificado y aún vigente, sin recalcular la firma"""
+        digest = self._token_digest(token)
+        payload = self._verified_claims.get(digest)
+        if payload is None or payload.get("type") != token_type:
+            return None
+
+        # El TTL de la entrada es monotónico; "exp" manda si el reloj de pared difiere
+        if payload["exp"] <= time.time():
+            self._verified_claims.pop(digest)
+            return None
+
+        return dict(payload)
+
+    def _cache_claims(self, token: str, payload: Dict[str, Any]) -> None:
+        exp = payload.get("exp")
+        if not isinstance(exp, (int, float)):
+            return
+
+        remaining = exp - time.time()
+        if remaining > 0:
+            self._verified_claims.set(
+                self._token_digest(token), payload, ttl_seconds=min(remaining, self._claims_cache_ttl)
+            )
+
+    @staticmethod
+    def _token_digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
     def refresh_access_token(self, refresh_token: str) -> str:
         """Generar nuevo access token usando refresh token"""
         payload = self.verify_token(refresh_token, "refresh")
@@ -0,0 +1,64 @@
+# src/shared/services/Container.py
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+T = TypeVar('T')
+
+logger = logging.getLogger(__name__)
+
+
+class Container:
+    """Contenedor de dependencias por proceso para controladores y casos de uso.
+
+    Cada módulo registra un builder que arma su grafo (controlador y casos de
+    uso) a partir de RepositoryFactory/ServiceFactory. El grafo se construye
+    una sola vez y Depends() recibe siempre la misma instancia: los
+    controladores y casos de uso no guardan estado de la petición (el de
+    petición vive en ContextVars: caché de DataLoader, sesión de transacción).
+    """
+
+    _instances: Dict[str, Any] = {}
+    _builders: Dict[str, Callable[[], Any]] = {}
+
+    @classmethod
+    def provider(cls, name: str, builder: Callable[[], T]) -> Callable[[], Awaitable[T]]:
+        """Registrar un builder y devolver la dependencia para Depends()"""
+        if name in cls._builders:
+            raise ValueError(f"La dependencia '{name}' ya está registrada")
+        cls._builders[name] = builder
+
+        # async para que FastAPI la resuelva en el event loop, sin pasar por el
+        # threadpool que usa con las dependencias síncronas
+        async def provide() -> T:
+            return cls.resolve(name)
+
+        provide.__name__ = f"get_{name}"
+        provide.__qualname__ = provide.__name__
+        return provide
+
+    @classmethod
+    def resolve(cls, name: str) -> Any:
+        instance = cls._instances.get(name)
+        if instance is None:
+            instance = cls._instances[name] = cls._builders[name]()
+        return instance
+
+    @classmethod
+    def warm_up(cls) -> None:
+        """Construir al arrancar todos los grafos registrados.
+
+        Si alguno falla se registra el error y se reintenta en su primera petición.
+        """
+        for name in cls._builders:
+            try:
+                cls.resolve(name)
+            except Exception:
+                logger.exception("Error inicializando dependencia %s", name)
+
+    @classmethod
+    def reset(cls, name: Optional[str] = None) -> None:
+        """Descartar instancias construidas (todas o una) para reconstruirlas"""
+        if name is None:
+            cls._instances.clear()
+        else:
+            cls._instances.pop(name, None)
@@ -0,0 +1,144 @@
+import asyncio
+import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from PIL import Image, ImageOps
+
+# Lado mayor (px) de cada tamaño derivado
+DERIVATIVE_SIZES: Dict[str, int] = {
+    "thumb": 320,
+    "medium": 800,
+    "large": 1600
+}
+
+DERIVATIVE_FORMATS: Dict[str, Tuple[str, str]] = {
+    "webp": ("WEBP", "image/webp"),
+    "jpeg": ("JPEG", "image/jpeg")
+}
+
+_SAVE_OPTIONS: Dict[str, Dict[str, object]] = {
+    "WEBP": {"method": 4},
+    "JPEG": {"optimize": True, "progressive": True}
+}
+
+_EXIF_ORIENTATION = 0x0112
+
+
+@dataclass
+class ImageDerivative:
+    size: str
+    format: str
+    content_type: str
+    data: bytes
+    width: int
+    height: int
+
+
+@dataclass
+class DerivativeSet:
+    """Tamaños derivados de una imagen y dimensiones del original"""
+    width: int
+    height: int
+    derivatives: List[ImageDerivative] = field(default_factory=list)
+
+
+def render_derivatives(data: bytes, sizes: Dict[str, int], quality: int) -> DerivativeSet:
+    """Generar cada tamaño en WebP y JPEG (se ejecuta en un proceso del pool).
+
+    La orientación EXIF se aplica a los píxeles y después se vuelve a
+    codificar sin metadatos, así que los derivados no llevan EXIF (ni GPS).
+    Nunca se amplía una imagen más pequeña que el tamaño pedido.
+    """
+    with Image.open(io.BytesIO(data)) as source:
+        original_width, original_height = source.size
+        if source.getexif().get(_EXIF_ORIENTATION) in (5, 6, 7, 8):
+            original_width, original_height = original_height, original_width
+        icc_profile = source.info.get("icc_profile")
+
+        # En JPEG el decodificador puede reducir por 2/4/8 al leer: mucho más rápido
+        largest = max(sizes.values())
+        source.draft("RGB", (largest, largest))
+        image = _to_rgb(ImageOps.exif_transpose(source))
+    # Sin EXIF ni otros metadatos del original; solo se conserva el perfil de color
+    image.info = {}
+
+    result = DerivativeSet(width=original_width, height=original_height)
+    for size_name, max_side in sorted(sizes.items(), key=lambda item: item[1], reverse=True):
+        # Se reduce desde el tamaño anterior (ya menor) en lugar de desde el original
+        if max(image.size) > max_side:
+            image = image.copy()
+            image.thumbnail((max_side, max_side), Image.LANCZOS)
+
+        for format_name, (pil_format, content_type) in DERIVATIVE_FORMATS.items():
+            output = io.BytesIO()
+            image.save(output, pil_format, quality=quality, icc_profile=icc_profile, **_SAVE_OPTIONS[pil_format])
+            result.derivatives.append(ImageDerivative(
+                size=size_name,
+                format=format_name,
+                content_type=content_type,
+                data=output.getvalue(),
+                width=image.width,
+                height=image.height
+            ))
+
+    return result
+
+
+def _to_rgb(image: Image.Image) -> Image.Image:
+    """Pasar a RGB; la transparencia se compone sobre fondo blanco"""
+    if image.mode == "RGB":
+        return image
+    if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+        rgba = image.convert("RGBA")
+        background = Image.new("RGB", rgba.size, (255, 255, 255))
+        background.paste(rgba, mask=rgba.getchannel("A"))
+        return background
+    return image.convert("RGB")
+
+
+class ImageProcessor:
+    """Generación de derivados de imagen en un pool de procesos.
+
+    Redimensionar y codificar es CPU puro y Pillow retiene el GIL en buena
+    parte del trabajo, así que se usa un ProcessPoolExecutor acotado
+    (IMAGE_PROCESSOR_WORKERS) que se crea en el primer uso. Los procesos se
+    arrancan con spawn para no heredar el event loop ni los hilos de Motor.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        sizes: Optional[Dict[str, int]] = None,
+        quality: Optional[int] = None
+    ):
+        self.max_workers = max_workers or int(os.getenv("IMAGE_PROCESSOR_WORKERS", "2"))
+        self.sizes = sizes or DERIVATIVE_SIZES
+        self.quality = quality or int(os.getenv("IMAGE_DERIVATIVE_QUALITY", "80"))
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    async def generate(self, data: bytes) -> DerivativeSet:
+        """Generar los derivados de una imagen sin bloquear el event loop"""
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._get_executor(), render_derivatives, data, self.sizes, self.quality)
+        except BrokenProcessPool:
+            # Un proceso murió (p. ej. por memoria): el pool queda inservible y se recrea en el siguiente uso
+            self.shutdown(wait=False)
+            raise
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
@@ -0,0 +1,107 @@
+# src/shared/services/PasswordHasher.py
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+import bcrypt
+from ..errors.custom_errors import RateLimitError
+
+
+class PasswordHasher:
+    """Hash y verificación bcrypt en un pool de hilos propio y acotado.
+
+    bcrypt libera el GIL, así que el event loop sigue atendiendo peticiones
+    mientras los hilos calculan. Si hay más de max_pending operaciones en
+    curso o en cola se rechaza la nueva con RateLimitError en lugar de
+    acumular latencia.
+
+    El coste (BCRYPT_ROUNDS) se ajusta por despliegue; los hashes con otro
+    coste se regeneran en el siguiente login correcto (needs_rehash).
+    """
+
+    MIN_ROUNDS = 4
+    MAX_ROUNDS = 31
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        rounds: Optional[int] = None
+    ):
+        self._rounds = rounds or int(os.getenv("BCRYPT_ROUNDS", "12"))
+        if not self.MIN_ROUNDS <= self._rounds <= self.MAX_ROUNDS:
+            raise ValueError(f"BCRYPT_ROUNDS debe estar entre {self.MIN_ROUNDS} y {self.MAX_ROUNDS}")
+
+        self._max_workers = max_workers or int(os.getenv("PASSWORD_HASHER_WORKERS", "2"))
+        self._max_pending = max_pending or int(os.getenv("PASSWORD_HASHER_MAX_PENDING", "32"))
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix="password-hasher"
+        )
+        self._pending = 0
+        self._rejected = 0
+
+    async def hash(self, password: str) -> str:
+        """Hashear contraseña fuera del event loop"""
+        return await self._submit(self.hash_sync, password, self._rounds)
+
+    async def verify(self, password: str, password_hash: str) -> bool:
+        """Verificar contraseña fuera del event loop"""
+        if not password_hash:
+            return False
+        return await self._submit(self.verify_sync, password, password_hash)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """True si el hash se generó con un coste distinto al configurado"""
+        return self.get_rounds(password_hash) != self._rounds
+
+    @staticmethod
+    def get_rounds(password_hash: str) -> Optional[int]:
+        # Formato modular: $2b$<coste>$<salt+hash>
+        parts = password_hash.split('$')
+        if len(parts) < 4 or not parts[2].isdigit():
+            return None
+        return int(parts[2])
+
+    @staticmethod
+    def hash_sync(password: str, rounds: int = 12) -> str:
+        password_bytes = password.encode('utf-8')
+        salt = bcrypt.gensalt(rounds=rounds)
+        return bcrypt.hashpw(password_bytes, salt).decode('utf-8')
+
+    @staticmethod
+    def verify_sync(password: str, password_hash: str) -> bool:
+        try:
+            return bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8'))
+        except ValueError:
+            # Hash almacenado con formato inválido
+            return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self._max_workers,
+            "rounds": self._rounds,
+            "max_pending": self._max_pending,
+            "pending": self._pending,
+            "rejected": self._rejected
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+    async def _submit(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if self._pending >= self._max_pending:
+            self._rejected += 1
+            raise RateLimitError("Demasiadas solicitudes de autenticación, intenta de nuevo en unos segundos")
+
+        # El contador se libera cuando termina el hilo, no cuando se cancela la
+        # petición que esperaba, para que la cola refleje el trabajo real
+        self._pending += 1
+        future = self._executor.submit(fn, *args)
+        loop = asyncio.get_running_loop()
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release))
+
+        return await asyncio.wrap_future(future)
+
+    def _release(self) -> None:
+        self._pending -= 1
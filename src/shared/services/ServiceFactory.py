@@ -1,7 +1,10 @@
 # src/shared/services/ServiceFactory.py
+import os
 from typing import Dict, Any
 from .AuthService import AuthService
 from .EmailService import EmailService
+from .PasswordHasher import PasswordHasher
+from .ImageProcessor import ImageProcessor
 from .UploadService import UploadService
 from shared.repositories.RepositoryFactory import RepositoryFactory
 
@@ -24,22 +27,95 @@ class ServiceFactory:
     @classmethod
     def get_upload_service(cls) -> UploadService:
         if 'upload' not in cls._instances:
-            cls._instances['upload'] = UploadService()
+            image_processor = None
+            if os.getenv("IMAGE_DERIVATIVES_ENABLED", "true").lower() in ("1", "true", "yes"):
+                image_processor = ImageProcessor()
+            asset_index = None
+            if os.getenv("UPLOAD_DEDUP_ENABLED", "true").lower() in ("1", "true", "yes"):
+                from shared.storage.AssetIndex import AssetIndex
+                asset_index = AssetIndex()
+            cls._instances['upload'] = UploadService(
+                storage=cls.get_storage_backend(),
+                image_processor=image_processor,
+                asset_index=asset_index
+            )
         return cls._instances['upload']
+
+    @classmethod
+    def get_storage_backend(cls):
+        """Backend de almacenamiento de archivos según STORAGE_BACKEND (cloudinary | local)"""
+        if 'storage' not in cls._instances:
+            backend = os.getenv("STORAGE_BACKEND", "cloudinary").lower()
+            if backend == "local":
+                from shared.storage.LocalStorage import LocalStorage
+                cls._instances['storage'] = LocalStorage()
+            elif backend == "cloudinary":
+                from shared.storage.CloudinaryStorage import CloudinaryStorage
+                cls._instances['storage'] = CloudinaryStorage()
+            else:
+                raise ValueError(f"STORAGE_BACKEND no soportado: {backend}")
+        return cls._instances['storage']
     
+    @classmethod
+    def get_password_hasher(cls) -> PasswordHasher:
+        if 'password_hasher' not in cls._instances:
+            cls._instances['password_hasher'] = PasswordHasher()
+        return cls._instances['password_hasher']
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Cerrar los pools de los servicios ya creados (subidas y hashing)"""
+        for name in ('upload', 'password_hasher'):
+            service = cls._instances.get(name)
+            if service is not None:
+                service.shutdown()
+
+    @classmethod
+    def get_outbox_relay(cls):
+        """Relay del outbox de eventos (activa el outbox en el EventBus)"""
+        if 'outbox_relay' not in cls._instances:
+            from shared.events.event_bus import EventBus
+            from shared.events.outbox import EventOutbox
+            from shared.events.outbox_relay import OutboxRelay
+
+            event_bus = EventBus.get_instance()
+            outbox = EventOutbox()
+            relay = OutboxRelay(outbox, event_bus)
+            durable_modules = os.getenv("EVENT_OUTBOX_MODULES", "trips,days,activities,expenses").split(",")
+
+            event_bus.enable_outbox(outbox, EventOutbox.module_filter(durable_modules), on_write=relay.notify)
+            cls._instances['outbox_relay'] = relay
+        return cls._instances['outbox_relay']
+
     @classmethod
     def get_friendship_service(cls):
         """Obtener servicio de amistades"""
         if 'friendship' not in cls._instances:
             from modules.friendships.domain.friendship_service import FriendshipService
             
+            from shared.events.event_bus import EventBus
+
             friendship_repo = RepositoryFactory.get_friendship_repository()
             
-            # FriendshipService solo necesita friendship_repository
-            cls._instances['friendship'] = FriendshipService(
-                friendship_repository=friendship_repo
+            friendship_service = FriendshipService(
+                friendship_repository=friendship_repo,
+                friend_graph_cache=cls.get_friend_graph_cache()
             )
+            friendship_service.register_handlers(EventBus.get_instance())
+            cls._instances['friendship'] = friendship_service
         return cls._instances['friendship']
+
+    @classmethod
+    def get_friend_graph_cache(cls):
+        """Obtener índice en memoria de amistades (actualizado por eventos)"""
+        if 'friend_graph' not in cls._instances:
+            from modules.friendships.domain.friend_graph_cache import FriendGraphCache
+            from shared.events.event_bus import EventBus
+
+            friend_graph = FriendGraphCache()
+            friend_graph.register_handlers(EventBus.get_instance())
+            cls._instances['friend_graph'] = friend_graph
+        return cls._instances['friend_graph']
     
     @classmethod
     def get_trip_service(cls):
@@ -1,25 +1,65 @@
 # src/shared/services/UploadService.py
-import cloudinary
-import cloudinary.uploader
+import asyncio
+import functools
+import hashlib
+import io
+import logging
 import os
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, BinaryIO, Callable, Dict, Any, List, Optional, Set, Tuple, TypeVar
 from fastapi import UploadFile
 from ..exceptions.UploadExceptions import (
     FileTooLargeException, 
     InvalidFileTypeException, 
     UploadFailedException,
-    CloudinaryException
+    StorageException
 )
+from ..storage.AssetIndex import AssetIndex
+from ..storage.StorageBackend import StorageBackend, StoredObject
+from .ImageProcessor import ImageProcessor
+from ..utils.upload_utils import SIGNATURE_BYTES, LimitedUploadStream, detect_content_type
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+logger = logging.getLogger(__name__)
 
 class UploadService:
-    def __init__(self):
-        cloudinary.config(
-            cloud_name=os.getenv("CLOUDINARY_CLOUD_NAME"),
-            api_key=os.getenv("CLOUDINARY_API_KEY"),
-            api_secret=os.getenv("CLOUDINARY_API_SECRET")
-        )
-        
+    """Subidas de archivos sobre un StorageBackend (Cloudinary o disco local).
+
+    Los backends son síncronos: cada llamada se ejecuta en un pool de hilos
+    propio y acotado (UPLOAD_WORKERS) para no bloquear el event loop, y cada
+    petición sube como mucho UPLOAD_CONCURRENCY_PER_REQUEST archivos a la vez.
+
+    Los archivos no se cargan enteros en memoria: se valida la firma del
+    primer bloque y se entregan al backend como stream, cortando en cuanto
+    superan el tamaño máximo.
+
+    Con un ImageProcessor las fotos de viaje pueden generar además tamaños
+    derivados (WebP y JPEG sin EXIF) que se guardan junto al original.
+
+    Con un AssetIndex las fotos de viaje y los documentos se deduplican: el
+    archivo se hashea (SHA-256) al validarlo y, si el mismo contenido ya se
+    subió en el ámbito (UPLOAD_DEDUP_SCOPE: trip por viaje/usuario o global),
+    se reutilizan su public_id y sus derivados en lugar de subirlo otra vez.
+    """
+
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        storage: StorageBackend,
+        image_processor: Optional[ImageProcessor] = None,
+        asset_index: Optional[AssetIndex] = None,
+        max_workers: Optional[int] = None,
+        max_concurrent_per_request: Optional[int] = None
+    ):
+        self.storage = storage
+        self.image_processor = image_processor
+        self.asset_index = asset_index
+        self.dedup_scope = os.getenv("UPLOAD_DEDUP_SCOPE", "trip").lower()
         self.max_file_size = 5 * 1024 * 1024  # 5MB
+        self.max_document_size = 10 * 1024 * 1024  # 10MB para documentos
         self.allowed_image_types = {
             "image/jpeg", "image/jpg", "image/png", "image/webp", "image/gif"
         }
@@ -28,16 +68,23 @@ class UploadService:
             "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
         }
 
+        self.max_concurrent_per_request = max_concurrent_per_request or int(os.getenv("UPLOAD_CONCURRENCY_PER_REQUEST", "4"))
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or int(os.getenv("UPLOAD_WORKERS", "8")),
+            thread_name_prefix="upload"
+        )
+
     async def upload_profile_picture(self, file: UploadFile, user_id: str) -> Dict[str, str]:
-        """Subir imagen de perfil a Cloudinary"""
+        """Subir imagen de perfil"""
         self._validate_image_file(file)
         
         try:
-            file_content = await file.read()
-            
-            result = cloudinary.uploader.upload(
-                file_content,
+            stored = await self._stream_upload(
+                file,
+                self.allowed_image_types,
+                self.max_file_size,
                 folder=f"voyaj/profiles/{user_id}",
+                resource_type="image",
                 transformation=[
                     {"width": 400, "height": 400, "crop": "fill", "gravity": "face"},
                     {"quality": "auto", "fetch_format": "auto"}
@@ -47,74 +94,205 @@ class UploadService:
             )
             
             return {
-                "url": result["secure_url"],
-                "public_id": result["public_id"]
+                "url": stored.url,
+                "public_id": stored.public_id
             }
             
+        except (FileTooLargeException, InvalidFileTypeException):
+            raise
         except Exception as e:
-            raise CloudinaryException(f"Error al subir imagen: {str(e)}")
+            raise StorageException(f"Error al subir imagen: {str(e)}")
 
     async def delete_file(self, public_id: str, resource_type: str = "image") -> bool:
-        """Eliminar archivo de Cloudinary"""
+        """Eliminar archivo del almacenamiento (no se borra si otro registro lo reutiliza)"""
+        try:
+            if await self.is_file_in_use(public_id):
+                return False
+            return await self._run_blocking(self.storage.delete, public_id, resource_type)
+        except Exception as e:
+            raise StorageException(f"Error al eliminar archivo: {str(e)}")
+
+    async def is_file_in_use(self, public_id: str) -> bool:
+        """True si algún registro del índice de archivos sigue usando el public_id"""
         try:
-            result = cloudinary.uploader.destroy(public_id, resource_type=resource_type)
-            return result.get("result") == "ok"
+            return self.asset_index is not None and bool(await self.asset_index.referenced([public_id]))
         except Exception as e:
-            raise CloudinaryException(f"Error al eliminar archivo: {str(e)}")
+            raise StorageException(f"Error al comprobar archivo: {str(e)}")
+
+    async def delete_document(self, user_id: str, folder: str, public_id: str) -> bool:
+        """Liberar un documento del usuario y borrarlo si ya nadie lo usa"""
+        if self.asset_index is not None:
+            try:
+                await self.asset_index.release(self._scope_for(f"user:{user_id}:{folder}"), public_id)
+            except Exception as e:
+                raise StorageException(f"Error al eliminar archivo: {str(e)}")
+
+        return await self.delete_file(public_id, "raw")
+
+    async def delete_photo_files(self, trip_id: str, public_id: str, variant_public_ids: List[str]) -> None:
+        """Liberar la foto de un viaje y borrar original y derivados si ya nadie los usa"""
+        if self.asset_index is not None:
+            try:
+                await self.asset_index.release(self._scope_for(f"trip:{trip_id}"), public_id)
+            except Exception as e:
+                raise StorageException(f"Error al eliminar archivo: {str(e)}")
+
+        await self.delete_file(public_id, "image")
+        await self.delete_files(variant_public_ids)
 
     def extract_public_id_from_url(self, url: str) -> Optional[str]:
-        """Extraer public_id de una URL de Cloudinary"""
+        """Extraer public_id de una URL del almacenamiento"""
+        return self.storage.public_id_from_url(url)
+
+    def get_signed_url(self, public_id: str, resource_type: str = "image", expires_in: Optional[int] = None) -> str:
+        """URL firmada y con caducidad de un archivo"""
+        return self.storage.signed_url(public_id, resource_type, expires_in)
+
+    async def upload_trip_photo(self, file: UploadFile, trip_id: str, user_id: str, dedup: bool = True) -> Dict[str, str]:
+        """Subir una foto de viaje.
+
+        Con dedup (y AssetIndex) la subida suma una referencia en el índice que
+        debe liberarse con delete_photo_files al borrar la foto o si no llega a
+        crearse su registro.
+        """
+        self._validate_image_file(file)
+
+        try:
+            stored = await self._stream_upload(
+                file,
+                self.allowed_image_types,
+                self.max_file_size,
+                folder=f"voyaj/trips/{trip_id}/photos",
+                resource_type="image",
+                dedup_scope=self._scope_for(f"trip:{trip_id}") if dedup else None,
+                transformation=[
+                    {"width": 1200, "height": 800, "crop": "limit"},
+                    {"quality": "auto", "fetch_format": "auto"}
+                ],
+                use_filename=True,
+                unique_filename=True
+            )
+
+            return {
+                "filename": file.filename,
+                "url": stored.url,
+                "public_id": stored.public_id,
+                "content_hash": stored.content_hash,
+                "reused": stored.reused
+            }
+
+        except (FileTooLargeException, InvalidFileTypeException):
+            raise
+        except Exception as e:
+            raise StorageException(f"Error al subir imagen: {str(e)}")
+
+    async def upload_photo_derivatives(
+        self,
+        file: UploadFile,
+        trip_id: str,
+        content_hash: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Generar y guardar los tamaños derivados de una foto ya subida.
+
+        Devuelve las dimensiones del original, las URLs por tamaño y formato
+        (variants), la URL de la miniatura y los public_id de los derivados, o
+        None si no hay procesador o no se pudieron generar o guardar (la foto
+        se conserva sin derivados). Con content_hash se reutilizan los
+        derivados de una subida anterior del mismo contenido.
+        """
+        if self.image_processor is None:
+            return None
+
+        asset_key = None
+        if self.asset_index is not None and content_hash:
+            asset_key = AssetIndex.key(self._scope_for(f"trip:{trip_id}"), "image", content_hash)
+            existing = await self.asset_index.get_derivatives(asset_key)
+            if existing:
+                return existing
+
         try:
-            # URL ejemplo: https://res.cloudinary.com/cloud_name/image/upload/v123456789/voyaj/profiles/user_id/profile_user_id.webp
-            parts = url.split('/')
-            if 'voyaj' in parts:
-                voyaj_index = parts.index('voyaj')
-                public_id_parts = parts[voyaj_index:]
-                public_id = '/'.join(public_id_parts)
-                # Remover extensión
-                if '.' in public_id:
-                    public_id = public_id.rsplit('.', 1)[0]
-                return public_id
+            data = await self._run_blocking(self._read_for_processing, file.file, self.max_file_size)
+            rendered = await self.image_processor.generate(data)
         except Exception:
-            pass
-        return None
+            logger.exception("No se pudieron generar los derivados de %s", file.filename)
+            return None
+
+        folder = f"voyaj/trips/{trip_id}/photos/derivatives"
+        results = await asyncio.gather(
+            *(
+                self._run_blocking(
+                    self.storage.put,
+                    io.BytesIO(derivative.data),
+                    f"{derivative.size}.{derivative.format}",
+                    derivative.content_type,
+                    folder,
+                    "image",
+                    {"use_filename": True, "unique_filename": True}
+                )
+                for derivative in rendered.derivatives
+            ),
+            return_exceptions=True
+        )
+
+        stored = [result for result in results if isinstance(result, StoredObject)]
+        if len(stored) != len(results):
+            # Sin el juego completo no se registran derivados: se limpian los guardados
+            await self.delete_files([stored_object.public_id for stored_object in stored])
+            error = next(result for result in results if isinstance(result, BaseException))
+            logger.error("No se pudieron guardar los derivados de %s: %s", file.filename, error)
+            return None
+
+        variants: Dict[str, Dict[str, Any]] = {}
+        for derivative, stored_object in zip(rendered.derivatives, stored):
+            variant = variants.setdefault(derivative.size, {"width": derivative.width, "height": derivative.height})
+            variant[derivative.format] = stored_object.url
+
+        thumbnail_size = min(self.image_processor.sizes, key=self.image_processor.sizes.get)
+        derivatives = {
+            "width": rendered.width,
+            "height": rendered.height,
+            "variants": variants,
+            "thumbnail_url": variants[thumbnail_size]["webp"],
+            "public_ids": [stored_object.public_id for stored_object in stored]
+        }
+
+        if asset_key is not None:
+            registered = await self.asset_index.attach_derivatives(asset_key, derivatives)
+            if registered.get("public_ids") != derivatives["public_ids"]:
+                # Otra subida simultánea registró antes sus derivados: se usan esos
+                await self.delete_files([
+                    public_id for public_id in derivatives["public_ids"]
+                    if public_id not in registered.get("public_ids", [])
+                ])
+                return registered
+
+        return derivatives
+
+    async def delete_files(self, public_ids: List[str], resource_type: str = "image") -> None:
+        """Eliminar varios archivos ignorando los fallos individuales"""
+        async def delete(public_id: str) -> None:
+            try:
+                await self.delete_file(public_id, resource_type)
+            except StorageException:
+                logger.warning("No se pudo eliminar %s del almacenamiento", public_id)
+
+        await asyncio.gather(*(delete(public_id) for public_id in public_ids))
 
     async def upload_trip_photos(self, trip_id: str, files: list[UploadFile], user_id: str) -> Dict[str, Any]:
-        """Subir múltiples fotos de viaje"""
+        """Subir múltiples fotos de viaje en paralelo"""
         if len(files) > 10:
             raise InvalidFileTypeException("Máximo 10 archivos por subida")
 
-        uploaded_photos = []
-        failed_uploads = []
-
-        for file in files:
+        async def upload(file: UploadFile) -> Dict[str, Any]:
             try:
-                self._validate_image_file(file)
-                
-                file_content = await file.read()
-                
-                result = cloudinary.uploader.upload(
-                    file_content,
-                    folder=f"voyaj/trips/{trip_id}/photos",
-                    transformation=[
-                        {"width": 1200, "height": 800, "crop": "limit"},
-                        {"quality": "auto", "fetch_format": "auto"}
-                    ],
-                    use_filename=True,
-                    unique_filename=True
-                )
-                
-                uploaded_photos.append({
-                    "filename": file.filename,
-                    "url": result["secure_url"],
-                    "public_id": result["public_id"]
-                })
-                
+                # Sin deduplicar: aquí no se crea ningún registro que libere la referencia
+                return await self.upload_trip_photo(file, trip_id, user_id, dedup=False)
             except Exception as e:
-                failed_uploads.append({
-                    "filename": file.filename,
-                    "error": str(e)
-                })
+                return {"filename": file.filename, "error": str(e)}
+
+        results = await self.map_concurrently(files, upload)
+        uploaded_photos = [result for result in results if "error" not in result]
+        failed_uploads = [result for result in results if "error" in result]
 
         if not uploaded_photos and failed_uploads:
             raise UploadFailedException("No se pudo subir ninguna foto")
@@ -126,29 +304,167 @@ class UploadService:
             "total_failed": len(failed_uploads)
         }
 
+    async def map_concurrently(self, items: List[T], fn: Callable[[T], Awaitable[R]]) -> List[R]:
+        """Aplicar fn a cada elemento con el límite de subidas simultáneas por petición.
+
+        Los resultados conservan el orden de items; fn debe capturar sus
+        propios errores para que un archivo fallido no cancele a los demás.
+        """
+        limiter = asyncio.Semaphore(self.max_concurrent_per_request)
+
+        async def run(item: T) -> R:
+            async with limiter:
+                return await fn(item)
+
+        return list(await asyncio.gather(*(run(item) for item in items)))
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+        if self.image_processor is not None:
+            self.image_processor.shutdown(wait=wait)
+
     async def upload_document(self, folder: str, file: UploadFile, user_id: str) -> Dict[str, str]:
         """Subir documento a carpeta específica"""
         self._validate_document_file(file)
         
         try:
-            file_content = await file.read()
-            
-            result = cloudinary.uploader.upload(
-                file_content,
+            stored = await self._stream_upload(
+                file,
+                self.allowed_document_types,
+                self.max_document_size,
                 folder=f"voyaj/documents/{user_id}/{folder}",
                 resource_type="raw",
+                dedup_scope=self._scope_for(f"user:{user_id}:{folder}"),
                 use_filename=True,
                 unique_filename=True
             )
             
             return {
-                "url": result["secure_url"],
-                "public_id": result["public_id"],
-                "filename": file.filename
+                "url": stored.url,
+                "public_id": stored.public_id,
+                "filename": file.filename,
+                "reused": stored.reused
             }
             
+        except (FileTooLargeException, InvalidFileTypeException):
+            raise
         except Exception as e:
-            raise CloudinaryException(f"Error al subir documento: {str(e)}")
+            raise StorageException(f"Error al subir documento: {str(e)}")
+
+    async def _stream_upload(
+        self,
+        file: UploadFile,
+        allowed_types: Set[str],
+        max_size: int,
+        folder: str,
+        resource_type: str,
+        dedup_scope: Optional[str] = None,
+        **options: Any
+    ) -> StoredObject:
+        """Validar, hashear y subir el archivo por bloques en el pool de subidas.
+
+        Con dedup_scope e índice de archivos, si el contenido ya se subió en
+        ese ámbito no se sube otra vez: se devuelve el archivo existente.
+        """
+        detected_type, content_hash = await self._run_blocking(
+            self._inspect_sync, file.file, file.content_type, file.filename, allowed_types, max_size
+        )
+
+        asset_key = None
+        if self.asset_index is not None and dedup_scope is not None:
+            asset_key = AssetIndex.key(dedup_scope, resource_type, content_hash)
+            existing = await self.asset_index.acquire(asset_key)
+            if existing is not None:
+                return AssetIndex.to_stored_object(existing)
+
+        stored = await self._run_blocking(
+            self._put_sync,
+            file.file,
+            file.filename or "stream",
+            detected_type,
+            max_size,
+            folder,
+            resource_type,
+            options
+        )
+        stored.content_hash = content_hash
+
+        if asset_key is not None:
+            existing = await self.asset_index.record(asset_key, dedup_scope, stored)
+            if existing is not None:
+                # Otra subida simultánea del mismo contenido se registró antes: se usa la suya
+                if existing["public_id"] != stored.public_id:
+                    await self._run_blocking(self.storage.delete, stored.public_id, resource_type)
+                return AssetIndex.to_stored_object(existing)
+
+        return stored
+
+    def _inspect_sync(
+        self,
+        raw: BinaryIO,
+        declared_type: Optional[str],
+        filename: Optional[str],
+        allowed_types: Set[str],
+        max_size: int
+    ) -> Tuple[str, str]:
+        """Tipo real (por la firma del primer bloque) y SHA-256 del archivo en una sola pasada"""
+        raw.seek(0)
+        stream = self._limited_stream(raw, max_size, filename or "stream")
+        digest = hashlib.sha256()
+
+        first_chunk = stream.read(self.HASH_CHUNK_SIZE)
+        # La firma decide el tipo, no el Content-Type del cliente
+        detected_type = detect_content_type(first_chunk[:SIGNATURE_BYTES], declared_type)
+        if detected_type not in allowed_types:
+            raise InvalidFileTypeException("El contenido del archivo no corresponde a un tipo permitido")
+
+        chunk = first_chunk
+        while chunk:
+            digest.update(chunk)
+            chunk = stream.read(self.HASH_CHUNK_SIZE)
+
+        raw.seek(0)
+        return detected_type, digest.hexdigest()
+
+    def _put_sync(
+        self,
+        raw: BinaryIO,
+        name: str,
+        content_type: str,
+        max_size: int,
+        folder: str,
+        resource_type: str,
+        options: Dict[str, Any]
+    ) -> StoredObject:
+        raw.seek(0)
+        stream = self._limited_stream(raw, max_size, name)
+        return self.storage.put(stream, name, content_type, folder, resource_type, options)
+
+    @staticmethod
+    def _limited_stream(raw: BinaryIO, max_size: int, name: str) -> LimitedUploadStream:
+        return LimitedUploadStream(
+            raw,
+            max_size,
+            name,
+            lambda: FileTooLargeException(f"Archivo muy grande. Tamaño máximo: {max_size // (1024*1024)}MB")
+        )
+
+    def _scope_for(self, owner: str) -> str:
+        """Ámbito de deduplicación: el del dueño (viaje o usuario) o global"""
+        return "global" if self.dedup_scope == "global" else owner
+
+    @staticmethod
+    def _read_for_processing(raw: BinaryIO, max_size: int) -> bytes:
+        raw.seek(0)
+        data = raw.read(max_size + 1)
+        if len(data) > max_size:
+            raise FileTooLargeException(f"Archivo muy grande. Tamaño máximo: {max_size // (1024*1024)}MB")
+        return data
+
+    async def _run_blocking(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Ejecutar una llamada síncrona del SDK en el pool de subidas"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
 
     def _validate_image_file(self, file: UploadFile) -> None:
         """Validar archivo de imagen"""
@@ -169,8 +485,7 @@ class UploadService:
                 f"Tipo de archivo no permitido. Tipos permitidos: {', '.join(self.allowed_document_types)}"
             )
         
-        max_doc_size = 10 * 1024 * 1024  # 10MB para documentos
-        if file.size and file.size > max_doc_size:
+        if file.size and file.size > self.max_document_size:
             raise FileTooLargeException(
-                f"Archivo muy grande. Tamaño máximo: {max_doc_size // (1024*1024)}MB"
+                f"Archivo muy grande. Tamaño máximo: {self.max_document_size // (1024*1024)}MB"
             )
\ No newline at end of file
@@ -0,0 +1,146 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import IndexModel, ASCENDING, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from shared.database.Connection import DatabaseConnection
+from shared.errors.custom_errors import DatabaseError
+from .StorageBackend import StoredObject
+
+
+class AssetIndex:
+    """Índice de archivos subidos por hash de contenido (deduplicación).
+
+    Cada documento es un archivo guardado en el almacenamiento dentro de un
+    ámbito (un viaje, un usuario o "global"), identificado por
+    <ámbito>:<resource_type>:<sha256>. ref_count cuenta los registros que lo
+    usan: volver a subir el mismo contenido en el ámbito reutiliza el
+    public_id y suma una referencia, y el archivo solo se borra cuando ningún
+    documento lo referencia (ni como original ni como derivado).
+    """
+
+    COLLECTION_NAME = "upload_assets"
+    INDEXES = [
+        IndexModel([("public_id", ASCENDING)], name="public_id"),
+        IndexModel([("derivatives.public_ids", ASCENDING)], name="derivative_public_ids", sparse=True)
+    ]
+
+    def _get_collection(self) -> AsyncIOMotorCollection:
+        return DatabaseConnection.get_database()[self.COLLECTION_NAME]
+
+    @staticmethod
+    def key(scope: str, resource_type: str, content_hash: str) -> str:
+        return f"{scope}:{resource_type}:{content_hash}"
+
+    async def acquire(self, key: str) -> Optional[Dict[str, Any]]:
+        """Sumar una referencia a un archivo ya subido (None si no existe)"""
+        try:
+            return await self._get_collection().find_one_and_update(
+                {"_id": key},
+                {"$inc": {"ref_count": 1}, "$set": {"last_used_at": datetime.utcnow()}},
+                return_document=ReturnDocument.AFTER
+            )
+        except Exception as error:
+            raise DatabaseError(f"Error buscando archivo por contenido: {str(error)}")
+
+    async def record(self, key: str, scope: str, stored: StoredObject) -> Optional[Dict[str, Any]]:
+        """Registrar un archivo recién subido con una referencia.
+
+        Si otra subida del mismo contenido lo registró antes, suma la
+        referencia a ese documento y lo devuelve; si no, devuelve None.
+        """
+        now = datetime.utcnow()
+        document = {
+            "_id": key,
+            "scope": scope,
+            "content_hash": stored.content_hash,
+            "public_id": stored.public_id,
+            "url": stored.url,
+            "size": stored.size,
+            "content_type": stored.content_type,
+            "resource_type": stored.resource_type,
+            "ref_count": 1,
+            "created_at": now,
+            "last_used_at": now
+        }
+
+        try:
+            await self._get_collection().insert_one(document)
+            return None
+        except DuplicateKeyError:
+            return await self.acquire(key)
+        except Exception as error:
+            raise DatabaseError(f"Error registrando archivo: {str(error)}")
+
+    async def get_derivatives(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            document = await self._get_collection().find_one({"_id": key}, {"derivatives": 1})
+            return document.get("derivatives") if document else None
+        except Exception as error:
+            raise DatabaseError(f"Error obteniendo derivados: {str(error)}")
+
+    async def attach_derivatives(self, key: str, derivatives: Dict[str, Any]) -> Dict[str, Any]:
+        """Guardar los derivados del archivo salvo que ya tenga; devuelve los que quedan registrados"""
+        try:
+            document = await self._get_collection().find_one_and_update(
+                {"_id": key, "derivatives": {"$exists": False}},
+                {"$set": {"derivatives": derivatives}},
+                return_document=ReturnDocument.AFTER
+            )
+            if document is not None:
+                return document["derivatives"]
+
+            existing = await self.get_derivatives(key)
+            return existing or derivatives
+        except DatabaseError:
+            raise
+        except Exception as error:
+            raise DatabaseError(f"Error guardando derivados: {str(error)}")
+
+    async def release(self, scope: str, public_id: str) -> None:
+        """Quitar una referencia; el documento se elimina al llegar a cero"""
+        collection = self._get_collection()
+        try:
+            document = await collection.find_one_and_update(
+                {"scope": scope, "public_id": public_id, "ref_count": {"$gt": 0}},
+                {"$inc": {"ref_count": -1}},
+                return_document=ReturnDocument.AFTER
+            )
+            if document is not None and document["ref_count"] <= 0:
+                # Solo si nadie lo ha vuelto a adquirir entre medias
+                await collection.delete_one({"_id": document["_id"], "ref_count": {"$lte": 0}})
+        except Exception as error:
+            raise DatabaseError(f"Error liberando archivo: {str(error)}")
+
+    async def referenced(self, public_ids: List[str]) -> Set[str]:
+        """public_id que siguen en uso por algún archivo indexado (original o derivado)"""
+        if not public_ids:
+            return set()
+
+        try:
+            cursor = self._get_collection().find(
+                {"$or": [
+                    {"public_id": {"$in": public_ids}},
+                    {"derivatives.public_ids": {"$in": public_ids}}
+                ]},
+                {"public_id": 1, "derivatives.public_ids": 1}
+            )
+            in_use: Set[str] = set()
+            async for document in cursor:
+                in_use.add(document["public_id"])
+                in_use.update((document.get("derivatives") or {}).get("public_ids", []))
+            return in_use & set(public_ids)
+        except Exception as error:
+            raise DatabaseError(f"Error comprobando archivos en uso: {str(error)}")
+
+    @staticmethod
+    def to_stored_object(document: Dict[str, Any]) -> StoredObject:
+        return StoredObject(
+            public_id=document["public_id"],
+            url=document["url"],
+            size=document.get("size", 0),
+            content_type=document.get("content_type"),
+            resource_type=document.get("resource_type", "image"),
+            content_hash=document.get("content_hash"),
+            reused=True
+        )
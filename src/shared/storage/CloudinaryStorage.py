@@ -0,0 +1,81 @@
+import os
+import time
+import cloudinary
+import cloudinary.uploader
+import cloudinary.utils
+from typing import Any, BinaryIO, Dict, Optional
+from .StorageBackend import StorageBackend, StoredObject
+
+
+class CloudinaryStorage(StorageBackend):
+    """Almacenamiento en Cloudinary.
+
+    Los archivos se envían con upload_large por bloques de UPLOAD_CHUNK_SIZE
+    (Cloudinary exige al menos 5MB salvo en el último). Las opciones de put()
+    (transformation, public_id, overwrite...) se pasan tal cual a la API.
+    """
+
+    def __init__(self, chunk_size: Optional[int] = None, signed_url_ttl: Optional[int] = None):
+        cloudinary.config(
+            cloud_name=os.getenv("CLOUDINARY_CLOUD_NAME"),
+            api_key=os.getenv("CLOUDINARY_API_KEY"),
+            api_secret=os.getenv("CLOUDINARY_API_SECRET")
+        )
+        self.chunk_size = chunk_size or int(os.getenv("UPLOAD_CHUNK_SIZE", str(6 * 1024 * 1024)))
+        self.signed_url_ttl = signed_url_ttl or int(os.getenv("STORAGE_SIGNED_URL_TTL_SECONDS", "3600"))
+
+    def put(
+        self,
+        stream: BinaryIO,
+        filename: str,
+        content_type: Optional[str],
+        folder: str,
+        resource_type: str = "image",
+        options: Optional[Dict[str, Any]] = None
+    ) -> StoredObject:
+        result = cloudinary.uploader.upload_large(
+            stream,
+            filename=filename,
+            chunk_size=self.chunk_size,
+            folder=folder,
+            resource_type=resource_type,
+            **(options or {})
+        )
+        return StoredObject(
+            public_id=result["public_id"],
+            url=result["secure_url"],
+            size=result.get("bytes", 0),
+            content_type=content_type,
+            resource_type=result.get("resource_type", resource_type)
+        )
+
+    def delete(self, public_id: str, resource_type: str = "image") -> bool:
+        result = cloudinary.uploader.destroy(public_id, resource_type=resource_type)
+        return result.get("result") == "ok"
+
+    def url(self, public_id: str, resource_type: str = "image") -> str:
+        return cloudinary.utils.cloudinary_url(public_id, resource_type=resource_type, secure=True)[0]
+
+    def signed_url(self, public_id: str, resource_type: str = "image", expires_in: Optional[int] = None) -> str:
+        """URL de descarga firmada de la API de Cloudinary que caduca en expires_in segundos"""
+        expires_at = int(time.time()) + (expires_in or self.signed_url_ttl)
+        return cloudinary.utils.private_download_url(
+            public_id, "", resource_type=resource_type, expires_at=expires_at
+        )
+
+    def public_id_from_url(self, url: str) -> Optional[str]:
+        """Extraer public_id de una URL de Cloudinary"""
+        try:
+            # URL ejemplo: https://res.cloudinary.com/cloud_name/image/upload/v123456789/voyaj/profiles/user_id/profile_user_id.webp
+            parts = url.split('/')
+            if 'voyaj' in parts:
+                voyaj_index = parts.index('voyaj')
+                public_id_parts = parts[voyaj_index:]
+                public_id = '/'.join(public_id_parts)
+                # Remover extensión
+                if '.' in public_id:
+                    public_id = public_id.rsplit('.', 1)[0]
+                return public_id
+        except Exception:
+            pass
+        return None
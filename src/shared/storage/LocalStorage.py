@@ -0,0 +1,174 @@
+import hashlib
+import hmac
+import mimetypes
+import os
+import re
+import tempfile
+import time
+import uuid
+from typing import Any, BinaryIO, Dict, Optional, Tuple
+from .StorageBackend import StorageBackend, StoredObject
+
+_PUBLIC_ID_PATTERN = re.compile(r"^(?:[A-Za-z0-9_-]+/)*[A-Za-z0-9_-]+(\.[a-z0-9]{1,8})?$")
+_GENERATED_NAME_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+
+class LocalStorage(StorageBackend):
+    """Almacenamiento en disco.
+
+    Cada subida se guarda como objects/<folder>/<nombre>.<ext>: el public_id es
+    esa ruta relativa. Sin public_id en las opciones el nombre es aleatorio,
+    así que cada subida tiene su propio archivo y su URL nunca cambia de
+    contenido (se puede cachear como inmutable). Con public_id el archivo solo
+    se reemplaza si overwrite es verdadero, como en Cloudinary. La
+    deduplicación por contenido corresponde al AssetIndex, no al backend.
+    Las transformaciones de Cloudinary no se aplican; se guarda el original.
+
+    Los archivos se sirven desde STORAGE_PUBLIC_URL (GET /api/upload/files) con
+    FileResponse, que atiende peticiones Range y usa sendfile cuando el
+    servidor ASGI lo soporta. Las URLs firmadas llevan expires y signature
+    (HMAC-SHA256 con STORAGE_SIGNING_SECRET).
+    """
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        base_url: Optional[str] = None,
+        signing_secret: Optional[str] = None,
+        signed_url_ttl: Optional[int] = None
+    ):
+        self.root = os.path.abspath(root or os.getenv("STORAGE_LOCAL_ROOT", "storage"))
+        self.base_url = (base_url or os.getenv("STORAGE_PUBLIC_URL", "/api/upload/files")).rstrip("/")
+        secret = signing_secret or os.getenv(
+            "STORAGE_SIGNING_SECRET",
+            os.getenv("JWT_SECRET_KEY", "your-super-secret-key-change-this-in-production")
+        )
+        self._signing_key = secret.encode()
+        self.signed_url_ttl = signed_url_ttl or int(os.getenv("STORAGE_SIGNED_URL_TTL_SECONDS", "3600"))
+        self.require_signed = os.getenv("STORAGE_LOCAL_REQUIRE_SIGNED", "false").lower() in ("1", "true", "yes")
+        self.chunk_size = 1024 * 1024
+
+        self._objects_dir = os.path.join(self.root, "objects")
+        self._tmp_dir = os.path.join(self.root, "tmp")
+        os.makedirs(self._objects_dir, exist_ok=True)
+        os.makedirs(self._tmp_dir, exist_ok=True)
+
+    def put(
+        self,
+        stream: BinaryIO,
+        filename: str,
+        content_type: Optional[str],
+        folder: str,
+        resource_type: str = "image",
+        options: Optional[Dict[str, Any]] = None
+    ) -> StoredObject:
+        options = options or {}
+        public_id = self._public_id_for(folder, options.get("public_id"), content_type, filename)
+        path = os.path.join(self._objects_dir, public_id)
+
+        # Se escribe en un temporal y luego se mueve a su ruta definitiva, así
+        # nunca se sirve un archivo a medio escribir
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self._tmp_dir)
+        try:
+            with os.fdopen(fd, "wb") as target:
+                while True:
+                    chunk = stream.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    target.write(chunk)
+                    size += len(chunk)
+
+            if os.path.exists(path) and not options.get("overwrite", False):
+                # Mismo public_id sin overwrite: se conserva el archivo existente
+                os.remove(tmp_path)
+                size = os.path.getsize(path)
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        return StoredObject(
+            public_id=public_id,
+            url=self.url(public_id, resource_type),
+            size=size,
+            content_type=content_type,
+            resource_type=resource_type
+        )
+
+    def delete(self, public_id: str, resource_type: str = "image") -> bool:
+        path = self.resolve_path(public_id)
+        if path is None:
+            return False
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def url(self, public_id: str, resource_type: str = "image") -> str:
+        return f"{self.base_url}/{public_id}"
+
+    def signed_url(self, public_id: str, resource_type: str = "image", expires_in: Optional[int] = None) -> str:
+        expires = int(time.time()) + (expires_in or self.signed_url_ttl)
+        return f"{self.url(public_id)}?expires={expires}&signature={self._sign(public_id, expires)}"
+
+    def public_id_from_url(self, url: str) -> Optional[str]:
+        path = url.split("?", 1)[0]
+        prefix = f"{self.base_url}/"
+        if prefix in path:
+            public_id = path.split(prefix, 1)[1]
+            if _PUBLIC_ID_PATTERN.match(public_id):
+                return public_id
+        return None
+
+    def verify_signature(self, public_id: str, expires: Optional[int], signature: Optional[str]) -> bool:
+        """Comprobar la firma de una URL firmada (sin firma solo vale si no se exige)"""
+        if expires is None and signature is None:
+            return not self.require_signed
+        if expires is None or signature is None or expires < time.time():
+            return False
+        return hmac.compare_digest(self._sign(public_id, expires), signature)
+
+    def resolve_path(self, public_id: str) -> Optional[str]:
+        """Ruta en disco de un public_id válido, sin permitir salir del directorio de objetos"""
+        if not _PUBLIC_ID_PATTERN.match(public_id):
+            return None
+        return os.path.join(self._objects_dir, public_id)
+
+    @staticmethod
+    def is_immutable(public_id: str) -> bool:
+        """True si el public_id tiene nombre aleatorio (su contenido nunca cambia)"""
+        name = os.path.splitext(public_id.rsplit("/", 1)[-1])[0]
+        return bool(_GENERATED_NAME_PATTERN.match(name))
+
+    def stat(self, public_id: str) -> Optional[Tuple[str, os.stat_result]]:
+        path = self.resolve_path(public_id)
+        if path is None:
+            return None
+        try:
+            return path, os.stat(path)
+        except FileNotFoundError:
+            return None
+
+    def _sign(self, public_id: str, expires: int) -> str:
+        return hmac.new(self._signing_key, f"{public_id}:{expires}".encode(), hashlib.sha256).hexdigest()
+
+    @staticmethod
+    def _public_id_for(folder: str, name: Optional[str], content_type: Optional[str], filename: str) -> str:
+        extension = mimetypes.guess_extension(content_type) if content_type else None
+        if not extension:
+            extension = os.path.splitext(filename or "")[1].lower()
+        if not re.fullmatch(r"\.[a-z0-9]{1,8}", extension or ""):
+            extension = ""
+
+        # Cada segmento queda limitado a [A-Za-z0-9_-] para no salir de objects/
+        segments = [
+            re.sub(r"[^A-Za-z0-9_-]", "_", segment)
+            for segment in f"{folder}/{name or uuid.uuid4().hex}".split("/")
+            if segment and segment not in (".", "..")
+        ]
+        return "/".join(segments) + extension
@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Dict, Optional
+
+
+@dataclass
+class StoredObject:
+    """Archivo guardado en un backend de almacenamiento"""
+    public_id: str
+    url: str
+    size: int
+    content_type: Optional[str] = None
+    resource_type: str = "image"
+    content_hash: Optional[str] = None
+    # True si no se subió: se reutilizó un archivo con el mismo contenido
+    reused: bool = False
+
+
+class StorageBackend(ABC):
+    """Almacenamiento de archivos subidos.
+
+    Las operaciones son síncronas: UploadService las ejecuta en su pool de
+    hilos. put() recibe un stream que ya valida tamaño y tipo mientras se lee.
+    """
+
+    @abstractmethod
+    def put(
+        self,
+        stream: BinaryIO,
+        filename: str,
+        content_type: Optional[str],
+        folder: str,
+        resource_type: str = "image",
+        options: Optional[Dict[str, Any]] = None
+    ) -> StoredObject:
+        pass
+
+    @abstractmethod
+    def delete(self, public_id: str, resource_type: str = "image") -> bool:
+        pass
+
+    @abstractmethod
+    def url(self, public_id: str, resource_type: str = "image") -> str:
+        pass
+
+    @abstractmethod
+    def signed_url(self, public_id: str, resource_type: str = "image", expires_in: Optional[int] = None) -> str:
+        pass
+
+    @abstractmethod
+    def public_id_from_url(self, url: str) -> Optional[str]:
+        pass
@@ -0,0 +1,81 @@
+import functools
+import inspect
+from decimal import Decimal
+from typing import Any, Callable
+import orjson
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def json_default(value: Any) -> Any:
+    """Tipos que orjson no serializa de forma nativa.
+
+    dataclasses (SuccessResponse, PaginatedResponse, DTOs), datetime, date,
+    Enum y UUID los resuelve orjson directamente; aquí se convierten al mismo
+    valor que produciría jsonable_encoder.
+    """
+    if isinstance(value, Decimal):
+        # Igual que jsonable_encoder: entero si no tiene decimales
+        return int(value) if value.as_tuple().exponent >= 0 else float(value)
+    if isinstance(value, BaseModel):
+        # Respeta json_encoders de cada DTO (p. ej. Decimal como texto en gastos)
+        return value.model_dump(mode="json")
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return jsonable_encoder(value)
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=json_default, option=ORJSON_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """Respuesta JSON serializada con orjson"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class FastJSONRoute(APIRoute):
+    """Ruta que serializa el resultado del endpoint directamente con orjson.
+
+    Sin response_model FastAPI pasa todo resultado por jsonable_encoder antes
+    de la clase de respuesta, recorriendo cada objeto en Python. Esta ruta
+    envuelve el endpoint para que devuelva ya un FastJSONResponse y se salte
+    ese paso. Las rutas con response_model, los endpoints síncronos y los
+    generadores siguen el camino normal de FastAPI.
+
+    Las cabeceras que una dependencia fije en el parámetro Response no se
+    copian a la respuesta (ningún endpoint del proyecto lo usa).
+    """
+
+    def get_route_handler(self) -> Callable:
+        endpoint = self.dependant.call
+        if (
+            self.response_model is None
+            and inspect.iscoroutinefunction(endpoint)
+            and not getattr(endpoint, "_renders_fast_json", False)
+        ):
+            self.dependant.call = self._render_with_orjson(endpoint, self.status_code)
+        return super().get_route_handler()
+
+    @staticmethod
+    def _render_with_orjson(endpoint: Callable, status_code: Any) -> Callable:
+        @functools.wraps(endpoint)
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            result = await endpoint(*args, **kwargs)
+            if isinstance(result, Response):
+                return result
+            return FastJSONResponse(result, status_code=status_code or 200)
+
+        call._renders_fast_json = True
+        return call
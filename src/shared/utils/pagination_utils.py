@@ -1,6 +1,11 @@
+import base64
+import json
+import time
 from dataclasses import dataclass
-from typing import List, TypeVar, Generic
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar, Generic
 from math import ceil
+from shared.errors.custom_errors import ValidationError
 
 T = TypeVar('T')
 
@@ -9,17 +14,27 @@ T = TypeVar('T')
 class PaginatedResponse(Generic[T]):
     """Respuesta paginada genérica"""
     data: List[T]
-    total: int
+    total: Optional[int]
     page: int
     limit: int
     total_pages: int
-    has_next: bool = False
+    has_next: Optional[bool] = None
     has_prev: bool = False
+    cursor: Optional[str] = None
+    next_cursor: Optional[str] = None
 
     def __post_init__(self):
-        self.total_pages = ceil(self.total / self.limit) if self.limit > 0 else 0
-        self.has_next = self.page < self.total_pages
-        self.has_prev = self.page > 1
+        # total es None cuando se pidió count=none
+        self.total_pages = ceil(self.total / self.limit) if self.total and self.limit > 0 else 0
+
+        if self.has_next is None:
+            # Sin has_next explícito (limit+1) se deriva del cursor o del total
+            if self.cursor is not None:
+                self.has_next = self.next_cursor is not None
+            else:
+                self.has_next = self.page < self.total_pages
+
+        self.has_prev = self.cursor is not None or self.page > 1
 
 
 class PaginationUtils:
@@ -29,6 +44,19 @@ class PaginationUtils:
     DEFAULT_LIMIT = 20
     MAX_LIMIT = 100
 
+    # Estrategias de total: exacto (cacheado), estimado o sin total
+    COUNT_EXACT = "exact"
+    COUNT_ESTIMATE = "estimate"
+    COUNT_NONE = "none"
+    COUNT_MODES = (COUNT_EXACT, COUNT_ESTIMATE, COUNT_NONE)
+
+    COUNT_CACHE_TTL_SECONDS = 30
+    COUNT_CACHE_MAX_ENTRIES = 1000
+    ESTIMATE_COUNT_CAP = 1000
+
+    # clave normalizada -> (expira_en, total)
+    _count_cache: Dict[str, Tuple[float, int]] = {}
+
     @staticmethod
     def validate_pagination(page: int, limit: int) -> tuple[int, int]:
         """Validar y normalizar parámetros de paginación"""
@@ -63,4 +91,151 @@ class PaginationUtils:
             page=page,
             limit=limit,
             total_pages=ceil(total / limit) if limit > 0 else 0
-        )
\ No newline at end of file
+        )
+
+    @staticmethod
+    def encode_cursor(sort_value: Any, tiebreaker: Any) -> str:
+        """Codificar cursor opaco a partir de la clave de orden y el desempate"""
+        if isinstance(sort_value, datetime):
+            value = {"t": "dt", "v": sort_value.isoformat()}
+        else:
+            value = {"t": "raw", "v": sort_value}
+
+        payload = json.dumps({"s": value, "id": str(tiebreaker)}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[Any, str]:
+        """Decodificar cursor opaco; lanza ValidationError si es inválido"""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            value = payload["s"]
+            sort_value = datetime.fromisoformat(value["v"]) if value["t"] == "dt" else value["v"]
+            return sort_value, payload["id"]
+        except Exception:
+            raise ValidationError("Cursor de paginación inválido")
+
+    @staticmethod
+    def build_keyset_filter(
+        sort_field: str,
+        direction: int,
+        cursor: Optional[str],
+        tiebreaker: str = "_id"
+    ) -> Optional[Dict[str, Any]]:
+        """Construir filtro de keyset (documentos posteriores al cursor en el orden dado)"""
+        if not cursor:
+            return None
+
+        sort_value, last_id = PaginationUtils.decode_cursor(cursor)
+        operator = "$lt" if direction < 0 else "$gt"
+
+        return {
+            "$or": [
+                {sort_field: {operator: sort_value}},
+                {sort_field: sort_value, tiebreaker: {operator: last_id}}
+            ]
+        }
+
+    @staticmethod
+    def build_next_cursor(
+        items: List[Any],
+        sort_attribute: str,
+        has_next: bool,
+        id_attribute: str = "id"
+    ) -> Optional[str]:
+        """Cursor de la siguiente página (None si no hay más resultados)"""
+        if not items or not has_next:
+            return None
+
+        last = items[-1]
+        return PaginationUtils.encode_cursor(
+            getattr(last, sort_attribute),
+            getattr(last, id_attribute)
+        )
+
+    @staticmethod
+    def validate_count_mode(count_mode: Optional[str]) -> str:
+        """Validar modo de conteo (exact | estimate | none)"""
+        if not count_mode:
+            return PaginationUtils.COUNT_EXACT
+
+        if count_mode not in PaginationUtils.COUNT_MODES:
+            raise ValidationError(
+                f"Modo de conteo inválido. Opciones: {', '.join(PaginationUtils.COUNT_MODES)}"
+            )
+
+        return count_mode
+
+    @staticmethod
+    def split_page(documents: List[T], limit: int) -> Tuple[List[T], bool]:
+        """Separar la página del elemento extra pedido con limit+1"""
+        return documents[:limit], len(documents) > limit
+
+    @classmethod
+    async def resolve_total(
+        cls,
+        scope: str,
+        query: Any,
+        count_fn: Callable[[Optional[int]], Awaitable[int]],
+        count_mode: str = COUNT_EXACT
+    ) -> Optional[int]:
+        """Obtener el total según el modo de conteo.
+
+        count_fn recibe un tope opcional de documentos a contar. Los totales
+        exactos se cachean COUNT_CACHE_TTL_SECONDS por consulta normalizada; el
+        modo estimado reutiliza un total cacheado aunque haya expirado o cuenta
+        como máximo ESTIMATE_COUNT_CAP documentos.
+        """
+        if count_mode == cls.COUNT_NONE:
+            return None
+
+        key = cls._count_cache_key(scope, query)
+        cached = cls._count_cache.get(key)
+        now = time.monotonic()
+
+        if cached and (cached[0] > now or count_mode == cls.COUNT_ESTIMATE):
+            return cached[1]
+
+        if count_mode == cls.COUNT_ESTIMATE:
+            return await count_fn(cls.ESTIMATE_COUNT_CAP)
+
+        total = await count_fn(None)
+        cls._store_count(key, total, now)
+        return total
+
+    @classmethod
+    async def count_documents(
+        cls,
+        collection: Any,
+        query: Dict[str, Any],
+        count_mode: str = COUNT_EXACT
+    ) -> Optional[int]:
+        """resolve_total para una colección Motor y un filtro find()"""
+        async def count(cap: Optional[int]) -> int:
+            if cap:
+                return await collection.count_documents(query, limit=cap)
+            return await collection.count_documents(query)
+
+        return await cls.resolve_total(collection.full_name, query, count, count_mode)
+
+    @classmethod
+    def clear_count_cache(cls) -> None:
+        """Vaciar la caché de totales"""
+        cls._count_cache.clear()
+
+    @staticmethod
+    def _count_cache_key(scope: str, query: Any) -> str:
+        """Normalizar la consulta (orden de claves estable) para usarla como clave"""
+        return f"{scope}:{json.dumps(query, sort_keys=True, default=str)}"
+
+    @classmethod
+    def _store_count(cls, key: str, total: int, now: float) -> None:
+        cache = cls._count_cache
+        cache.pop(key, None)
+
+        if len(cache) >= cls.COUNT_CACHE_MAX_ENTRIES:
+            # Las entradas se insertan en orden: la primera es la más antigua
+            cache.pop(next(iter(cache)))
+
+        cache[key] = (now + cls.COUNT_CACHE_TTL_SECONDS, total)
@@ -0,0 +1,93 @@
+import threading
+import time
+from contextvars import ContextVar, Token
+from typing import Any, Dict, Optional, Tuple
+from pymongo import monitoring
+
+
+class RequestTimings:
+    """Tiempos acumulados de una petición HTTP.
+
+    El tiempo de base de datos lo suman los comandos de MongoDB (que Motor
+    ejecuta en hilos con una copia del contexto de la petición) y el de
+    eventos el tiempo pasado dentro de EventBus.publish().
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.db_seconds = 0.0
+        self.db_commands = 0
+        self.events_seconds = 0.0
+        self.events_published = 0
+        self._lock = threading.Lock()
+
+    def add_db(self, seconds: float) -> None:
+        with self._lock:
+            self.db_seconds += seconds
+            self.db_commands += 1
+
+    def add_events(self, seconds: float) -> None:
+        with self._lock:
+            self.events_seconds += seconds
+            self.events_published += 1
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    def server_timing(self) -> str:
+        """Valor de la cabecera Server-Timing"""
+        return (
+            f"total;dur={self.elapsed() * 1000:.1f}, "
+            f"db;dur={self.db_seconds * 1000:.1f};desc=\"{self.db_commands} comandos\", "
+            f"events;dur={self.events_seconds * 1000:.1f};desc=\"{self.events_published} eventos\""
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "duration_ms": round(self.elapsed() * 1000, 3),
+            "db_ms": round(self.db_seconds * 1000, 3),
+            "db_commands": self.db_commands,
+            "events_ms": round(self.events_seconds * 1000, 3),
+            "events_published": self.events_published
+        }
+
+
+_current_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+def begin_request() -> Tuple[RequestTimings, Token]:
+    timings = RequestTimings()
+    return timings, _current_timings.set(timings)
+
+
+def end_request(token: Token) -> None:
+    _current_timings.reset(token)
+
+
+def current_timings() -> Optional[RequestTimings]:
+    return _current_timings.get()
+
+
+def record_events(seconds: float) -> None:
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.add_events(seconds)
+
+
+class DatabaseTimingListener(monitoring.CommandListener):
+    """Suma la duración de cada comando de MongoDB a la petición que lo lanzó"""
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        pass
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._record(event.duration_micros)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._record(event.duration_micros)
+
+    @staticmethod
+    def _record(duration_micros: int) -> None:
+        timings = _current_timings.get()
+        if timings is not None:
+            timings.add_db(duration_micros / 1_000_000)
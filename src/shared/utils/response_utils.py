@@ -36,23 +36,31 @@ class ErrorResponse:
 class PaginatedResponse(Generic[T]):
     """Respuesta paginada"""
     data: List[T]
-    total: int
+    total: Optional[int]
     page: int
     limit: int
     total_pages: int
-    has_next: bool = False
+    has_next: Optional[bool] = None
     has_prev: bool = False
     success: bool = True
     timestamp: datetime = None
+    cursor: Optional[str] = None
+    next_cursor: Optional[str] = None
 
     def __post_init__(self):
         if self.timestamp is None:
             self.timestamp = datetime.utcnow()
         
         from math import ceil
-        self.total_pages = ceil(self.total / self.limit) if self.limit > 0 else 0
-        self.has_next = self.page < self.total_pages
-        self.has_prev = self.page > 1
+        self.total_pages = ceil(self.total / self.limit) if self.total and self.limit > 0 else 0
+
+        if self.has_next is None:
+            if self.cursor is not None:
+                self.has_next = self.next_cursor is not None
+            else:
+                self.has_next = self.page < self.total_pages
+
+        self.has_prev = self.cursor is not None or self.page > 1
 
 
 class ResponseUtils:
@@ -0,0 +1,81 @@
+import os
+from typing import BinaryIO, Callable, Optional
+
+# Bytes iniciales que se leen para reconocer el tipo real del archivo
+SIGNATURE_BYTES = 64
+
+_DOCX_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+def detect_content_type(header: bytes, declared_type: Optional[str] = None) -> Optional[str]:
+    """Tipo MIME según la firma (magic bytes) del inicio del archivo, o None si no se reconoce.
+
+    Para los formatos sin firma propia (texto, contenedores ZIP/OLE de
+    Office) se usa el tipo declarado como desempate.
+    """
+    if header.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if header.startswith((b"GIF87a", b"GIF89a")):
+        return "image/gif"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp"
+    if header.startswith(b"%PDF-"):
+        return "application/pdf"
+    if header.startswith(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"):
+        return "application/msword"
+    if header.startswith(b"PK\x03\x04") and declared_type == _DOCX_TYPE:
+        return _DOCX_TYPE
+    if declared_type == "text/plain" and header and b"\x00" not in header:
+        return "text/plain"
+    return None
+
+
+class LimitedUploadStream:
+    """Vista de solo lectura de un archivo subido que corta al superar max_size.
+
+    read() nunca devuelve más de max_size + 1 bytes en total, así que la
+    memoria que retiene quien lee está acotada aunque pida bloques mayores.
+    El archivo subyacente no se cierra al salir del with (es del UploadFile).
+    """
+
+    def __init__(
+        self,
+        raw: BinaryIO,
+        max_size: int,
+        name: str,
+        on_too_large: Callable[[], Exception]
+    ):
+        self._raw = raw
+        self._max_size = max_size
+        self._on_too_large = on_too_large
+        self._consumed = 0
+        self.name = name
+
+    @property
+    def bytes_read(self) -> int:
+        return self._consumed
+
+    def read(self, size: int = -1) -> bytes:
+        remaining = self._max_size + 1 - self._consumed
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+
+        chunk = self._raw.read(size) if size > 0 else b""
+        self._consumed += len(chunk)
+        if self._consumed > self._max_size:
+            raise self._on_too_large()
+        return chunk
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        return self._raw.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._raw.tell()
+
+    def __enter__(self) -> "LimitedUploadStream":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass